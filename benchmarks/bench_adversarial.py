@@ -0,0 +1,93 @@
+"""
+Measure the worst-case parse time on adversarial version strings.
+
+Each input is parsed with the default regex, with the linear-time scanner
+(``LINEAR_PARSING``), and with limits (``MAX_LENGTH`` and friends), which
+reject long inputs before any matching. With ``--fuzz N`` the script also
+parses N random strings and reports the slowest ones.
+"""
+
+import argparse
+import random
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from common import bench
+
+from semver import Version
+
+
+class LinearVersion(Version):
+    LINEAR_PARSING = True
+
+
+class LimitedVersion(Version):
+    MAX_LENGTH = 256
+    MAX_IDENTIFIERS = 32
+    MAX_DIGITS = 20
+
+
+CLASSES = {"regex": Version, "linear": LinearVersion, "limited": LimitedVersion}
+
+
+def adversarial_inputs(size: int) -> Dict[str, str]:
+    """Return strings which are expensive for a backtracking matcher."""
+    return {
+        "digits": "1" * size,
+        "digits, invalid end": "1.2.3-" + "1" * size + "!",
+        "hyphens": "1.2.3-" + "-" * size,
+        "dotted zeros, invalid end": "1.2.3-" + "0." * (size // 2) + "00",
+        "alternating, invalid end": "1.2.3-" + "a1" * (size // 2) + "+",
+        "build dots, invalid end": "1.2.3+" + "a." * (size // 2),
+        "unicode digits": "1.2.3-" + "٢" * size + "!",
+    }
+
+
+def make_parse(cls: type, version: str) -> Callable[[], None]:
+    """Return a function which parses *version*, valid or not."""
+
+    def parse() -> None:
+        try:
+            cls.parse(version)
+        except ValueError:
+            pass
+
+    return parse
+
+
+def parse_time(cls: type, version: str) -> float:
+    """Return the best time in seconds of one parse."""
+    return min(timeit.repeat(make_parse(cls, version), number=1, repeat=3))
+
+
+def fuzz(count: int, seed: int = 42) -> List[Tuple[float, str, str]]:
+    """Parse random strings and return the slowest ones for each class."""
+    rnd = random.Random(seed)
+    alphabet = "0123456789.-+aZ٢\n"
+    slowest: List[Tuple[float, str, str]] = []
+    for _ in range(count):
+        length = rnd.choice([8, 64, 512, 4096])
+        version = "".join(rnd.choice(alphabet) for _ in range(length))
+        for name, cls in CLASSES.items():
+            slowest.append((parse_time(cls, version), name, version))
+        slowest = sorted(slowest, reverse=True)[:5]
+    return slowest
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--fuzz", type=int, default=0, metavar="N", help="Parse N random strings"
+    )
+    args = parser.parse_args(argv)
+
+    for size in (1_000, 10_000, 100_000):
+        for label, version in adversarial_inputs(size).items():
+            for name, cls in CLASSES.items():
+                bench(f"{name}: {label} ({size})", make_parse(cls, version), repeat=3)
+    for seconds, name, version in fuzz(args.fuzz):
+        print(f"{seconds * 1e6:12.3f} µs  {name}: {version[:40]!r}...")
+
+
+if __name__ == "__main__":
+    main()
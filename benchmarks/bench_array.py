@@ -0,0 +1,51 @@
+"""Compare memory and sort time of VersionArray and a list of Versions."""
+
+import random
+import tracemalloc
+
+from common import bench
+
+from semver import Version, VersionArray
+
+COUNT = 1_000_000
+rnd = random.Random(42)
+STRINGS = [
+    "%d.%d.%d%s"
+    % (
+        rnd.randint(0, 30),
+        rnd.randint(0, 30),
+        rnd.randint(0, 100),
+        rnd.choice(["", "", "", "-rc.1", "-beta.2", "-alpha"]),
+    )
+    for _ in range(COUNT)
+]
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: {size / 2**20:.1f} MiB")
+    return result
+
+
+def main() -> None:
+    versions = measure(
+        f"list of {COUNT:,} Versions", lambda: [Version.parse(s) for s in STRINGS]
+    )
+    array = measure(
+        f"VersionArray of {COUNT:,} versions", lambda: VersionArray(versions)
+    )
+    print(f"VersionArray.tobytes(): {len(array.tobytes()) / 2**20:.1f} MiB")
+    bench(
+        "sorted(list, key=precedence_key)",
+        lambda: sorted(versions, key=lambda v: v.precedence_key),
+        repeat=1,
+    )
+    bench("VersionArray.argsort()", array.argsort, repeat=1)
+    bench("VersionArray.sort()", array.sort, repeat=1)
+
+
+if __name__ == "__main__":
+    main()
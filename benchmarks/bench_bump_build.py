@@ -0,0 +1,36 @@
+"""Measure Version.bump_build on long and pathological build strings."""
+
+import re
+
+from common import bench
+
+from semver import Version
+
+#: The former, backtracking regex of Version._increment_string
+OLD_LAST_NUMBER = re.compile(r"(?:[^\d]*(\d+)[^\d]*)+")
+
+BUILDS = {
+    "short": "build.42",
+    "10k without digits": "-" * 10_000,
+    "10k alternating": "a1" * 5_000,
+    "10k alternating dots": ".-" * 5_000,
+    "10k digits, then letters": "1" * 5_000 + "a" * 5_000,
+    "100k without digits": "-" * 100_000,
+}
+
+
+def main() -> None:
+    for label, build in BUILDS.items():
+        version = Version(1, 2, 3, build=build)
+        bench(f"bump_build: {label}", version.bump_build, 10)
+        if len(build) <= 10_000:
+            bench(
+                f"  old regex search: {label}",
+                lambda: OLD_LAST_NUMBER.search(build),
+                1,
+                repeat=1,
+            )
+
+
+if __name__ == "__main__":
+    main()
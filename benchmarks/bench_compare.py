@@ -0,0 +1,40 @@
+"""Benchmark comparing and sorting versions."""
+
+import random
+from functools import cmp_to_key
+
+from common import bench
+
+from semver import Version
+
+rnd = random.Random(42)
+PARTS = [
+    (
+        rnd.randint(0, 5),
+        rnd.randint(0, 20),
+        rnd.randint(0, 50),
+        rnd.choice([None, "alpha", "alpha.1", "beta.2", "beta.11", "rc.1"]),
+    )
+    for _ in range(1_000_000)
+]
+
+
+def main() -> None:
+    left, right = Version.parse("1.2.3-rc.1"), Version.parse("1.2.3-rc.2")
+    bench("left.compare(right)", lambda: left.compare(right), number=100_000)
+    bench("left < right", lambda: left < right, number=100_000)
+    bench("left < '1.2.3-rc.2'", lambda: left < "1.2.3-rc.2", number=100_000)
+    bench("hash(version)", lambda: hash(left), number=100_000)
+
+    versions = [Version(*parts) for parts in PARTS]
+    sorted(versions)  # compute and cache the precedence keys
+    bench(
+        "sorted() of 1M versions through compare()",
+        lambda: sorted(versions, key=cmp_to_key(Version.compare)),
+        repeat=1,
+    )
+    bench("sorted() of 1M versions", lambda: sorted(versions), repeat=1)
+
+
+if __name__ == "__main__":
+    main()
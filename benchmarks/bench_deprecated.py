@@ -0,0 +1,37 @@
+"""Compare calls of a deprecated function with calls of the original."""
+
+import warnings
+
+from common import bench
+
+from semver import Version
+from semver._deprecated import deprecated
+
+
+def compare(ver1: str, ver2: str) -> int:
+    return Version.parse(ver1).compare(ver2)
+
+
+def noop() -> None:
+    pass
+
+
+def main() -> None:
+    wrapped_compare = deprecated(compare, version="3.0.0")
+    wrapped_noop = deprecated(noop, version="3.0.0")
+    for action in ("ignore", "default"):
+        with warnings.catch_warnings():
+            warnings.simplefilter(action)
+            print(f"Warning filter {action!r}:")
+            bench("  noop()", noop, 100_000)
+            bench("  deprecated noop()", wrapped_noop, 100_000)
+            bench("  compare()", lambda: compare("1.2.3", "1.2.4"), 100_000)
+            bench(
+                "  deprecated compare()",
+                lambda: wrapped_compare("1.2.3", "1.2.4"),
+                100_000,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Benchmark VersionIndex queries against scanning a list."""
+
+import random
+
+from common import bench
+
+from semver import Version, VersionIndex
+
+rnd = random.Random(42)
+VERSIONS = [
+    Version(rnd.randint(0, 30), rnd.randint(0, 30), rnd.randint(0, 100))
+    for _ in range(100_000)
+]
+
+
+def main() -> None:
+    bench("build index of 100k versions", lambda: VersionIndex(VERSIONS), repeat=1)
+    index = VersionIndex(VERSIONS)
+    bench(
+        "max_satisfying('^12.3') with index",
+        lambda: index.max_satisfying("^12.3"),
+        1_000,
+    )
+    bench(
+        "max() over Version.match() scan",
+        lambda: max(
+            (v for v in VERSIONS if v.match(">=12.3.0") and v.match("<13.0.0")),
+            default=None,
+        ),
+        repeat=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
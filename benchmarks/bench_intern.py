@@ -0,0 +1,48 @@
+"""Compare memory and parse time with and without interning versions."""
+
+import random
+import tracemalloc
+
+from common import bench
+
+from semver import Version, intern_pool
+
+COUNT = 200_000
+rnd = random.Random(42)
+#: Many references to few distinct versions, like in a dependency graph
+STRINGS = [
+    "%d.%d.%d%s"
+    % (
+        rnd.randint(0, 5),
+        rnd.randint(0, 5),
+        rnd.randint(0, 10),
+        rnd.choice(["", "", "-rc.1", "-beta.2+build.7"]),
+    )
+    for _ in range(COUNT)
+]
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: {size / 2**20:.1f} MiB")
+    return result
+
+
+def main() -> None:
+    plain = measure(f"{COUNT:,} Versions", lambda: [Version.parse(s) for s in STRINGS])
+    interned = measure(
+        f"{COUNT:,} interned Versions",
+        lambda: [Version.parse(s).intern() for s in STRINGS],
+    )
+    print(f"distinct versions: {len(intern_pool):,}")
+    strings = STRINGS[:10_000]
+    bench("parse", lambda: [Version.parse(s) for s in strings])
+    bench("parse + intern", lambda: [Version.parse(s).intern() for s in strings])
+    del plain, interned
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Benchmark Version.match and compiled match expressions."""
+
+from common import bench
+
+import semver
+from semver import Version
+
+
+def main() -> None:
+    version = Version.parse("2.3.4-rc.1")
+    predicate = semver.compile_match(">=2.0.0")
+    bench("version.match('>=2.0.0')", lambda: version.match(">=2.0.0"), 100_000)
+    bench("compiled predicate(version)", lambda: predicate(version), 100_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Benchmark Version.parse with and without the regex-free fast path."""
+
+from common import bench
+
+from semver import Version
+
+PLAIN = [f"{i % 20}.{i % 13}.{i}" for i in range(1000)]
+
+
+def parse_with_regex(version: str) -> Version:
+    # The old code path: always run the full regex
+    parts = Version._REGEX.match(version).groupdict()  # type: ignore
+    return Version(**parts)
+
+
+def main() -> None:
+    regex = bench(
+        "parse 1000 plain versions (regex only)",
+        lambda: [parse_with_regex(v) for v in PLAIN],
+    )
+    fast = bench(
+        "parse 1000 plain versions (Version.parse)",
+        lambda: [Version.parse(v) for v in PLAIN],
+    )
+    print(f"speedup: {regex / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare pickle size and round-trip time of many versions."""
+
+import pickle
+import random
+
+from common import bench
+
+from semver import Version
+
+
+class SlotPickledVersion(Version):
+    """Uses the default pickle support for objects with slots."""
+
+    __slots__ = ()
+    __reduce__ = object.__reduce__
+
+
+COUNT = 1_000_000
+rnd = random.Random(42)
+PARTS = [
+    (
+        rnd.randint(0, 30),
+        rnd.randint(0, 30),
+        rnd.randint(0, 100),
+        rnd.choice([None, None, None, "rc.1", "beta.2"]),
+    )
+    for _ in range(COUNT)
+]
+VERSIONS = [Version(*parts) for parts in PARTS]
+SLOT_PICKLED = [SlotPickledVersion(*parts) for parts in PARTS]
+
+
+def main() -> None:
+    for label, versions in [
+        ("default slot pickling", SLOT_PICKLED),
+        ("Version.__reduce__", VERSIONS),
+    ]:
+        data = pickle.dumps(versions, pickle.HIGHEST_PROTOCOL)
+        print(f"{label}: {len(data) / 2**20:.1f} MiB for {COUNT:,} versions")
+        bench(
+            f"{label} round-trip",
+            lambda: pickle.loads(pickle.dumps(versions, pickle.HIGHEST_PROTOCOL)),
+            repeat=1,
+        )
+    data = Version.dumps_many(VERSIONS)
+    print(f"Version.dumps_many: {len(data) / 2**20:.1f} MiB for {COUNT:,} versions")
+    bench(
+        "Version.dumps_many/loads_many round-trip",
+        lambda: Version.loads_many(Version.dumps_many(VERSIONS)),
+        repeat=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
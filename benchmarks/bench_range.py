@@ -0,0 +1,31 @@
+"""Benchmark range membership tests."""
+
+from common import bench
+
+import semver
+from semver import Range, Version
+
+EXPRESSION = "^1.2.3 || ~2.4 || >=3.1.0 <3.5.0 || 4.x || 5.0.0 - 5.2.0"
+
+
+def main() -> None:
+    version = Version.parse("4.7.1")
+    bench("compile the range", lambda: Range(EXPRESSION), 1_000)
+    rng = Range(EXPRESSION)
+    bench("version in range", lambda: version in rng, 100_000)
+    comparators = [
+        [semver.compile_match(">=1.2.3"), semver.compile_match("<2.0.0")],
+        [semver.compile_match(">=2.4.0"), semver.compile_match("<2.5.0")],
+        [semver.compile_match(">=3.1.0"), semver.compile_match("<3.5.0")],
+        [semver.compile_match(">=4.0.0"), semver.compile_match("<5.0.0")],
+        [semver.compile_match(">=5.0.0"), semver.compile_match("<=5.2.0")],
+    ]
+    bench(
+        "walk over compiled comparators",
+        lambda: any(all(c(version) for c in group) for group in comparators),
+        100_000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare validating mostly invalid strings with and without exceptions.
+
+Run it with ``SEMVER_SRC`` pointing to an older revision to compare
+:meth:`Version.is_valid` with its former implementation, which parsed
+the string and caught the ValueError.
+"""
+
+from common import bench
+
+from semver import Version
+
+INVALID = ["", "latest", "1.2", "v1.2.3", "1.2.3-", "01.2.3", "1.2.3-rc..1"] * 100
+VALID = ["1.2.3", "1.2.3-rc.1", "1.2.3+build.5"] * 100
+GARBAGE = ["x1.2.3", "hello world", "2024-01-01", "release candidate"] * 100
+
+
+def parse_or_none(version: str):
+    """Parse and catch the exception, how invalid strings used to be detected."""
+    try:
+        return Version.parse(version)
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    for label, strings in (
+        ("invalid", INVALID),
+        ("valid", VALID),
+        ("garbage", GARBAGE),
+        ("invalid bytes", [s.encode() for s in INVALID]),
+    ):
+        n = len(strings)
+        bench(f"parse + except: {label}", lambda: [parse_or_none(s) for s in strings])
+        bench(f"is_valid: {label}", lambda: [Version.is_valid(s) for s in strings])
+        # Not available in older revisions:
+        if hasattr(Version, "try_parse"):
+            bench(
+                f"try_parse: {label}", lambda: [Version.try_parse(s) for s in strings]
+            )
+            bench(
+                f"validate_many: {label}",
+                lambda: list(Version.validate_many(strings)),
+            )
+        print(f"  ({n} strings per call)")
+
+
+if __name__ == "__main__":
+    main()
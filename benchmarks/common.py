@@ -0,0 +1,34 @@
+"""
+Helpers shared by all benchmark scripts.
+
+The scripts measure the semver package of this working tree, or the one
+in the directory given by the environment variable ``SEMVER_SRC``.
+"""
+
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(
+    0,
+    os.environ.get("SEMVER_SRC", str(Path(__file__).resolve().parents[1] / "src")),
+)
+
+
+def bench(
+    label: str, func: Callable[[], object], number: int = 1, repeat: int = 5
+) -> float:
+    """
+    Run ``func`` repeatedly and print the best time per call.
+
+    :param label: the name of the benchmark
+    :param func: the function to measure
+    :param number: how often ``func`` is called in one timing loop
+    :param repeat: how many timing loops are run
+    :return: the best time in seconds per call
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{label:<50} {best * 1e6:12.3f} µs")
+    return best
@@ -0,0 +1,279 @@
+"""
+Run the benchmark suite and optionally save or compare the results.
+
+The suite measures the most important operations on three corpora of
+versions: ``plain`` (only major, minor, and patch), ``prerelease``
+(mostly prereleases), and ``build`` (mostly build metadata). It also
+measures the startup time of :command:`pysemver`.
+
+Usage::
+
+    $ python3 benchmarks/suite.py --save before.json
+    $ # ... change something ...
+    $ python3 benchmarks/suite.py --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import common
+
+from semver import Version
+
+SRC = Path(common.__file__).resolve().parents[1] / "src"
+
+
+def _nothing() -> None:
+    pass
+
+
+class Benchmark(NamedTuple):
+    """A benchmark of the suite."""
+
+    #: The name, prefixed with the corpus in :func:`all_benchmarks`
+    name: str
+    #: The measured function
+    func: Callable[[], object]
+    #: The number of operations which one call of *func* performs
+    ops: int
+    #: Called before each timing run, outside of the measured time
+    setup: Callable[[], object] = _nothing
+
+
+def make_corpus(kind: str, size: int, seed: int = 42) -> List[str]:
+    """
+    Create a reproducible list of version strings.
+
+    :param kind: one of ``plain``, ``prerelease``, or ``build``
+    :param size: the number of versions
+    :param seed: the seed of the random generator
+    :return: the version strings
+    """
+    rnd = random.Random(seed)
+
+    def number() -> int:
+        return rnd.choice([0, 0, 1, 1, 2, 3, 5, 10, 12, 20, 42, 100, 2024])
+
+    def prerelease() -> str:
+        return rnd.choice(
+            [
+                "alpha",
+                "alpha.%d" % number(),
+                "beta.%d" % number(),
+                "rc.%d" % number(),
+                "rc.%d.%d" % (number(), number()),
+                "dev.%d.g%07x" % (number(), rnd.getrandbits(28)),
+                "%d" % number(),
+            ]
+        )
+
+    def build() -> str:
+        return rnd.choice(
+            [
+                "build.%d" % rnd.randint(1, 9999),
+                "sha.%07x" % rnd.getrandbits(28),
+                "build.%d.sha.%07x" % (rnd.randint(1, 9999), rnd.getrandbits(28)),
+                "20240101.%d" % number(),
+            ]
+        )
+
+    versions = []
+    for _ in range(size):
+        version = "%d.%d.%d" % (number(), number(), number())
+        if kind == "prerelease" and rnd.random() < 0.9:
+            version += "-" + prerelease()
+        elif kind == "build":
+            if rnd.random() < 0.3:
+                version += "-" + prerelease()
+            if rnd.random() < 0.9:
+                version += "+" + build()
+        versions.append(version)
+    return versions
+
+
+def each(func: Callable[[Version], object], versions: List[Version]):
+    """Return a function which calls *func* for all versions."""
+
+    def run() -> None:
+        for version in versions:
+            func(version)
+
+    return run
+
+
+def cold(
+    name: str, func: Callable[[List[Version]], object], strings: List[str]
+) -> Benchmark:
+    """
+    Return a benchmark which runs *func* on freshly parsed versions.
+
+    The versions are parsed again before each timing run, so *func* sees
+    versions without cached strings, hashes, or precedence keys.
+    """
+    versions: List[Version] = []
+
+    def setup() -> None:
+        versions[:] = [Version.parse(s) for s in strings]
+
+    return Benchmark(name, lambda: func(versions), len(strings), setup)
+
+
+def corpus_benchmarks(strings: List[str]) -> Iterator[Benchmark]:
+    """
+    Yield the benchmarks of one corpus.
+
+    The versions are parsed once and shared by all benchmarks, so the
+    benchmarks without the ``_cold`` suffix measure versions whose
+    strings, hashes, and precedence keys are already cached.
+    """
+    versions = [Version.parse(s) for s in strings]
+    pairs = list(zip(versions, versions[1:] + versions[:1]))
+    str_pairs = list(zip(versions, strings[1:] + strings[:1]))
+    n = len(versions)
+
+    yield Benchmark("parse", lambda: [Version.parse(s) for s in strings], n)
+    yield Benchmark("is_valid", lambda: [Version.is_valid(s) for s in strings], n)
+    yield Benchmark("str", each(str, versions), n)
+    yield cold("str_cold", lambda fresh: [str(v) for v in fresh], strings)
+    yield Benchmark("compare", lambda: [a.compare(b) for a, b in pairs], n)
+    yield Benchmark("compare_str", lambda: [a.compare(b) for a, b in str_pairs], n)
+    yield Benchmark("lt", lambda: [a < b for a, b in pairs], n)
+    yield Benchmark("eq", lambda: [a == b for a, b in pairs], n)
+    yield Benchmark("sort", lambda: sorted(versions), n)
+    yield cold("sort_cold", sorted, strings)
+    yield Benchmark("hash", lambda: set(versions), n)
+    yield cold("hash_cold", set, strings)
+    yield Benchmark("match", each(lambda v: v.match(">=2.0.0"), versions), n)
+    for part in ("major", "minor", "patch", "prerelease", "build"):
+        method = getattr(Version, "bump_" + part)
+        yield Benchmark("bump_" + part, each(method, versions), n)
+    for part in ("patch", "prerelease"):
+        yield Benchmark(
+            "next_version_" + part,
+            each(lambda v, part=part: v.next_version(part), versions),
+            n,
+        )
+
+
+def startup_benchmarks() -> Iterator[Benchmark]:
+    """Yield benchmarks which start a new Python process."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    for name, args in [
+        ("python", ["-c", "pass"]),
+        ("import_semver", ["-c", "import semver"]),
+        ("pysemver_check", ["-m", "semver", "check", "1.2.3"]),
+        ("pysemver_bump", ["-m", "semver", "bump", "minor", "1.2.3"]),
+    ]:
+        cmd = [sys.executable, *args]
+        yield Benchmark(
+            name,
+            lambda cmd=cmd: subprocess.run(
+                cmd, env=env, stdout=subprocess.DEVNULL, check=True
+            ),
+            1,
+        )
+
+
+def all_benchmarks(size: int) -> Iterator[Benchmark]:
+    """Yield all benchmarks, with the corpus as prefix of the name."""
+    for kind in ("plain", "prerelease", "build"):
+        strings = make_corpus(kind, size)
+        for benchmark in corpus_benchmarks(strings):
+            yield benchmark._replace(name=f"{kind}.{benchmark.name}")
+    for benchmark in startup_benchmarks():
+        yield benchmark._replace(name=f"startup.{benchmark.name}")
+
+
+def measure(benchmark: Benchmark, repeat: int) -> float:
+    """Return the best time in seconds per operation."""
+    times = timeit.repeat(
+        benchmark.func, setup=benchmark.setup, number=1, repeat=repeat
+    )
+    return min(times) / benchmark.ops
+
+
+def git_revision() -> Optional[str]:
+    """Return the current git commit, if there is one."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(SRC),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-k", "--filter", default="", help="Run only benchmarks containing this text"
+    )
+    parser.add_argument(
+        "--size", type=int, default=2000, help="Versions per corpus (default 2000)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timing runs per benchmark (default 5)"
+    )
+    parser.add_argument("--save", metavar="FILE", help="Save the results as JSON")
+    parser.add_argument(
+        "--compare", metavar="FILE", help="Compare with results saved before"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.1,
+        help="Ratio from which a slowdown is reported (default 1.1)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, float] = {}
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+
+    results: Dict[str, float] = {}
+    regressions = []
+    for benchmark in all_benchmarks(args.size):
+        name = benchmark.name
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(benchmark, args.repeat)
+        line = f"{name:<36} {result * 1e6:12.3f} µs"
+        if name in baseline:
+            ratio = result / baseline[name]
+            line += f"  {ratio:6.2f}x"
+            if ratio >= args.threshold:
+                line += "  slower"
+                regressions.append(name)
+        print(line, flush=True)
+
+    if args.save:
+        data = {
+            "revision": git_revision(),
+            "python": platform.python_implementation()
+            + " "
+            + platform.python_version(),
+            "platform": platform.platform(),
+            "size": args.size,
+            "results": results,
+        }
+        Path(args.save).write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+    if regressions:
+        print(f"{len(regressions)} benchmarks are slower than in {args.compare}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,39 +4,18 @@ Semver package major release 3.
 A Python module for semantic versioning. Simplifies comparing versions.
 """
 
-from ._deprecated import (
-    bump_build,
-    bump_major,
-    bump_minor,
-    bump_patch,
-    compare,
-    bump_prerelease,
-    finalize_version,
-    format_version,
-    match,
-    max_ver,
-    min_ver,
-    parse,
-    parse_version_info,
-    replace,
-    cmd_bump,
-    cmd_compare,
-    cmd_nextver,
-    cmd_check,
-    createparser,
-    process,
-    main,
-)
-from .version import Version, VersionInfo
+from typing import TYPE_CHECKING, Any, List
+
 from .__about__ import (
-    __version__,
+    SEMVER_SPEC_VERSION,
     __author__,
-    __maintainer__,
     __author_email__,
     __description__,
+    __maintainer__,
     __maintainer_email__,
-    SEMVER_SPEC_VERSION,
+    __version__,
 )
+from .version import Version, VersionInfo, compile_match, intern_pool
 
 __all__ = [
     "bump_build",
@@ -62,6 +41,17 @@ __all__ = [
     "main",
     "Version",
     "VersionInfo",
+    "compile_match",
+    "intern_pool",
+    "Range",
+    "VersionRange",
+    "VersionIndex",
+    "VersionArray",
+    "enable_stats",
+    "disable_stats",
+    "stats_enabled",
+    "stats",
+    "reset_stats",
     "__version__",
     "__author__",
     "__maintainer__",
@@ -70,3 +60,111 @@ __all__ = [
     "__maintainer_email__",
     "SEMVER_SPEC_VERSION",
 ]
+
+#: Deprecated functions, imported from :mod:`semver._deprecated` on first access
+_DEPRECATED = (
+    "bump_build",
+    "bump_major",
+    "bump_minor",
+    "bump_patch",
+    "compare",
+    "bump_prerelease",
+    "finalize_version",
+    "format_version",
+    "match",
+    "max_ver",
+    "min_ver",
+    "parse",
+    "parse_version_info",
+    "replace",
+    "cmd_bump",
+    "cmd_compare",
+    "cmd_nextver",
+    "cmd_check",
+    "createparser",
+    "process",
+    "main",
+)
+
+#: Range and container classes, imported from their modules on first access
+_LAZY = {
+    "Range": ".range",
+    "VersionRange": ".range",
+    "VersionIndex": ".containers",
+    "VersionArray": ".containers",
+}
+
+#: Statistics functions, imported from :mod:`semver._instrument` on first access
+_STATS = (
+    "enable_stats",
+    "disable_stats",
+    "stats_enabled",
+    "stats",
+    "reset_stats",
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import cli as cli
+    from ._deprecated import (
+        bump_build,
+        bump_major,
+        bump_minor,
+        bump_patch,
+        bump_prerelease,
+        cmd_bump,
+        cmd_check,
+        cmd_compare,
+        cmd_nextver,
+        compare,
+        createparser,
+        finalize_version,
+        format_version,
+        main,
+        match,
+        max_ver,
+        min_ver,
+        parse,
+        parse_version_info,
+        process,
+        replace,
+    )
+    from ._instrument import (
+        disable_stats,
+        enable_stats,
+        reset_stats,
+        stats,
+        stats_enabled,
+    )
+    from .containers import VersionArray, VersionIndex
+    from .range import Range, VersionRange
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the deprecated functions, the statistics functions, the range
+    and container classes, and :mod:`semver.cli` on first access.
+
+    They need :mod:`argparse`, :mod:`inspect`, :mod:`struct`, and
+    :mod:`warnings`, compile extra regular expressions, or are only used
+    while tuning a program, and would slow down ``import semver`` for code
+    that only needs :class:`~semver.version.Version`.
+    """
+    from importlib import import_module
+
+    if name == "cli":
+        return import_module(".cli", __name__)
+    if name in _DEPRECATED:
+        module = "._deprecated"
+    elif name in _STATS:
+        module = "._instrument"
+    elif name in _LAZY:
+        module = _LAZY[name]
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_DEPRECATED) | set(_STATS) | set(_LAZY) | {"cli"})
@@ -4,7 +4,7 @@ Contains all deprecated functions.
 .. autofunction: deprecated
 """
 
-import inspect
+import sys
 import warnings
 from functools import partial, wraps
 from types import FrameType
@@ -14,6 +14,38 @@ from . import cli
 from .version import Version
 from ._types import Decorator, F
 
+#: If warning filters are context-local, :data:`warnings.filters` may not
+#: be the filters of the current context.
+_CHECK_FILTERS = hasattr(sys, "_getframe") and not getattr(
+    sys.flags, "context_aware_warnings", False
+)
+
+
+def _is_ignored(category: Type[Warning], message: str, frame: FrameType) -> bool:
+    """
+    Check if a warning would be ignored by the warning filters.
+
+    This follows the filter matching of :func:`warnings.warn`, but is
+    cheaper, because it does not need to look up the warning registry.
+
+    :param category: the category of the warning
+    :param message: the text of the warning
+    :param frame: the frame which the warning is attributed to
+    :return: True if the first matching filter (or the default action)
+        is ``ignore``
+    """
+    module = frame.f_globals.get("__name__", "<string>")
+    for action, msg, cat, mod, lineno in warnings.filters:
+        if (
+            (msg is None or msg.match(message))
+            and issubclass(category, cat)
+            and (mod is None or mod.match(module))
+            and (not lineno or lineno == frame.f_lineno)
+        ):
+            return action == "ignore"
+    # defaultaction is not declared in the typeshed stubs of warnings
+    return getattr(warnings, "defaultaction", "default") == "ignore"
+
 
 def deprecated(
     func: Optional[F] = None,
@@ -45,39 +77,30 @@ def deprecated(
             category=category,
         )
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Callable[..., F]:
-        msg_list = ["Function 'semver.{f}' is deprecated."]
+    msg_list = ["Function 'semver.{f}' is deprecated."]
 
-        if version:
-            msg_list.append("Deprecated since version {v}. ")
+    if version:
+        msg_list.append("Deprecated since version {v}. ")
 
-        if not remove:
-            msg_list.append("This function will be removed in semver 3.")
-        else:
-            msg_list.append(str(remove))
+    if not remove:
+        msg_list.append("This function will be removed in semver 3.")
+    else:
+        msg_list.append(str(remove))
 
-        if replace:
-            msg_list.append("Use {r!r} instead.")
-        else:
-            msg_list.append("Use the respective 'semver.Version.{r}' instead.")
+    if replace:
+        msg_list.append("Use {r!r} instead.")
+    else:
+        msg_list.append("Use the respective 'semver.Version.{r}' instead.")
 
-        f = cast(F, func).__qualname__
-        r = replace or f
+    f = cast(F, func).__qualname__
+    r = replace or f
+    # The message is the same for each call, so build it only once
+    msg = " ".join(msg_list).format(f=f, r=r, v=version)
 
-        frame = cast(FrameType, cast(FrameType, inspect.currentframe()).f_back)
-
-        msg = " ".join(msg_list)
-        warnings.warn_explicit(
-            msg.format(f=f, r=r, v=version),
-            category=category,
-            filename=inspect.getfile(frame.f_code),
-            lineno=frame.f_lineno,
-        )
-        # As recommended in the Python documentation
-        # https://docs.python.org/3/library/inspect.html#the-interpreter-stack
-        # better remove the interpreter stack:
-        del frame
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Callable[..., F]:
+        if not (_CHECK_FILTERS and _is_ignored(category, msg, sys._getframe(1))):
+            warnings.warn(msg, category=category, stacklevel=2)
         return func(*args, **kwargs)  # type: ignore
 
     return wrapper
@@ -0,0 +1,222 @@
+"""
+Binary encodings of versions.
+
+The sortable encoding maps a version to bytes whose lexicographic
+(``memcmp``) order is the precedence order of the versions:
+
+* major, minor, and patch are encoded as unsigned integers, see
+  :func:`encode_uint`;
+* a prerelease is encoded as a sequence of identifiers, each starting with
+  :data:`NUMERIC` (followed by an unsigned integer) or
+  :data:`ALPHANUMERIC` (followed by the UTF-8 encoded identifier and a
+  zero byte), and terminated by a zero byte;
+* a release (a version without prerelease) is encoded as a single
+  :data:`RELEASE` byte, which sorts after all prereleases;
+* the build part, if there is one, is appended after a ``+`` byte.
+
+The precedence part is self-delimiting, so the build part only orders
+versions with the same precedence.
+
+The compact encoding (:func:`pack` and :func:`unpack`) stores a fixed-size
+:data:`RECORD` followed by the UTF-8 encoded prerelease and build parts.
+Records are self-delimiting, so many of them can be concatenated.
+"""
+
+import struct
+from typing import List, Optional, Tuple
+
+from ._types import VersionTuple
+
+END = 0x00
+NUMERIC = 0x01
+ALPHANUMERIC = 0x02
+RELEASE = 0x03
+BUILD = ord("+")
+
+#: Lengths from this value onwards are encoded as a nested unsigned integer
+_LONG = 0xFF
+
+
+def encode_uint(value: int, into: bytearray) -> None:
+    """
+    Append an order-preserving encoding of an unsigned integer.
+
+    The integer is stored big-endian without leading zero bytes and
+    prefixed with its length. Longer numbers therefore sort after
+    shorter ones. Lengths of 255 bytes or more are encoded as
+    ``0xFF`` followed by the encoded length.
+
+    :param value: the integer to encode
+    :param into: the buffer to append to
+    """
+    data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    if len(data) < _LONG:
+        into.append(len(data))
+    else:
+        into.append(_LONG)
+        encode_uint(len(data), into)
+    into += data
+
+
+def decode_uint(data: bytes, offset: int) -> Tuple[int, int]:
+    """
+    Decode an unsigned integer written by :func:`encode_uint`.
+
+    :param data: the encoded data
+    :param offset: the start of the integer in *data*
+    :return: the integer and the offset after it
+    """
+    length = data[offset]
+    offset += 1
+    if length == _LONG:
+        length, offset = decode_uint(data, offset)
+    end = offset + length
+    if end > len(data):
+        raise ValueError("truncated integer at offset %d" % offset)
+    return int.from_bytes(data[offset:end], "big"), end
+
+
+def encode_sortable(version: VersionTuple) -> bytes:
+    """
+    Encode the parts of a version into byte-comparable form.
+
+    :param version: the parts of a version, see
+        :meth:`Version.to_tuple <semver.version.Version.to_tuple>`
+    :return: the encoded version
+    :raises ValueError: if the prerelease part or one of its identifiers
+        can not be encoded without changing its meaning
+    """
+    major, minor, patch, prerelease, build = version
+    if prerelease == "":
+        # Neither a release nor a prerelease, it would not decode to itself
+        raise ValueError("Cannot encode an empty prerelease")
+    result = bytearray()
+    encode_uint(major, result)
+    encode_uint(minor, result)
+    encode_uint(patch, result)
+    if prerelease is not None:
+        for identifier in prerelease.split("."):
+            if identifier.isdigit():
+                number = int(identifier)
+                if str(number) != identifier:
+                    raise ValueError("Cannot encode numeric identifier %r" % identifier)
+                result.append(NUMERIC)
+                encode_uint(number, result)
+            else:
+                if "\x00" in identifier:
+                    raise ValueError("Cannot encode identifier %r" % identifier)
+                result.append(ALPHANUMERIC)
+                result += identifier.encode("UTF-8")
+                result.append(END)
+        result.append(END)
+    else:
+        result.append(RELEASE)
+    if build is not None:
+        result.append(BUILD)
+        result += build.encode("UTF-8")
+    return bytes(result)
+
+
+def decode_sortable(data: bytes) -> VersionTuple:
+    """
+    Decode the output of :func:`encode_sortable`.
+
+    :param data: the encoded version
+    :return: the parts of the version
+    :raises ValueError: if *data* is not a valid encoding
+    """
+    try:
+        major, offset = decode_uint(data, 0)
+        minor, offset = decode_uint(data, offset)
+        patch, offset = decode_uint(data, offset)
+        prerelease: Optional[str] = None
+        if data[offset] == RELEASE:
+            offset += 1
+        else:
+            identifiers: List[str] = []
+            while data[offset] != END:
+                kind = data[offset]
+                if kind == NUMERIC:
+                    number, offset = decode_uint(data, offset + 1)
+                    identifiers.append(str(number))
+                elif kind == ALPHANUMERIC:
+                    end = data.index(END, offset + 1)
+                    identifiers.append(data[offset + 1 : end].decode("UTF-8"))
+                    offset = end + 1
+                else:
+                    raise ValueError("unknown identifier type %d" % kind)
+            if not identifiers:
+                raise ValueError("empty prerelease")
+            prerelease = ".".join(identifiers)
+            offset += 1
+        build: Optional[str] = None
+        if offset < len(data):
+            if data[offset] != BUILD:
+                raise ValueError("unexpected byte %d" % data[offset])
+            build = data[offset + 1 :].decode("UTF-8")
+    except (IndexError, UnicodeDecodeError) as error:
+        raise ValueError("truncated or corrupt data: %s" % error) from error
+    return major, minor, patch, prerelease, build
+
+
+#: Fixed-size part of the compact encoding: major, minor, patch, and the
+#: byte lengths of prerelease and build
+RECORD = struct.Struct("<QQQII")
+#: Length which marks a missing prerelease or build part
+NO_STRING = 0xFFFFFFFF
+_MAX_NUMBER = 2**64 - 1
+_MAX_LENGTH = NO_STRING - 1
+
+
+def pack(version: VersionTuple, into: bytearray) -> None:
+    """
+    Append the compact encoding of a version.
+
+    :param version: the parts of a version, see
+        :meth:`Version.to_tuple <semver.version.Version.to_tuple>`
+    :param into: the buffer to append to
+    :raises OverflowError: if a number does not fit into 64 bits, or the
+        prerelease or build part is 4 GiB or longer
+    """
+    major, minor, patch, prerelease, build = version
+    if major > _MAX_NUMBER or minor > _MAX_NUMBER or patch > _MAX_NUMBER:
+        raise OverflowError("version part does not fit into 64 bits")
+    pre = b"" if prerelease is None else prerelease.encode("UTF-8")
+    bld = b"" if build is None else build.encode("UTF-8")
+    if len(pre) > _MAX_LENGTH or len(bld) > _MAX_LENGTH:
+        raise OverflowError("prerelease or build part is too long")
+    into += RECORD.pack(
+        major,
+        minor,
+        patch,
+        NO_STRING if prerelease is None else len(pre),
+        NO_STRING if build is None else len(bld),
+    )
+    into += pre
+    into += bld
+
+
+def unpack(data: bytes, offset: int = 0) -> Tuple[VersionTuple, int]:
+    """
+    Decode a version written by :func:`pack`.
+
+    :param data: the encoded data
+    :param offset: the start of the version in *data*
+    :return: the parts of the version and the offset after it
+    :raises ValueError: if *data* is not a valid encoding
+    """
+    try:
+        major, minor, patch, pre_length, build_length = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        prerelease = build = None
+        if pre_length != NO_STRING:
+            prerelease = str(data[offset : offset + pre_length], "UTF-8")
+            offset += pre_length
+        if build_length != NO_STRING:
+            build = str(data[offset : offset + build_length], "UTF-8")
+            offset += build_length
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ValueError("truncated or corrupt data: %s" % error) from error
+    if offset > len(data):
+        raise ValueError("truncated data")
+    return (major, minor, patch, prerelease, build), offset
@@ -0,0 +1,213 @@
+"""
+Opt-in instrumentation of the hot paths of :class:`~semver.version.Version`.
+
+While instrumentation is disabled, the methods of
+:class:`~semver.version.Version` are not touched, so there is no overhead
+at all. :func:`enable_stats` replaces the instrumented methods with
+wrappers which count (and optionally time) each call, and
+:func:`disable_stats` restores the original methods.
+
+The counters are not synchronized, so in multi-threaded programs they
+are approximate.
+"""
+
+from collections import Counter, defaultdict
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, DefaultDict, Dict, Optional
+
+from ._types import String
+from .version import Version
+
+#: The instrumented methods of :class:`~semver.version.Version`
+INSTRUMENTED = (
+    "parse",
+    "compare",
+    "match",
+    # The comparison operators, which are also used by sorted(), min(),
+    # and max(); operands of the same class are not passed to compare()
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "bump_major",
+    "bump_minor",
+    "bump_patch",
+    "bump_prerelease",
+    "bump_build",
+)
+
+#: The original methods while instrumentation is enabled
+_originals: Dict[str, Any] = {}
+_calls: Counter = Counter()
+_times: DefaultDict[str, float] = defaultdict(float)
+_parsed: Counter = Counter()
+
+#: The maximum number of distinct strings counted in ``parsed``. When the
+#: counter grows beyond twice this number, only the most common strings
+#: are kept, so a program which parses many different strings does not
+#: fill the memory.
+MAX_PARSED = 10_000
+
+
+def _count(name: str, func: Callable, timing: bool) -> Callable:
+    """Return a wrapper of *func* which counts (and times) its calls."""
+    if not timing:
+
+        @wraps(func)
+        def counting(*args, **kwargs):
+            _calls[name] += 1
+            return func(*args, **kwargs)
+
+        return counting
+
+    @wraps(func)
+    def timing_(*args, **kwargs):
+        _calls[name] += 1
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _times[name] += perf_counter() - start
+
+    return timing_
+
+
+def _wrap_parse(func: Callable) -> Callable:
+    """Record the input strings and failures of :meth:`Version.parse`."""
+
+    @wraps(func)
+    def parse(cls, version, *args, **kwargs):
+        _parsed[version] += 1
+        if len(_parsed) > 2 * MAX_PARSED:
+            _prune_parsed()
+        try:
+            return func(cls, version, *args, **kwargs)
+        except (ValueError, TypeError):
+            _calls["parse_failures"] += 1
+            raise
+
+    return parse
+
+
+def _prune_parsed() -> None:
+    """Keep only the :data:`MAX_PARSED` most common parsed strings."""
+    most_common = _parsed.most_common(MAX_PARSED)
+    _parsed.clear()
+    _parsed.update(dict(most_common))
+
+
+def _wrap_compare(func: Callable) -> Callable:
+    """Count comparisons which have to parse a string first."""
+
+    @wraps(func)
+    def compare(self, other):
+        if isinstance(other, String.__args__):  # type: ignore
+            _calls["compare_str"] += 1
+        return func(self, other)
+
+    return compare
+
+
+def enable_stats(timing: bool = False) -> None:
+    """
+    Start to count the calls of the instrumented methods.
+
+    The counters are not reset, use :func:`reset_stats` for that.
+
+    .. versionadded:: 3.1.0
+
+    :param timing: also measure the time spent in each method
+
+    >>> semver.enable_stats()
+    >>> _ = Version.parse("1.2.3").compare("1.2.4")
+    >>> semver.stats()["calls"]["parse"]
+    2
+    >>> semver.disable_stats(); semver.reset_stats()
+    """
+    disable_stats()
+    for name in INSTRUMENTED:
+        original = Version.__dict__[name]
+        _originals[name] = original
+        if isinstance(original, classmethod):
+            func = original.__func__
+            if name == "parse":
+                func = _wrap_parse(func)
+            setattr(Version, name, classmethod(_count(name, func, timing)))
+        else:
+            func = original
+            if name == "compare":
+                func = _wrap_compare(func)
+            setattr(Version, name, _count(name, func, timing))
+
+
+def disable_stats() -> None:
+    """
+    Stop counting and restore the original methods.
+
+    The counters keep their values.
+
+    .. versionadded:: 3.1.0
+    """
+    while _originals:
+        name, original = _originals.popitem()
+        setattr(Version, name, original)
+
+
+def stats_enabled() -> bool:
+    """
+    Check if the calls are counted.
+
+    .. versionadded:: 3.1.0
+
+    :return: True if :func:`enable_stats` was called without a following
+        :func:`disable_stats`
+    """
+    return bool(_originals)
+
+
+def reset_stats() -> None:
+    """
+    Reset all counters to zero.
+
+    .. versionadded:: 3.1.0
+    """
+    _calls.clear()
+    _times.clear()
+    _parsed.clear()
+
+
+def stats(most_common: Optional[int] = 10) -> Dict[str, Any]:
+    """
+    Return a snapshot of the counters.
+
+    The result is a dictionary with these keys:
+
+    * ``calls``: the number of calls of each instrumented method
+      (including the comparison operators like ``__lt__``), and
+      additionally ``parse_failures`` (calls of :meth:`Version.parse
+      <semver.version.Version.parse>` which raised an error) and
+      ``compare_str`` (calls of :meth:`Version.compare
+      <semver.version.Version.compare>` with a string, which has to be
+      parsed first);
+    * ``times``: the total time in seconds spent in each method, only
+      filled if :func:`enable_stats` was called with ``timing=True``;
+    * ``parsed``: a list of the most often parsed strings and how often
+      they were parsed. Strings which are parsed over and over are good
+      candidates to parse only once, or for :meth:`Version.enable_parse_cache
+      <semver.version.Version.enable_parse_cache>`. At most
+      :data:`MAX_PARSED` strings are kept, rare strings may be dropped.
+
+    .. versionadded:: 3.1.0
+
+    :param most_common: the number of strings in ``parsed``; use ``None``
+        for all strings
+    :return: the snapshot
+    """
+    return {
+        "calls": {name: _calls[name] for name in sorted(_calls)},
+        "times": {name: _times[name] for name in sorted(_times)},
+        "parsed": _parsed.most_common(most_common),
+    }
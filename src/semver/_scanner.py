@@ -0,0 +1,188 @@
+"""
+A hand-written scanner for version strings.
+
+:func:`scan` accepts exactly the strings which are accepted by
+:attr:`Version._REGEX <semver.version.Version._REGEX>` (or
+:attr:`Version._REGEX_OPTIONAL_MINOR_AND_PATCH
+<semver.version.Version._REGEX_OPTIONAL_MINOR_AND_PATCH>`) and returns
+the same parts. Unlike the regular expressions, it never backtracks:
+every character is looked at a constant number of times, so the time is
+linear in the length of the string.
+
+:func:`check_limits` checks the size limits of a version string before
+it is scanned or matched.
+"""
+
+import re
+from typing import NamedTuple, Optional, Tuple, Union
+
+#: The parts of a version string: major, minor, patch, prerelease, and build.
+#: Missing parts are None.
+Parts = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]
+
+_NON_ZERO_DIGITS = "123456789"
+#: Leading (Unicode) digits, like ``\d*`` in the regular expression
+_LEADING_DIGITS = re.compile(r"\d*")
+_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-")
+
+
+class ScanError(NamedTuple):
+    """Why and where a version string is invalid."""
+
+    #: A short description of the problem
+    reason: str
+    #: The index of the invalid part in the version string
+    position: int
+
+
+def _is_number(part: str) -> bool:
+    """Check a string against ``0|[1-9]\\d*``."""
+    if part == "0":
+        return True
+    return (
+        part != ""
+        and part[0] in _NON_ZERO_DIGITS
+        and (len(part) == 1 or part[1:].isdecimal())
+    )
+
+
+def _is_alphanumeric(part: str) -> bool:
+    """Check a string against ``[0-9a-zA-Z-]*``."""
+    if not part.isascii():
+        return False
+    part = part.replace("-", "")
+    return part == "" or part.isalnum()
+
+
+def _is_prerelease_identifier(identifier: str) -> bool:
+    """Check a string against ``0|[1-9]\\d*|\\d*[a-zA-Z-][0-9a-zA-Z-]*``."""
+    if identifier.isdecimal():
+        return _is_number(identifier)
+    # An ASCII string with a letter or "-" (it is not decimal):
+    if identifier.isascii():
+        return identifier != "" and _is_alphanumeric(identifier)
+    # The first character which is not a digit has to be a letter or "-":
+    start = _LEADING_DIGITS.match(identifier).end()  # type: ignore
+    return identifier[start] in _LETTERS and _is_alphanumeric(identifier[start + 1 :])
+
+
+def scan(
+    version: str, optional_minor_and_patch: bool = False
+) -> Union[Parts, ScanError]:
+    """
+    Split a version string into its parts and check them.
+
+    :param version: the version string
+    :param optional_minor_and_patch: allow missing minor and patch parts
+    :return: the parts, or a :class:`ScanError` if the string is invalid
+    """
+    end = len(version)
+    # Like "$" in the regular expression, allow one trailing newline:
+    if version.endswith("\n"):
+        end -= 1
+    plus = version.find("+", 0, end)
+    head_end = end if plus < 0 else plus
+    dash = version.find("-", 0, head_end)
+    core_end = head_end if dash < 0 else dash
+
+    numbers = version[:core_end].split(".", 2)
+    start = 0
+    for name, number in zip(("major", "minor", "patch"), numbers):
+        if not _is_number(number):
+            return ScanError("invalid %s part" % name, start)
+        start += len(number) + 1
+    if len(numbers) < 3:
+        if not optional_minor_and_patch:
+            missing = ("minor", "patch")[len(numbers) - 1]
+            return ScanError("missing %s part" % missing, core_end)
+        numbers += [None] * (3 - len(numbers))  # type: ignore
+    major, minor, patch = numbers
+
+    prerelease = None
+    if dash >= 0:
+        prerelease = version[dash + 1 : head_end]
+        start = dash + 1
+        for identifier in prerelease.split("."):
+            if not _is_prerelease_identifier(identifier):
+                return ScanError("invalid prerelease identifier", start)
+            start += len(identifier) + 1
+
+    build = None
+    if plus >= 0:
+        build = version[plus + 1 : end]
+        # Check the whole part at once, and only search the invalid
+        # identifier if there is one:
+        if not (
+            _is_alphanumeric(build.replace(".", ""))
+            and build[:1] not in ("", ".")
+            and not build.endswith(".")
+            and ".." not in build
+        ):
+            start = plus + 1
+            for identifier in build.split("."):
+                if not identifier or not _is_alphanumeric(identifier):
+                    return ScanError("invalid build identifier", start)
+                start += len(identifier) + 1
+
+    return major, minor, patch, prerelease, build
+
+
+def check_limits(
+    version: str,
+    max_length: Optional[int],
+    max_identifiers: Optional[int],
+    max_digits: Optional[int],
+) -> Optional[ScanError]:
+    """
+    Check the size of a version string and its parts.
+
+    The checks only use string methods which run in linear time, so they
+    are cheap compared to matching or scanning the string.
+
+    :param version: the version string
+    :param max_length: the maximum length of the string, or None
+    :param max_identifiers: the maximum number of identifiers in the
+        prerelease part and in the build part, or None
+    :param max_digits: the maximum number of digits of the major, minor,
+        and patch parts and of numeric prerelease identifiers, or None
+    :return: None if the string is within all limits, otherwise a
+        :class:`ScanError`
+    """
+    if max_length is not None and len(version) > max_length:
+        return ScanError("is longer than %d characters" % max_length, max_length)
+    if max_identifiers is None and max_digits is None:
+        return None
+
+    plus = version.find("+")
+    head_end = len(version) if plus < 0 else plus
+    dash = version.find("-", 0, head_end)
+    core_end = head_end if dash < 0 else dash
+
+    if max_identifiers is not None:
+        for name, start, stop in (
+            ("prerelease", dash, head_end),
+            ("build", plus, len(version)),
+        ):
+            if start >= 0 and version.count(".", start, stop) >= max_identifiers:
+                return ScanError(
+                    "has more than %d %s identifiers" % (max_identifiers, name),
+                    start + 1,
+                )
+
+    if max_digits is not None:
+        start = 0
+        for number in version[:core_end].split("."):
+            if len(number) > max_digits:
+                return ScanError(
+                    "has a number with more than %d digits" % max_digits, start
+                )
+            start += len(number) + 1
+        if dash >= 0:
+            start = dash + 1
+            for identifier in version[dash + 1 : head_end].split("."):
+                if len(identifier) > max_digits and identifier.isdecimal():
+                    return ScanError(
+                        "has a number with more than %d digits" % max_digits, start
+                    )
+                start += len(identifier) + 1
+    return None
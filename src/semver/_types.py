@@ -5,6 +5,7 @@ from typing import Union, Optional, Tuple, Dict, Iterable, Callable, TypeVar
 
 VersionPart = Union[int, Optional[str]]
 VersionTuple = Tuple[int, int, int, Optional[str], Optional[str]]
+PrecedenceKey = Tuple[Union[int, Tuple[int, Union[int, str]]], ...]
 VersionDict = Dict[str, VersionPart]
 VersionIterator = Iterable[VersionPart]
 String = Union[str, bytes]
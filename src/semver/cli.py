@@ -8,17 +8,180 @@ The :func:`main <semver.cli.main>` function calls
 all the commandline options.
 
 The result of each command is printed on stdout.
+
+If a version argument is ``-``, the command reads one input per line
+from stdin and prints one result per line. Lines which fail are reported
+on stderr and do not stop the processing of the following lines.
 """
 
 import argparse
+import heapq
+import operator
+import pickle
 import sys
-from typing import cast, List, Optional
-
-from .version import Version
+import tempfile
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from operator import itemgetter
+from typing import (
+    cast,
+    Any,
+    Callable,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ._types import PrecedenceKey
+from .version import Version, compile_match
 from .__about__ import __version__
 
+#: Version argument which makes a subcommand read its input from stdin
+STDIN = "-"
+
+
+def process_lines(func: Callable[[str], Optional[str]]) -> None:
+    """
+    Call a function for each non-empty line of stdin.
+
+    Each result which is not ``None`` is printed on stdout as soon as it
+    is available. If *func* raises :class:`ValueError` or
+    :class:`TypeError`, the error is printed on stderr together with the
+    line number and processing continues with the next line.
 
-def cmd_bump(args: argparse.Namespace) -> str:
+    :param func: the function to call with each stripped line
+    :raises ValueError: after all lines are processed, if any line failed
+    """
+    failures = total = 0
+    for lineno, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line:
+            continue
+        total += 1
+        try:
+            result = func(line)
+        except (ValueError, TypeError) as err:
+            failures += 1
+            print("ERROR line %d:" % lineno, err, file=sys.stderr, flush=True)
+            continue
+        if result is not None:
+            print(result, flush=True)
+    if failures:
+        raise ValueError("%d of %d lines failed" % (failures, total))
+
+
+def read_versions(
+    files: Optional[List[str]] = None, skip_invalid: bool = False
+) -> Iterator[Tuple[str, Version]]:
+    """
+    Read one version per line from files or stdin.
+
+    Empty lines are ignored.
+
+    :param files: the files to read; ``None``, an empty list, or ``-``
+        reads from stdin
+    :param skip_invalid: skip invalid versions instead of raising an error
+    :return: an iterator of the stripped lines and their versions
+    :raises ValueError: if a line is not a valid version and *skip_invalid*
+        is false
+    :raises OSError: if a file can not be read
+    """
+    for name in files or [STDIN]:
+        with ExitStack() as stack:
+            if name == STDIN:
+                stream = sys.stdin
+                name = "<stdin>"
+            else:
+                stream = stack.enter_context(Path(name).open(encoding="UTF-8"))
+            for lineno, line in enumerate(stream, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield line, Version.parse(line)
+                except ValueError as err:
+                    if not skip_invalid:
+                        raise ValueError("%s:%d: %s" % (name, lineno, err)) from err
+
+
+#: Number of items pickled together when a sorted run is written
+_RUN_BLOCK_SIZE = 4096
+
+
+def _write_run(items: List[Tuple[PrecedenceKey, str]], run: IO[bytes]) -> None:
+    """Write a sorted run in blocks to a temporary file."""
+    for start in range(0, len(items), _RUN_BLOCK_SIZE):
+        pickle.dump(
+            items[start : start + _RUN_BLOCK_SIZE], run, pickle.HIGHEST_PROTOCOL
+        )
+    run.seek(0)
+
+
+def _read_run(run: IO[bytes]) -> Iterator[Tuple[PrecedenceKey, str]]:
+    """Read a sorted run written by :func:`_write_run`."""
+    while True:
+        try:
+            yield from pickle.load(run)
+        except EOFError:
+            return
+
+
+def external_sort(
+    versions: Iterable[Tuple[str, Version]],
+    reverse: bool = False,
+    unique: bool = False,
+    chunk_size: int = 100_000,
+) -> Iterator[str]:
+    """
+    Sort version strings by precedence with bounded memory.
+
+    The versions are sorted in chunks of *chunk_size* items. If there is
+    more than one chunk, each sorted chunk is written to a temporary file
+    and the files are merged afterwards. The sort is stable.
+
+    :param versions: the strings and their versions, see :func:`read_versions`
+    :param reverse: sort in descending order
+    :param unique: keep only the first of all versions with equal precedence
+    :param chunk_size: the maximum number of versions kept in memory
+    :return: an iterator of the sorted strings
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk size must be positive, got %d" % chunk_size)
+    items = iter(versions)
+    with ExitStack() as stack:
+        runs: List[Iterator[Tuple[PrecedenceKey, str]]] = []
+        chunk: List[Tuple[PrecedenceKey, str]] = []
+        while True:
+            chunk = [
+                (version.precedence_key, line)
+                for line, version in islice(items, chunk_size)
+            ]
+            chunk.sort(key=itemgetter(0), reverse=reverse)
+            if len(chunk) < chunk_size and not runs:
+                break
+            run = stack.enter_context(tempfile.TemporaryFile())
+            _write_run(chunk, run)
+            runs.append(_read_run(run))
+            if len(chunk) < chunk_size:
+                break
+        merged: Iterator[Tuple[PrecedenceKey, str]] = iter(chunk)
+        if runs:
+            # Ties are taken from earlier runs first, so the sort stays stable
+            merged = heapq.merge(*runs, key=itemgetter(0), reverse=reverse)
+        last = None
+        for key, line in merged:
+            if unique:
+                if key == last:
+                    continue
+                last = key
+            yield line
+
+
+def cmd_bump(args: argparse.Namespace) -> Optional[str]:
     """
     Subcommand: Bumps a version.
 
@@ -26,7 +189,8 @@ def cmd_bump(args: argparse.Namespace) -> str:
     <PART> can be major, minor, patch, prerelease, or build
 
     :param args: The parsed arguments
-    :return: the new, bumped version
+    :return: the new, bumped version (``None`` if the versions are read
+        from stdin)
     """
     maptable = {
         "major": "bump_major",
@@ -40,10 +204,16 @@ def cmd_bump(args: argparse.Namespace) -> str:
         # print the help and exit
         args.parser.parse_args(["bump", "-h"])
 
-    ver = Version.parse(args.version)
-    # get the respective method and call it
-    func = getattr(ver, maptable[cast(str, args.bump)])
-    return str(func())
+    method = maptable[cast(str, args.bump)]
+
+    def bump(version: str) -> str:
+        # get the respective method and call it
+        return str(getattr(Version.parse(version), method)())
+
+    if args.version == STDIN:
+        process_lines(bump)
+        return None
+    return bump(args.version)
 
 
 def cmd_check(args: argparse.Namespace) -> None:
@@ -54,24 +224,53 @@ def cmd_check(args: argparse.Namespace) -> None:
 
     :param args: The parsed arguments
     """
-    if Version.is_valid(args.version):
+
+    def check(version: str) -> None:
+        if not Version.is_valid(version):
+            raise ValueError("Invalid version %r" % version)
+
+    if args.version == STDIN:
+        process_lines(check)
         return None
-    raise ValueError("Invalid version %r" % args.version)
+    return check(args.version)
 
 
-def cmd_compare(args: argparse.Namespace) -> str:
+def cmd_compare(args: argparse.Namespace) -> Optional[str]:
     """
     Subcommand: Compare two versions.
 
     Synopsis: compare <VERSION1> <VERSION2>
 
+    If one version is ``-``, each line of stdin is compared with the other
+    version. If both are ``-``, each line contains two versions separated
+    by whitespace.
+
     :param args: The parsed arguments
     """
-    ver1 = Version.parse(args.version1)
-    return str(ver1.compare(args.version2))
+
+    def compare(version1: str, version2: str) -> str:
+        return str(Version.parse(version1).compare(version2))
+
+    if args.version1 == STDIN and args.version2 == STDIN:
+
+        def compare_pair(line: str) -> str:
+            versions = line.split()
+            if len(versions) != 2:
+                raise ValueError("Expected two versions, got %r" % line)
+            return compare(*versions)
+
+        process_lines(compare_pair)
+        return None
+    if args.version1 == STDIN:
+        process_lines(lambda line: compare(line, args.version2))
+        return None
+    if args.version2 == STDIN:
+        process_lines(lambda line: compare(args.version1, line))
+        return None
+    return compare(args.version1, args.version2)
 
 
-def cmd_nextver(args: argparse.Namespace) -> str:
+def cmd_nextver(args: argparse.Namespace) -> Optional[str]:
     """
     Subcommand: Determines the next version, taking prereleases into account.
 
@@ -79,8 +278,99 @@ def cmd_nextver(args: argparse.Namespace) -> str:
 
     :param args: The parsed arguments
     """
-    version = Version.parse(args.version)
-    return str(version.next_version(args.part))
+
+    def nextver(version: str) -> str:
+        return str(Version.parse(version).next_version(args.part))
+
+    if args.version == STDIN:
+        process_lines(nextver)
+        return None
+    return nextver(args.version)
+
+
+def cmd_sort(args: argparse.Namespace) -> None:
+    """
+    Subcommand: Sort versions by precedence.
+
+    Synopsis: sort [--reverse] [--unique] [--skip-invalid] [FILE...]
+
+    Files which do not fit into memory are sorted with an external merge
+    sort, see :func:`external_sort`.
+
+    :param args: The parsed arguments
+    """
+    lines = external_sort(
+        read_versions(args.files, args.skip_invalid),
+        reverse=args.reverse,
+        unique=args.unique,
+        chunk_size=args.chunk_size,
+    )
+    write = sys.stdout.write
+    for line in lines:
+        write(line)
+        write("\n")
+
+
+def cmd_filter(args: argparse.Namespace) -> None:
+    """
+    Subcommand: Print all versions which match an expression.
+
+    Synopsis: filter [--skip-invalid] <EXPRESSION> [FILE...]
+
+    The expression has the same syntax as in
+    :meth:`Version.match <semver.version.Version.match>`.
+
+    :param args: The parsed arguments
+    """
+    expression = compile_match(args.expression)
+    write = sys.stdout.write
+    for line, version in read_versions(args.files, args.skip_invalid):
+        if expression(version):
+            write(line)
+            write("\n")
+
+
+def _extreme(args: argparse.Namespace, better: Callable[[Any, Any], bool]) -> str:
+    """Return the first line whose version is better than all others."""
+    best_line = None
+    best_key = None
+    for line, version in read_versions(args.files, args.skip_invalid):
+        key = version.precedence_key
+        if best_key is None or better(key, best_key):
+            best_line, best_key = line, key
+    if best_line is None:
+        raise ValueError("No versions found")
+    return best_line
+
+
+def cmd_max(args: argparse.Namespace) -> str:
+    """
+    Subcommand: Print the highest version.
+
+    Synopsis: max [--skip-invalid] [FILE...]
+
+    The versions are processed in a single pass with constant memory.
+    Of all highest versions with the same precedence, the first is printed.
+
+    :param args: The parsed arguments
+    :return: the highest version
+    """
+    return _extreme(args, operator.gt)
+
+
+def cmd_min(args: argparse.Namespace) -> str:
+    """
+    Subcommand: Print the lowest version.
+
+    Synopsis: min [--skip-invalid] [FILE...]
+
+    The versions are processed in a single pass with constant memory.
+    Of all lowest versions with the same precedence, the first is printed.
+
+    :param args: The parsed arguments
+    :return: the lowest version
+    """
+    return _extreme(args, operator.lt)
 
 
 def createparser() -> argparse.ArgumentParser:
@@ -99,8 +389,12 @@ def createparser() -> argparse.ArgumentParser:
     # create compare subcommand
     parser_compare = s.add_parser("compare", help="Compare two versions")
     parser_compare.set_defaults(func=cmd_compare)
-    parser_compare.add_argument("version1", help="First version")
-    parser_compare.add_argument("version2", help="Second version")
+    parser_compare.add_argument(
+        "version1", help="First version, or '-' to read from stdin"
+    )
+    parser_compare.add_argument(
+        "version2", help="Second version, or '-' to read from stdin"
+    )
 
     # create bump subcommand
     parser_bump = s.add_parser("bump", help="Bumps a version")
@@ -115,28 +409,83 @@ def createparser() -> argparse.ArgumentParser:
         sb.add_parser("prerelease", help="Bump the prerelease part of the version"),
         sb.add_parser("build", help="Bump the build part of the version"),
     ):
-        p.add_argument("version", help="Version to raise")
+        p.add_argument("version", help="Version to raise, or '-' to read from stdin")
 
     # Create the check subcommand
     parser_check = s.add_parser(
         "check", help="Checks if a string is a valid semver version"
     )
     parser_check.set_defaults(func=cmd_check)
-    parser_check.add_argument("version", help="Version to check")
+    parser_check.add_argument(
+        "version", help="Version to check, or '-' to read from stdin"
+    )
 
     # Create the nextver subcommand
     parser_nextver = s.add_parser(
         "nextver", help="Determines the next version, taking prereleases into account."
     )
     parser_nextver.set_defaults(func=cmd_nextver)
-    parser_nextver.add_argument("version", help="Version to raise")
+    parser_nextver.add_argument(
+        "version", help="Version to raise, or '-' to read from stdin"
+    )
     parser_nextver.add_argument(
         "part", help="One of 'major', 'minor', 'patch', or 'prerelease'"
     )
+
+    # Create the sort subcommand
+    parser_sort = s.add_parser("sort", help="Sort versions by precedence")
+    parser_sort.set_defaults(func=cmd_sort)
+    parser_sort.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="Files with one version per line (default: read from stdin)",
+    )
+    parser_sort.add_argument(
+        "-r", "--reverse", action="store_true", help="Sort in descending order"
+    )
+    parser_sort.add_argument(
+        "-u",
+        "--unique",
+        action="store_true",
+        help="Output only the first of all versions with equal precedence",
+    )
+    parser_sort.add_argument(
+        "--skip-invalid", action="store_true", help="Ignore invalid versions"
+    )
+    parser_sort.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100_000,
+        help="Number of versions sorted in memory (default: %(default)s)",
+    )
+
+    # Create the filter, max, and min subcommands
+    parser_filter = s.add_parser(
+        "filter", help="Print all versions which match an expression"
+    )
+    parser_filter.set_defaults(func=cmd_filter)
+    parser_filter.add_argument(
+        "expression", help="Match expression, for example '>=1.2.0'"
+    )
+    parser_max = s.add_parser("max", help="Print the highest version")
+    parser_max.set_defaults(func=cmd_max)
+    parser_min = s.add_parser("min", help="Print the lowest version")
+    parser_min.set_defaults(func=cmd_min)
+    for p in (parser_filter, parser_max, parser_min):
+        p.add_argument(
+            "files",
+            nargs="*",
+            metavar="FILE",
+            help="Files with one version per line (default: read from stdin)",
+        )
+        p.add_argument(
+            "--skip-invalid", action="store_true", help="Ignore invalid versions"
+        )
     return parser
 
 
-def process(args: argparse.Namespace) -> str:
+def process(args: argparse.Namespace) -> Optional[str]:
     """
     Process the input from the CLI.
 
@@ -172,3 +521,8 @@ def main(cliargs: Optional[List[str]] = None) -> int:
     except (ValueError, TypeError) as err:
         print("ERROR", err, file=sys.stderr)
         return 2
+
+    except OSError as err:
+        # For example, a file passed to sort, filter, max, or min is missing
+        print("ERROR", err, file=sys.stderr)
+        return 2
@@ -0,0 +1,483 @@
+"""
+Containers for many versions.
+
+:class:`VersionIndex` keeps versions sorted by precedence and answers
+range queries with binary searches.
+
+:class:`VersionArray` stores millions of versions in a compact,
+column-oriented format.
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+from ._types import PrecedenceKey, String
+from .range import Range
+from .version import Version
+
+
+class VersionIndex:
+    """
+    A collection of versions, sorted by precedence.
+
+    Versions with the same precedence (for example, with different build
+    parts) are kept in the order they were added.
+
+    .. versionadded:: 3.1.0
+
+    :param versions: the initial versions, either :class:`~semver.version.Version`
+       objects or version strings
+    :param version_class: the class used to parse version strings
+
+    >>> index = semver.VersionIndex(["1.2.0", "2.0.0-rc.1", "1.10.0", "2.0.0"])
+    >>> str(index.max_satisfying("^1.2"))
+    '1.10.0'
+    >>> str(index.latest(prerelease=True))
+    '2.0.0'
+    >>> [str(v) for v in index.satisfying("<2.0.0")]
+    ['1.2.0', '1.10.0', '2.0.0-rc.1']
+    """
+
+    __slots__ = ("_keys", "_version_class", "_versions")
+
+    def __init__(
+        self,
+        versions: Iterable[Union[Version, String]] = (),
+        version_class: Type[Version] = Version,
+    ):
+        self._version_class = version_class
+        items = sorted(
+            (self._coerce(version) for version in versions),
+            key=lambda version: version.precedence_key,
+        )
+        self._versions: List[Version] = items
+        self._keys: List[PrecedenceKey] = [item.precedence_key for item in items]
+
+    def _coerce(self, version: Union[Version, String]) -> Version:
+        """Parse a version string, leave Version objects untouched."""
+        if isinstance(version, Version):
+            return version
+        return self._version_class.parse(version)
+
+    def add(self, version: Union[Version, String]) -> Version:
+        """
+        Add a version to the index.
+
+        The position is found with a binary search in O(log n), but the
+        insertion itself moves the items after it, so adding a version
+        takes O(n) time. To add many versions at once, create a new index
+        from all of them, which sorts them in O(n log n).
+
+        :param version: a :class:`~semver.version.Version` or a version string
+        :return: the added version
+        """
+        version = self._coerce(version)
+        key = version.precedence_key
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._versions.insert(index, version)
+        return version
+
+    def remove(self, version: Union[Version, String]) -> None:
+        """
+        Remove a version from the index.
+
+        The build part must match, too.
+
+        :param version: a :class:`~semver.version.Version` or a version string
+        :raises ValueError: if the version is not in the index
+        """
+        version = self._coerce(version)
+        key = version.precedence_key
+        parts = version.to_tuple()
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, start)
+        for index in range(start, end):
+            if self._versions[index].to_tuple() == parts:
+                del self._keys[index]
+                del self._versions[index]
+                return
+        raise ValueError(f"{version} is not in the index")
+
+    def _bounds(self, rng: Union[Range, str], reverse: bool = False) -> Iterator[range]:
+        """Generate the non-empty index ranges covered by a version range."""
+        if not isinstance(rng, Range):
+            rng = Range(rng)
+        keys = self._keys
+        intervals = reversed(rng.intervals) if reverse else iter(rng.intervals)
+        for low, high in intervals:
+            start = bisect_left(keys, low)
+            end = bisect_left(keys, high, start)
+            if start < end:
+                yield range(start, end)
+
+    def satisfying(self, rng: Union[Range, str]) -> List[Version]:
+        """
+        Return all versions in a range, sorted by precedence.
+
+        :param rng: a :class:`~semver.range.Range` or a range expression
+        :return: the list of versions
+        """
+        return [
+            version
+            for bounds in self._bounds(rng)
+            for version in self._versions[bounds.start : bounds.stop]
+        ]
+
+    def max_satisfying(self, rng: Union[Range, str]) -> Optional[Version]:
+        """
+        Return the highest version in a range.
+
+        :param rng: a :class:`~semver.range.Range` or a range expression
+        :return: the highest version, or None if no version is in the range
+        """
+        for bounds in self._bounds(rng, reverse=True):
+            return self._versions[bounds[-1]]
+        return None
+
+    def min_satisfying(self, rng: Union[Range, str]) -> Optional[Version]:
+        """
+        Return the lowest version in a range.
+
+        :param rng: a :class:`~semver.range.Range` or a range expression
+        :return: the lowest version, or None if no version is in the range
+        """
+        for bounds in self._bounds(rng):
+            return self._versions[bounds[0]]
+        return None
+
+    def latest(self, prerelease: bool = False) -> Optional[Version]:
+        """
+        Return the highest version.
+
+        :param prerelease: if False (the default), ignore prereleases
+        :return: the highest version, or None if there is no such version
+        """
+        for version in reversed(self._versions):
+            if prerelease or not version.prerelease:
+                return version
+        return None
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __iter__(self) -> Iterator[Version]:
+        return iter(self._versions)
+
+    def __reversed__(self) -> Iterator[Version]:
+        return reversed(self._versions)
+
+    @overload
+    def __getitem__(self, index: int) -> Version: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Version]: ...
+
+    def __getitem__(self, index):
+        return self._versions[index]
+
+    def __contains__(self, version: object) -> bool:
+        """Check if a version with the same precedence is in the index."""
+        if not isinstance(version, (Version, str, bytes)):
+            return False
+        key = self._coerce(version).precedence_key
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, [str(v) for v in self._versions])
+
+
+class VersionArray:
+    """
+    A compact sequence of versions.
+
+    Instead of one :class:`~semver.version.Version` object per item, the
+    major, minor, and patch parts are stored in three ``array('Q')``
+    columns. Prerelease and build strings are stored once in a string
+    table and referenced by index. :class:`~semver.version.Version` objects
+    are only created when an item is accessed.
+
+    The numeric parts must fit into 64 bit unsigned integers, otherwise
+    :class:`OverflowError` is raised.
+
+    .. versionadded:: 3.1.0
+
+    :param versions: the initial versions, either :class:`~semver.version.Version`
+       objects or version strings
+    :param version_class: the class of the created version objects and
+       used to parse version strings
+
+    >>> versions = semver.VersionArray(["1.10.0", "1.2.0", "1.2.0-rc.1"])
+    >>> versions.sort()
+    >>> [str(v) for v in versions]
+    ['1.2.0-rc.1', '1.2.0', '1.10.0']
+    >>> versions[1]
+    Version(major=1, minor=2, patch=0, prerelease=None, build=None)
+    """
+
+    __slots__ = (
+        "_build",
+        "_major",
+        "_minor",
+        "_patch",
+        "_prerelease",
+        "_string_ids",
+        "_strings",
+        "_version_class",
+    )
+
+    #: Typecode of the major, minor, and patch columns
+    NUMBER_TYPECODE = "Q"
+    #: The largest number which fits into the major, minor, and patch columns
+    _MAX_NUMBER = 2 ** (8 * array(NUMBER_TYPECODE).itemsize) - 1
+    #: Typecode of the prerelease and build columns (indexes into the strings)
+    STRING_TYPECODE = "I"
+    #: Header of the binary format, see :meth:`tobytes`
+    _HEADER = struct.Struct("<4sQQ")
+    _MAGIC = b"SVA1"
+    _LENGTH = struct.Struct("<I")
+    _CORRUPT = "invalid VersionArray data: truncated or corrupt data"
+
+    def __init__(
+        self,
+        versions: Iterable[Union[Version, String]] = (),
+        version_class: Type[Version] = Version,
+    ):
+        self._version_class = version_class
+        self._major = array(self.NUMBER_TYPECODE)
+        self._minor = array(self.NUMBER_TYPECODE)
+        self._patch = array(self.NUMBER_TYPECODE)
+        self._prerelease = array(self.STRING_TYPECODE)
+        self._build = array(self.STRING_TYPECODE)
+        # Index 0 stands for None
+        self._strings: List[Optional[str]] = [None]
+        self._string_ids: Dict[str, int] = {}
+        self.extend(versions)
+
+    def _string_id(self, string: Optional[str]) -> int:
+        """Return the index of a string in the string table, add it if needed."""
+        if string is None:
+            return 0
+        try:
+            return self._string_ids[string]
+        except KeyError:
+            index = self._string_ids[string] = len(self._strings)
+            self._strings.append(string)
+            return index
+
+    def append(self, version: Union[Version, String]) -> None:
+        """
+        Append a version.
+
+        :param version: a :class:`~semver.version.Version` or a version string
+        """
+        if not isinstance(version, Version):
+            version = self._version_class.parse(version)
+        # Check all numbers before the first column is changed, so a number
+        # which does not fit leaves the columns with the same length:
+        major, minor, patch = version.major, version.minor, version.patch
+        if max(major, minor, patch) > self._MAX_NUMBER:
+            raise OverflowError(
+                "%s does not fit into %s columns" % (version, type(self).__name__)
+            )
+        self._major.append(major)
+        self._minor.append(minor)
+        self._patch.append(patch)
+        self._prerelease.append(self._string_id(version.prerelease))
+        self._build.append(self._string_id(version.build))
+
+    def extend(self, versions: Iterable[Union[Version, String]]) -> None:
+        """
+        Append many versions.
+
+        :param versions: :class:`~semver.version.Version` objects or
+           version strings
+        """
+        for version in versions:
+            self.append(version)
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (self._major, self._minor, self._patch, self._prerelease, self._build)
+
+    def _version(self, index: int) -> Version:
+        strings = self._strings
+        return self._version_class._from_parts(
+            self._major[index],
+            self._minor[index],
+            self._patch[index],
+            strings[self._prerelease[index]],
+            strings[self._build[index]],
+        )
+
+    def _take(self, indexes: Iterable[int]) -> "VersionArray":
+        """Return a new array with the rows at the given indexes."""
+        result = type(self)(version_class=self._version_class)
+        result._strings = self._strings[:]
+        result._string_ids = dict(self._string_ids)
+        indexes = list(indexes)
+        for source, target in zip(self._columns(), result._columns()):
+            target.extend([source[i] for i in indexes])
+        return result
+
+    def precedence_keys(self) -> List[PrecedenceKey]:
+        """
+        Return the precedence keys of all versions.
+
+        The prerelease part of a key is computed only once for each
+        distinct prerelease string.
+
+        :return: a list of keys, see :attr:`Version.precedence_key
+           <semver.version.Version.precedence_key>`
+        """
+        prerelease_keys: Dict[int, PrecedenceKey] = {0: (1,)}
+        for index in set(self._prerelease):
+            if index:
+                prerelease = self._strings[index]
+                prerelease_keys[index] = Version._from_parts(
+                    0, 0, 0, prerelease
+                ).precedence_key[3:]
+        return [
+            (major, minor, patch, *prerelease_keys[prerelease])
+            for major, minor, patch, prerelease in zip(
+                self._major, self._minor, self._patch, self._prerelease
+            )
+        ]
+
+    def argsort(self, reverse: bool = False) -> List[int]:
+        """
+        Return the indexes which would sort the versions by precedence.
+
+        The sort is stable.
+
+        :param reverse: sort in descending order
+        :return: the list of indexes
+        """
+        keys = self.precedence_keys()
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+    def sort(self, reverse: bool = False) -> None:
+        """
+        Sort the versions by precedence in place.
+
+        :param reverse: sort in descending order
+        """
+        order = self.argsort(reverse=reverse)
+        for column in self._columns():
+            column[:] = array(column.typecode, [column[i] for i in order])
+
+    def filter(self, rng: Union[Range, str]) -> "VersionArray":
+        """
+        Return a new array with all versions which are in a range.
+
+        :param rng: a :class:`~semver.range.Range` or a range expression
+        :return: the new array
+        """
+        if not isinstance(rng, Range):
+            rng = Range(rng)
+        contains = rng._contains_key
+        return self._take(
+            index for index, key in enumerate(self.precedence_keys()) if contains(key)
+        )
+
+    def tobytes(self) -> bytes:
+        """
+        Serialize the array into a compact binary format.
+
+        :return: the binary representation, see :meth:`frombytes`
+        """
+        strings = [
+            string.encode("UTF-8") for string in self._strings[1:]  # type: ignore
+        ]
+        chunks = [self._HEADER.pack(self._MAGIC, len(self), len(strings))]
+        for string in strings:
+            chunks.append(self._LENGTH.pack(len(string)))
+            chunks.append(string)
+        for column in self._columns():
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            chunks.append(column.tobytes())
+        return b"".join(chunks)
+
+    @classmethod
+    def frombytes(
+        cls, data: bytes, version_class: Type[Version] = Version
+    ) -> "VersionArray":
+        """
+        Create an array from the output of :meth:`tobytes`.
+
+        :param data: the binary representation
+        :param version_class: the class of the created version objects
+        :return: the new array
+        :raises ValueError: if the data is invalid
+        """
+        try:
+            magic, count, string_count = cls._HEADER.unpack_from(data)
+            if magic != cls._MAGIC:
+                raise ValueError("unknown format %r" % magic)
+            result = cls(version_class=version_class)
+            offset = cls._HEADER.size
+            for _ in range(string_count):
+                (length,) = cls._LENGTH.unpack_from(data, offset)
+                offset += cls._LENGTH.size
+                if offset + length > len(data):
+                    raise ValueError(cls._CORRUPT)
+                string = bytes(data[offset : offset + length]).decode("UTF-8")
+                offset += length
+                result._string_id(string)
+            # tobytes() writes every string once, duplicates would shift
+            # the indexes of the following strings:
+            if len(result._strings) != string_count + 1:
+                raise ValueError(cls._CORRUPT)
+            for column in result._columns():
+                size = count * column.itemsize
+                column.frombytes(data[offset : offset + size])
+                offset += size
+                if sys.byteorder == "big":
+                    column.byteswap()
+        except (struct.error, UnicodeDecodeError) as error:
+            raise ValueError("invalid VersionArray data: %s" % error) from error
+        if offset != len(data) or len(result._build) != count:
+            raise ValueError("invalid VersionArray data: wrong size")
+        if count and max(max(result._prerelease), max(result._build)) > string_count:
+            raise ValueError(cls._CORRUPT)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._major)
+
+    @overload
+    def __getitem__(self, index: int) -> Version: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "VersionArray": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._take(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("VersionArray index out of range")
+        return self._version(index)
+
+    def __iter__(self) -> Iterator[Version]:
+        for index in range(len(self)):
+            yield self._version(index)
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, [str(v) for v in self])
@@ -0,0 +1,471 @@
+"""
+Version ranges as known from npm and Cargo.
+
+A :class:`Range` is compiled once into a sorted list of half-open
+intervals ``[low, high)`` over :attr:`~semver.version.Version.precedence_key`.
+Checking if a version is in a range is a binary search over these intervals.
+
+The following syntax is supported:
+
+* Comparators: ``<1.2.3``, ``<=1.2.3``, ``>1.2.3``, ``>=1.2.3``,
+  ``=1.2.3``, ``==1.2.3``, ``!=1.2.3``, or just ``1.2.3``.
+* X-ranges: ``*``, ``1.x``, ``1.2.*``, or partial versions like ``1.2``.
+* Tilde ranges: ``~1.2.3`` (``>=1.2.3 <1.3.0-0``).
+* Caret ranges: ``^1.2.3`` (``>=1.2.3 <2.0.0-0``), ``^0.2.3``
+  (``>=0.2.3 <0.3.0-0``).
+* Hyphen ranges: ``1.2.3 - 2.3.4`` (``>=1.2.3 <=2.3.4``).
+* Comparators separated by whitespace or commas must all match.
+* Ranges separated by ``||`` are combined, one of them must match.
+
+Unlike npm, prereleases are not treated specially: a version is in a range
+if its precedence is in the range, exactly as :meth:`Version.compare
+<semver.version.Version.compare>` orders versions. A bare version like
+``1.2.3`` means "exactly this version" (as in npm, not as in Cargo).
+"""
+
+import re
+from bisect import bisect_right
+from math import inf
+from typing import Any, Iterable, List, Optional, Tuple, Union, cast
+
+from ._types import PrecedenceKey, String
+from .version import Version
+
+Interval = Tuple[PrecedenceKey, PrecedenceKey]
+
+#: The lowest precedence key, the key of version ``0.0.0-0``
+MIN_KEY: PrecedenceKey = (0, 0, 0, 0, (0, 0))
+#: A key which is greater than the precedence key of any version. It is not
+#: the key of a version, but it compares like one (the first item of a key
+#: is always an int), so it is typed as a key.
+MAX_KEY: PrecedenceKey = cast(PrecedenceKey, (inf,))
+
+#: Regex for one comparator of a range, the version part can be partial
+_COMPARATOR = re.compile(
+    r"""
+    ^
+    (?P<op><=|>=|==|!=|<|>|=|~|\^)?
+    v?
+    (?P<major>0|[1-9]\d*|[xX*])
+    (?:
+        \.(?P<minor>0|[1-9]\d*|[xX*])
+        (?:
+            \.(?P<patch>0|[1-9]\d*|[xX*])
+            (?P<rest>[-+].*)?
+        )?
+    )?
+    $
+    """,
+    re.VERBOSE,
+)
+#: Regex for a hyphen range
+_HYPHEN = re.compile(r"^\s*(?P<low>\S+)\s+-\s+(?P<high>\S+)\s*$")
+#: Regex for an operator which is followed by whitespace
+_OPERATOR_SPACE = re.compile(r"(<=|>=|==|!=|<|>|=|~|\^)\s+")
+
+#: A partial version: major, minor, patch (None for wildcards), prerelease
+Partial = Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]
+
+
+def _floor(major: int, minor: int, patch: int) -> PrecedenceKey:
+    """Return the key of the lowest version ``major.minor.patch-0``."""
+    return (major, minor, patch, 0, (0, 0))
+
+
+def _successor(key: PrecedenceKey) -> PrecedenceKey:
+    """Return the key of the lowest version which is greater than ``key``."""
+    if key[3]:
+        # A release is followed by the lowest prerelease of the next patch
+        return _floor(key[0], key[1], key[2] + 1)  # type: ignore
+    # A prerelease is followed by the same prerelease with an extra ".0"
+    return key + ((0, 0),)
+
+
+def _key_to_version(key: PrecedenceKey) -> Version:
+    """Convert a precedence key back into a version (without build)."""
+    if key[3]:
+        return Version._from_parts(*key[:3])  # type: ignore
+    prerelease = ".".join(str(value) for _, value in key[4:])  # type: ignore
+    return Version._from_parts(*key[:3], prerelease)  # type: ignore
+
+
+def _parse_partial(text: str) -> Tuple[Optional[str], Partial]:
+    """
+    Parse a comparator into an operator and a partial version.
+
+    :param text: a comparator like ``>=1.2``
+    :return: a tuple with the operator (or None) and the partial version
+    :raises ValueError: if the comparator is invalid
+    """
+    match = _COMPARATOR.match(text)
+    if match is None:
+        raise ValueError(f"{text!r} is not a valid range comparator")
+    parts: List[Optional[int]] = []
+    for name in ("major", "minor", "patch"):
+        value = match.group(name)
+        if value is None or value in "xX*":
+            break
+        parts.append(int(value))
+    parts.extend([None] * (3 - len(parts)))
+
+    prerelease = None
+    rest = match.group("rest")
+    if rest:
+        if parts[2] is None:
+            raise ValueError(f"{text!r} is not a valid range comparator")
+        # Let Version validate the prerelease and build part
+        version = Version.parse("%d.%d.%d%s" % (*parts, rest))  # type: ignore
+        prerelease = version.prerelease
+    return match.group("op"), (parts[0], parts[1], parts[2], prerelease)
+
+
+def _lower_bound(partial: Partial) -> PrecedenceKey:
+    """Return the key of the lowest version matched by a partial version."""
+    major, minor, patch, prerelease = partial
+    if major is None:
+        return MIN_KEY
+    return Version(major, minor or 0, patch or 0, prerelease).precedence_key
+
+
+def _upper_bound(partial: Partial) -> PrecedenceKey:
+    """Return the key after the highest version matched by a partial version."""
+    major, minor, patch, _ = partial
+    if major is None:
+        return MAX_KEY
+    if minor is None:
+        return _floor(major + 1, 0, 0)
+    if patch is None:
+        return _floor(major, minor + 1, 0)
+    return _successor(_lower_bound(partial))
+
+
+def _comparator_intervals(op: Optional[str], partial: Partial) -> List[Interval]:
+    """
+    Convert a single comparator into a list of intervals.
+
+    :param op: the operator of the comparator (or None)
+    :param partial: the partial version of the comparator
+    :return: the normalized list of intervals
+    """
+    low, high = _lower_bound(partial), _upper_bound(partial)
+    major, minor, patch, _ = partial
+
+    if op in (None, "=", "=="):
+        intervals = [(low, high)]
+    elif op == "!=":
+        intervals = [(MIN_KEY, low), (high, MAX_KEY)]
+    elif op == ">":
+        intervals = [(high, MAX_KEY)]
+    elif op == ">=":
+        intervals = [(low, MAX_KEY)]
+    elif op == "<":
+        if major is not None and patch is None:
+            # "<1.2" excludes the prereleases of 1.2.0
+            low = _floor(*low[:3])  # type: ignore
+        intervals = [(MIN_KEY, low)]
+    elif op == "<=":
+        intervals = [(MIN_KEY, high)]
+    elif op == "~":
+        if major is None or minor is None:
+            intervals = [(low, high)]
+        else:
+            intervals = [(low, _floor(major, minor + 1, 0))]
+    else:  # op == "^"
+        if major is None:
+            intervals = [(low, high)]
+        elif major or minor is None:
+            intervals = [(low, _floor(major + 1, 0, 0))]
+        elif minor or patch is None:
+            intervals = [(low, _floor(0, minor + 1, 0))]
+        else:
+            intervals = [(low, _floor(0, 0, patch + 1))]  # type: ignore
+    return [(lo, hi) for lo, hi in intervals if lo < hi]
+
+
+def _intersect(left: List[Interval], right: List[Interval]) -> List[Interval]:
+    """Return the intersection of two normalized lists of intervals."""
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        low = max(left[i][0], right[j][0])
+        high = min(left[i][1], right[j][1])
+        if low < high:
+            result.append((low, high))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _union(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sort and merge overlapping or adjacent intervals."""
+    result: List[Interval] = []
+    for low, high in sorted(intervals):
+        if result and low <= result[-1][1]:
+            if high > result[-1][1]:
+                result[-1] = (result[-1][0], high)
+        else:
+            result.append((low, high))
+    return result
+
+
+def _complement(intervals: List[Interval]) -> List[Interval]:
+    """Return the gaps of a normalized list of intervals."""
+    result = []
+    low = MIN_KEY
+    for start, end in intervals:
+        if low < start:
+            result.append((low, start))
+        low = end
+    if low < MAX_KEY:
+        result.append((low, MAX_KEY))
+    return result
+
+
+def _parse_range(expression: str) -> List[Interval]:
+    """
+    Compile a range expression into a normalized list of intervals.
+
+    :param expression: the range expression
+    :return: the sorted list of disjoint intervals
+    :raises ValueError: if the expression is invalid
+    """
+    intervals: List[Interval] = []
+    for alternative in expression.split("||"):
+        hyphen = _HYPHEN.match(alternative)
+        if hyphen is not None:
+            low_op, low = _parse_partial(hyphen.group("low"))
+            high_op, high = _parse_partial(hyphen.group("high"))
+            if low_op or high_op:
+                raise ValueError(f"{alternative!r} is not a valid hyphen range")
+            comparators = [[(_lower_bound(low), _upper_bound(high))]]
+        else:
+            alternative = _OPERATOR_SPACE.sub(r"\1", alternative)
+            comparators = [
+                _comparator_intervals(*_parse_partial(text))
+                for text in alternative.replace(",", " ").split()
+            ]
+        current = [(MIN_KEY, MAX_KEY)]
+        for comparator in comparators:
+            current = _intersect(current, comparator)
+        intervals.extend(current)
+    return _union(intervals)
+
+
+class Range:
+    """
+    A range of versions, compiled from an npm or Cargo style expression.
+
+    See :mod:`semver.range` for the supported syntax.
+
+    .. versionadded:: 3.1.0
+
+    :param expression: the range expression
+    :raises ValueError: if the expression is invalid
+
+    >>> rng = semver.Range("^1.2.3 || ~0.9")
+    >>> "1.5.0" in rng
+    True
+    >>> semver.Version.parse("2.0.0") in rng
+    False
+    >>> str(rng)
+    '>=0.9.0 <0.10.0-0 || >=1.2.3 <2.0.0-0'
+    """
+
+    __slots__ = ("_intervals", "_lows")
+
+    def __init__(self, expression: str):
+        if not isinstance(expression, str):
+            raise TypeError("not expecting type '%s'" % type(expression))
+        self._set_intervals(_parse_range(expression))
+
+    def _set_intervals(self, intervals: List[Interval]) -> None:
+        self._intervals = tuple(intervals)
+        self._lows = [low for low, _ in intervals]
+
+    @classmethod
+    def _from_intervals(cls, intervals: List[Interval]) -> "Range":
+        """Create a range from a normalized list of intervals."""
+        rng = cls.__new__(cls)
+        rng._set_intervals(intervals)
+        return rng
+
+    @property
+    def intervals(self) -> Tuple[Interval, ...]:
+        """
+        The sorted, disjoint intervals of this range (read-only).
+
+        Each interval is a tuple ``(low, high)`` of precedence keys, where
+        ``low`` is included and ``high`` is excluded. The keys
+        :data:`MIN_KEY` and :data:`MAX_KEY` stand for the lowest possible
+        version and "no upper limit".
+        """
+        return self._intervals
+
+    def _contains_key(self, key: PrecedenceKey) -> bool:
+        """Check if a precedence key is in this range."""
+        index = bisect_right(self._lows, key) - 1
+        return index >= 0 and key < self._intervals[index][1]
+
+    def __contains__(self, version: Union[Version, String]) -> bool:
+        """
+        Check if a version is in this range.
+
+        :param version: a :class:`~semver.version.Version` or a version string
+        :return: True if the version is in the range, otherwise False
+        """
+        if not isinstance(version, Version):
+            version = Version.parse(version)
+        return self._contains_key(version.precedence_key)
+
+    def match(self, version: Union[Version, String]) -> bool:
+        """
+        Check if a version is in this range, same as ``version in range``.
+
+        :param version: a :class:`~semver.version.Version` or a version string
+        :return: True if the version is in the range, otherwise False
+        """
+        return version in self
+
+    @staticmethod
+    def _coerce(other: Union["Range", str]) -> "Range":
+        """Convert an expression into a range."""
+        if isinstance(other, Range):
+            return other
+        return Range(other)
+
+    def intersection(self, *others: Union["Range", str]) -> "Range":
+        """
+        Return a range with the versions which are in this and all other
+        ranges, same as ``self & other``.
+
+        :param others: ranges or range expressions
+        :return: the new range
+
+        >>> str(semver.Range("^1.2").intersection("~1.4", ">=1.4.2"))
+        '>=1.4.2 <1.5.0-0'
+        """
+        intervals = list(self._intervals)
+        for other in others:
+            intervals = _intersect(intervals, list(self._coerce(other)._intervals))
+        return self._from_intervals(intervals)
+
+    def union(self, *others: Union["Range", str]) -> "Range":
+        """
+        Return a range with the versions which are in this or any other
+        range, same as ``self | other``.
+
+        :param others: ranges or range expressions
+        :return: the new range
+
+        >>> str(semver.Range("~1.2").union("1.3.x"))
+        '>=1.2.0 <1.3.0-0 || >=1.3.0 <1.4.0-0'
+        """
+        intervals = list(self._intervals)
+        for other in others:
+            intervals.extend(self._coerce(other)._intervals)
+        return self._from_intervals(_union(intervals))
+
+    def difference(self, *others: Union["Range", str]) -> "Range":
+        """
+        Return a range with the versions which are in this range, but not
+        in any of the other ranges, same as ``self - other``.
+
+        :param others: ranges or range expressions
+        :return: the new range
+
+        >>> str(semver.Range("^1.2").difference("1.4.x"))
+        '>=1.2.0 <1.4.0 || >=1.5.0-0 <2.0.0-0'
+        """
+        intervals = list(self._intervals)
+        for other in others:
+            gaps = _complement(list(self._coerce(other)._intervals))
+            intervals = _intersect(intervals, gaps)
+        return self._from_intervals(intervals)
+
+    def complement(self) -> "Range":
+        """
+        Return a range with all versions which are not in this range,
+        same as ``~self``.
+
+        :return: the new range
+
+        >>> str(semver.Range("^1.2").complement())
+        '<1.2.0 || >=2.0.0-0'
+        """
+        return self._from_intervals(_complement(list(self._intervals)))
+
+    def is_empty(self) -> bool:
+        """
+        Check if no version is in this range.
+
+        :return: True if the range is empty, otherwise False
+
+        >>> semver.Range(">=2.0.0 <1.0.0").is_empty()
+        True
+        """
+        return not self._intervals
+
+    def is_subset(self, other: Union["Range", str]) -> bool:
+        """
+        Check if all versions of this range are also in the other range.
+
+        :param other: a range or a range expression
+        :return: True if this range is a subset of other, otherwise False
+
+        >>> semver.Range("~1.4.2").is_subset("^1.2")
+        True
+        >>> semver.Range("^1.2").is_subset("~1.4.2")
+        False
+        """
+        other = self._coerce(other)
+        return _intersect(list(self._intervals), list(other._intervals)) == list(
+            self._intervals
+        )
+
+    def __and__(self, other: Union["Range", str]) -> "Range":
+        return self.intersection(other)
+
+    def __or__(self, other: Union["Range", str]) -> "Range":
+        return self.union(other)
+
+    def __sub__(self, other: Union["Range", str]) -> "Range":
+        return self.difference(other)
+
+    def __invert__(self) -> "Range":
+        return self.complement()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self._intervals == other._intervals
+
+    def __hash__(self) -> int:
+        return hash(self._intervals)
+
+    def __str__(self) -> str:
+        if not self._intervals:
+            return "<0.0.0-0"
+        alternatives = []
+        for low, high in self._intervals:
+            if low == MIN_KEY and high == MAX_KEY:
+                alternatives.append("*")
+            elif high == MAX_KEY:
+                alternatives.append(">=%s" % _key_to_version(low))
+            elif low == MIN_KEY:
+                alternatives.append("<%s" % _key_to_version(high))
+            elif high == _successor(low):
+                alternatives.append(str(_key_to_version(low)))
+            else:
+                alternatives.append(
+                    ">=%s <%s" % (_key_to_version(low), _key_to_version(high))
+                )
+        return " || ".join(alternatives)
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, str(self))
+
+
+#: Alternative name of :class:`Range`
+VersionRange = Range
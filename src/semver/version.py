@@ -1,12 +1,18 @@
 """Version handling by a semver compatible version class."""
 
+import operator
 import re
-from functools import wraps
+import sys
+from contextlib import suppress
+from functools import lru_cache, partial
 from typing import (
     Any,
     ClassVar,
     Dict,
+    Generic,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Pattern,
     SupportsInt,
@@ -18,8 +24,12 @@ from typing import (
     Type,
     TypeVar,
 )
+from weakref import WeakValueDictionary
 
+from ._encoding import decode_sortable, encode_sortable, pack, unpack
+from ._scanner import Parts, ScanError, check_limits, scan
 from ._types import (
+    PrecedenceKey,
     VersionTuple,
     VersionDict,
     VersionIterator,
@@ -31,27 +41,81 @@ from ._types import (
 Comparable = Union["Version", Dict[str, VersionPart], Collection[VersionPart], str]
 Comparator = Callable[["Version", Comparable], bool]
 
+#: Types which :meth:`Version.compare` converts into a Version
+_COERCIBLE_TYPES = (dict, tuple, list, *String.__args__)  # type: ignore
+
+#: The smallest limit of digits which :func:`sys.set_int_max_str_digits`
+#: allows; strings up to this length never hit the limit of :func:`int`
+_MIN_INT_MAX_STR_DIGITS = 640
+#: The result of :meth:`Version._check` for an invalid string without reason
+_INVALID = ScanError("is not valid SemVer string", 0)
+
 T = TypeVar("T", bound="Version")
 T_cmp = TypeVar("T_cmp", tuple, str, int)
 
+#: The interned versions, see :meth:`Version.intern`. The keys are the class
+#: and all parts of a version. The values are weak references, so a version
+#: is dropped from the pool when it is not used anymore.
+intern_pool: "WeakValueDictionary[Tuple[Any, ...], Version]" = WeakValueDictionary()
+
+
+def _restore(
+    cls: Type[T],
+    major: int,
+    minor: int,
+    patch: int,
+    prerelease: Optional[str] = None,
+    build: Optional[str] = None,
+) -> T:
+    """Recreate a pickled version without validating its parts again."""
+    version = object.__new__(cls)
+    version._major = major
+    version._minor = minor
+    version._patch = patch
+    version._prerelease = prerelease
+    version._build = build
+    return version
+
+
+def _increment_digits(digits: str) -> str:
+    """
+    Return ``str(int(digits) + 1)``.
 
-def _comparator(operator: Comparator) -> Comparator:
-    """Wrap a Version binary op method in a type-check."""
+    ASCII digits are incremented as a string, so numbers of any length
+    work in linear time.
+    """
+    if not digits.isascii():
+        return str(int(digits) + 1)
+    stripped = digits.rstrip("9")
+    nines = len(digits) - len(stripped)
+    if not stripped:
+        return "1" + "0" * nines
+    result = stripped[:-1] + chr(ord(stripped[-1]) + 1) + "0" * nines
+    return result.lstrip("0")
 
-    @wraps(operator)
-    def wrapper(self: "Version", other: Comparable) -> bool:
-        comparable_types = (
-            type(self),
-            dict,
-            tuple,
-            list,
-            *String.__args__,  # type: ignore
-        )
-        if not isinstance(other, comparable_types):
+
+def _comparator(op: Callable[[Any, Any], bool]) -> Comparator:
+    """
+    Create a Version binary op method from an operator function.
+
+    Operands of the same class are compared through their precedence keys
+    directly, unless the class overrides :meth:`Version.compare`. All other
+    operands are type-checked and converted by :meth:`Version.compare`.
+    """
+
+    def method(self: "Version", other: Comparable) -> bool:
+        if other.__class__ is self.__class__ and self._default_compare:
+            try:
+                return op(self._key, other._key)  # type: ignore
+            except AttributeError:
+                return op(self.precedence_key, other.precedence_key)  # type: ignore
+        if not isinstance(other, (type(self), *_COERCIBLE_TYPES)):
             return NotImplemented
-        return operator(self, other)
+        return op(self.compare(other), 0)
 
-    return wrapper
+    method.__name__ = "__%s__" % op.__name__
+    method.__qualname__ = "Version.%s" % method.__name__
+    return method
 
 
 def _cmp(a: T_cmp, b: T_cmp) -> int:
@@ -72,13 +136,38 @@ class Version:
     :param build: an optional build string
     """
 
-    __slots__ = ("_major", "_minor", "_patch", "_prerelease", "_build")
+    __slots__ = (
+        "__weakref__",
+        "_build",
+        "_hash",
+        "_key",
+        "_major",
+        "_minor",
+        "_patch",
+        "_prerelease",
+        "_str",
+    )
+
+    #: The cached :attr:`precedence_key` (unset until it is first used)
+    _key: PrecedenceKey
+    #: The cached result of :meth:`__hash__` (unset until it is first used)
+    _hash: int
+    #: The cached result of :meth:`__str__` (unset until it is first used)
+    _str: str
 
     #: The names of the different parts of a version
-    NAMES: ClassVar[Tuple[str, ...]] = tuple([item[1:] for item in __slots__])
+    NAMES: ClassVar[Tuple[str, ...]] = (
+        "major",
+        "minor",
+        "patch",
+        "prerelease",
+        "build",
+    )
 
-    #: Regex for number in a build
-    _LAST_NUMBER: ClassVar[Pattern[str]] = re.compile(r"(?:[^\d]*(\d+)[^\d]*)+")
+    #: Regex for the first number in a reversed string, which is the last number
+    #: of the original string. It is anchored and does not backtrack, so it runs
+    #: in linear time.
+    _LAST_NUMBER_REVERSED: ClassVar[Pattern[str]] = re.compile(r"\D*(\d+)")
     #: Regex for number in a prerelease
     _LAST_PRERELEASE: ClassVar[Pattern[str]] = re.compile(r"^(.*\.)?(\d+)$")
     #: Regex template for a semver version
@@ -115,6 +204,43 @@ class Version:
         _REGEX_TEMPLATE.format(opt_patch="?", opt_minor="?"),
         re.VERBOSE,
     )
+    #: The maximum length of a version string which :meth:`parse` accepts,
+    #: or None for no limit
+    MAX_LENGTH: ClassVar[Optional[int]] = None
+    #: The maximum number of prerelease identifiers and of build identifiers
+    #: which :meth:`parse` accepts, or None for no limit
+    MAX_IDENTIFIERS: ClassVar[Optional[int]] = None
+    #: The maximum number of digits of the major, minor, and patch parts and
+    #: of numeric prerelease identifiers which :meth:`parse` accepts, or None
+    #: for no limit
+    MAX_DIGITS: ClassVar[Optional[int]] = None
+    #: Parse with a hand-written scanner instead of :attr:`_REGEX`, which
+    #: guarantees linear time in the length of the string
+    LINEAR_PARSING: ClassVar[bool] = False
+    #: Parse caches of a class, see :meth:`enable_parse_cache`
+    _parse_caches: ClassVar[Optional[Dict[bool, Callable[[str], Any]]]] = None
+    #: Compiled match expressions of a class, see :func:`compile_match`
+    _match_cache: ClassVar[Optional[Callable[[str], Any]]] = None
+    #: False if a class overrides :meth:`compare`, which the comparison
+    #: operators then have to call (set by :meth:`__init_subclass__`)
+    _default_compare: ClassVar[bool] = True
+    #: False if a class overrides :meth:`parse` or :meth:`_parse`, whose
+    #: checks the non-raising methods like :meth:`is_valid` then respect
+    _default_parser: ClassVar[bool] = True
+    #: False if a class overrides :meth:`__init__`, which can reject more
+    #: versions than the regular expression
+    _default_init: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The methods which the class or its bases (below Version) override
+        mro = cls.__mro__
+        overridden = {
+            name for klass in mro[: mro.index(Version)] for name in vars(klass)
+        }
+        cls._default_compare = "compare" not in overridden
+        cls._default_parser = not {"parse", "_parse"} & overridden
+        cls._default_init = "__init__" not in overridden
 
     def __init__(
         self,
@@ -139,8 +265,66 @@ class Version:
         self._prerelease = None if prerelease is None else str(prerelease)
         self._build = None if build is None else str(build)
 
+    @classmethod
+    def _from_parts(
+        cls: Type[T],
+        major: int,
+        minor: int = 0,
+        patch: int = 0,
+        prerelease: Optional[str] = None,
+        build: Optional[str] = None,
+    ) -> T:
+        """
+        Create a version from trusted parts without validating them.
+
+        The parts have to be what :meth:`__init__` would store: non-negative
+        ``int`` numbers, and ``str`` or None for prerelease and build. If a
+        subclass overrides :meth:`__init__`, it is called as usual.
+        """
+        if cls.__init__ is not Version.__init__:  # type: ignore
+            return cls(major, minor, patch, prerelease, build)
+        version = object.__new__(cls)
+        version._major = major
+        version._minor = minor
+        version._patch = patch
+        version._prerelease = prerelease
+        version._build = build
+        return version
+
+    @classmethod
+    def from_tuple_unchecked(cls: Type[T], parts: VersionTuple) -> T:
+        """
+        Create a version from a tuple of parts without validating them.
+
+        This is a fast alternative to ``Version(*parts)`` for parts which
+        are known to be valid, for example the result of :meth:`to_tuple`
+        or parts read from a trusted database. The numbers have to be
+        non-negative ``int`` objects, prerelease and build have to be
+        ``str`` or None. Invalid parts are *not* detected and lead to
+        undefined behavior later.
+
+        If a subclass overrides :meth:`__init__`, it is called as usual.
+
+        .. versionadded:: 3.1.0
+
+        :param parts: major, minor, patch, prerelease, and build; the
+           trailing parts can be omitted
+        :return: a new instance
+
+        >>> Version.from_tuple_unchecked((1, 2, 3, "rc.1", None))
+        Version(major=1, minor=2, patch=3, prerelease='rc.1', build=None)
+        """
+        return cls._from_parts(*parts)
+
     @classmethod
     def _nat_cmp(cls, a: Optional[str], b: Optional[str]) -> int:
+        """
+        Compare two prerelease (or build) strings.
+
+        :meth:`compare` no longer uses this method (it compares
+        :attr:`precedence_key` instead); it is kept for compatibility.
+        """
+
         def cmp_prerelease_tag(a, b):
             if isinstance(a, int) and isinstance(b, int):
                 return _cmp(a, b)
@@ -206,6 +390,49 @@ class Version:
     def build(self, value):
         raise AttributeError("attribute 'build' is readonly")
 
+    @property
+    def precedence_key(self) -> PrecedenceKey:
+        """
+        A key which orders versions by their precedence (read-only).
+
+        Two versions compare equal if, and only if, their keys are equal.
+        The key is computed on first access and cached afterwards.
+
+        The key is a tuple which starts with the major, minor, and patch
+        part. A version without a prerelease continues with ``1``.
+        A version with a prerelease continues with ``0`` and one
+        tuple for each dot-separated prerelease identifier: ``(0, number)``
+        for numeric identifiers and ``(1, string)`` for alphanumeric
+        identifiers. The build part is ignored.
+
+        .. versionadded:: 3.1.0
+
+        >>> Version.parse("1.2.3").precedence_key
+        (1, 2, 3, 1)
+        >>> Version.parse("1.2.3-rc.1+build.5").precedence_key
+        (1, 2, 3, 0, (1, 'rc'), (0, 1))
+        """
+        try:
+            return self._key
+        except AttributeError:
+            pass
+        prerelease = self._prerelease
+        if prerelease:
+            identifiers = [
+                (0, int(x)) if x.isdigit() else (1, x) for x in prerelease.split(".")
+            ]
+            key: PrecedenceKey = (
+                self._major,
+                self._minor,
+                self._patch,
+                0,
+                *identifiers,
+            )
+        else:
+            key = (self._major, self._minor, self._patch, 1)
+        self._key = key
+        return key
+
     def to_tuple(self) -> VersionTuple:
         """
         Convert the Version object to a tuple.
@@ -243,6 +470,132 @@ class Version:
             build=self.build,
         )
 
+    def to_sortable_bytes(self) -> bytes:
+        """
+        Encode the version into bytes which sort by precedence.
+
+        Comparing the results byte by byte (like ``memcmp``, or
+        :class:`bytes` comparisons in Python) gives the same order as
+        comparing the versions, so the bytes can be used as keys in
+        key-value stores or as ``BLOB`` columns in databases. Versions
+        with the same precedence but different build parts are ordered
+        by their build part.
+
+        .. versionadded:: 3.1.0
+
+        :return: the encoded version, see :meth:`from_sortable_bytes`
+        :raises ValueError: if a numeric prerelease identifier has leading
+            zeros, which would change its value, or if the prerelease part
+            is an empty string
+
+        >>> v1 = Version.parse("1.9.0").to_sortable_bytes()
+        >>> v2 = Version.parse("1.10.0-rc.1").to_sortable_bytes()
+        >>> v1 < v2
+        True
+        """
+        return encode_sortable(self.to_tuple())
+
+    @classmethod
+    def from_sortable_bytes(cls: Type[T], data: bytes) -> T:
+        """
+        Create a version from the output of :meth:`to_sortable_bytes`.
+
+        .. versionadded:: 3.1.0
+
+        :param data: the encoded version
+        :return: a new instance
+        :raises ValueError: if *data* is not a valid encoding
+
+        >>> data = Version.parse("1.2.3-rc.1+build.4").to_sortable_bytes()
+        >>> Version.from_sortable_bytes(data)
+        Version(major=1, minor=2, patch=3, prerelease='rc.1', build='build.4')
+        """
+        return cls._from_parts(*decode_sortable(bytes(data)))
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the version into a compact binary format.
+
+        The major, minor, and patch parts are stored as 64 bit unsigned
+        integers, followed by the UTF-8 encoded prerelease and build parts.
+        Unlike :meth:`to_sortable_bytes`, the result does not sort by
+        precedence, but is faster to create and to decode.
+
+        .. versionadded:: 3.1.0
+
+        :return: the encoded version, see :meth:`from_bytes`
+        :raises OverflowError: if a number does not fit into 64 bits, or the
+            prerelease or build part is 4 GiB or longer
+
+        >>> len(Version.parse("1.2.3-rc.1").to_bytes())
+        36
+        """
+        data = bytearray()
+        pack(self.to_tuple(), data)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls: Type[T], data: bytes) -> T:
+        """
+        Create a version from the output of :meth:`to_bytes`.
+
+        .. versionadded:: 3.1.0
+
+        :param data: the encoded version
+        :return: a new instance
+        :raises ValueError: if *data* is not a valid encoding
+
+        >>> Version.from_bytes(Version.parse("1.2.3-rc.1").to_bytes())
+        Version(major=1, minor=2, patch=3, prerelease='rc.1', build=None)
+        """
+        parts, offset = unpack(data)
+        if offset != len(data):
+            raise ValueError("unexpected data after the version")
+        return cls._from_parts(*parts)
+
+    @staticmethod
+    def dumps_many(versions: Iterable["Version"]) -> bytes:
+        """
+        Encode many versions into one buffer.
+
+        The result is the concatenation of the :meth:`to_bytes` encodings,
+        so buffers can also be concatenated or written to a stream.
+
+        .. versionadded:: 3.1.0
+
+        :param versions: the versions to encode
+        :return: the encoded versions, see :meth:`loads_many`
+        :raises OverflowError: if a number does not fit into 64 bits, or the
+            prerelease or build part is 4 GiB or longer
+        """
+        data = bytearray()
+        for version in versions:
+            pack(version.to_tuple(), data)
+        return bytes(data)
+
+    @classmethod
+    def loads_many(cls: Type[T], data: bytes) -> List[T]:
+        """
+        Decode the output of :meth:`dumps_many`.
+
+        .. versionadded:: 3.1.0
+
+        :param data: the encoded versions
+        :return: a list of new instances
+        :raises ValueError: if *data* is not a valid encoding
+
+        >>> data = Version.dumps_many([Version(1), Version(2, 0, 0, "rc.1")])
+        >>> [str(v) for v in Version.loads_many(data)]
+        ['1.0.0', '2.0.0-rc.1']
+        """
+        result = []
+        offset = 0
+        size = len(data)
+        while offset < size:
+            parts, offset = unpack(data, offset)
+            result.append(cls._from_parts(*parts))
+        return result
+
     def __iter__(self) -> VersionIterator:
         """Return iter(self)."""
         yield from self.to_tuple()
@@ -269,16 +622,21 @@ class Version:
         """
         Look for the last sequence of number(s) in a string and increment.
 
+        The number keeps its leading zeros, as long as the incremented number
+        fits into them.
+
         :param string: the string to search for.
         :return: the incremented string
 
         Source:
         http://code.activestate.com/recipes/442460-increment-numbers-in-a-string/#c1
         """
-        match = Version._LAST_NUMBER.search(string)
+        match = Version._LAST_NUMBER_REVERSED.match(string[::-1])
         if match:
-            next_ = str(int(match.group(1)) + 1)
-            start, end = match.span(1)
+            # Convert the span in the reversed string back:
+            start = len(string) - match.end(1)
+            end = len(string) - match.start(1)
+            next_ = _increment_digits(string[start:end])
             string = string[: max(end - len(next_), start)] + next_ + string[end:]
         return string
 
@@ -294,7 +652,7 @@ class Version:
         Version(major=4, minor=0, patch=0, prerelease=None, build=None)
         """
         cls = type(self)
-        return cls(self._major + 1)
+        return cls._from_parts(self._major + 1)
 
     def bump_minor(self) -> "Version":
         """
@@ -308,7 +666,7 @@ class Version:
         Version(major=3, minor=5, patch=0, prerelease=None, build=None)
         """
         cls = type(self)
-        return cls(self._major, self._minor + 1)
+        return cls._from_parts(self._major, self._minor + 1)
 
     def bump_patch(self) -> "Version":
         """
@@ -322,7 +680,7 @@ class Version:
         Version(major=3, minor=4, patch=6, prerelease=None, build=None)
         """
         cls = type(self)
-        return cls(self._major, self._minor, self._patch + 1)
+        return cls._from_parts(self._major, self._minor, self._patch + 1)
 
     def bump_prerelease(
         self,
@@ -369,7 +727,7 @@ class Version:
             else:
                 prerelease = str(token) + ".1"
 
-        return cls(self._major, self._minor, patch, prerelease)
+        return cls._from_parts(self._major, self._minor, patch, prerelease)
 
     def bump_build(self, token: Optional[str] = "build") -> "Version":
         """
@@ -396,7 +754,9 @@ build='build.10')
             build = str(token) + ".0"
 
         build = cls._increment_string(build)
-        return cls(self._major, self._minor, self._patch, self._prerelease, build)
+        return cls._from_parts(
+            self._major, self._minor, self._patch, self._prerelease, build
+        )
 
     def compare(self, other: Comparable) -> int:
         """
@@ -426,23 +786,7 @@ build='build.10')
                 f"but got {type(other)}"
             )
 
-        v1 = self.to_tuple()[:3]
-        v2 = other.to_tuple()[:3]
-        x = _cmp(v1, v2)
-        if x:
-            return x
-
-        rc1, rc2 = self.prerelease, other.prerelease
-        rccmp = self._nat_cmp(rc1, rc2)
-
-        if not rccmp:
-            return 0
-        if not rc1:
-            return 1
-        elif not rc2:
-            return -1
-
-        return rccmp
+        return _cmp(self.precedence_key, other.precedence_key)
 
     def next_version(self, part: str, prerelease_token: str = "rc") -> "Version":
         """
@@ -484,29 +828,12 @@ build='build.10')
         else:
             return version.bump_prerelease(prerelease_token, bump_when_empty=True)
 
-    @_comparator
-    def __eq__(self, other: Comparable) -> bool:  # type: ignore
-        return self.compare(other) == 0
-
-    @_comparator
-    def __ne__(self, other: Comparable) -> bool:  # type: ignore
-        return self.compare(other) != 0
-
-    @_comparator
-    def __lt__(self, other: Comparable) -> bool:
-        return self.compare(other) < 0
-
-    @_comparator
-    def __le__(self, other: Comparable) -> bool:
-        return self.compare(other) <= 0
-
-    @_comparator
-    def __gt__(self, other: Comparable) -> bool:
-        return self.compare(other) > 0
-
-    @_comparator
-    def __ge__(self, other: Comparable) -> bool:
-        return self.compare(other) >= 0
+    __eq__ = _comparator(operator.eq)  # type: ignore
+    __ne__ = _comparator(operator.ne)  # type: ignore
+    __lt__ = _comparator(operator.lt)
+    __le__ = _comparator(operator.le)
+    __gt__ = _comparator(operator.gt)
+    __ge__ = _comparator(operator.ge)
 
     def __getitem__(
         self, index: Union[int, slice]
@@ -548,20 +875,125 @@ build='build.10')
             raise IndexError("Version part undefined")
         return part
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Support pickling with a minimal tuple of the version parts.
+
+        Trailing empty prerelease and build parts are omitted, and the
+        cached precedence key is not pickled. Attributes stored in the
+        ``__dict__`` or in the ``__slots__`` of a subclass instance are
+        pickled as its state.
+        """
+        args: Tuple[Any, ...] = (type(self), *self.to_tuple())
+        while len(args) > 4 and args[-1] is None:
+            args = args[:-1]
+        state = getattr(self, "__dict__", None) or None
+        slots = self._subclass_slots()
+        if slots:
+            return (_restore, args, (state, slots))
+        if state:
+            return (_restore, args, state)
+        return (_restore, args)
+
+    def __setstate__(self, state: Any) -> None:
+        """Restore the state pickled by :meth:`__reduce__`."""
+        if isinstance(state, tuple):
+            state, slots = state
+            for name, value in slots.items():
+                object.__setattr__(self, name, value)
+        if state:
+            self.__dict__.update(state)
+
+    def _subclass_slots(self) -> Dict[str, Any]:
+        """Return the values of the slots which subclasses add to Version."""
+        result: Dict[str, Any] = {}
+        for klass in type(self).__mro__:
+            if klass is Version:
+                break
+            names = klass.__dict__.get("__slots__", ())
+            for name in (names,) if isinstance(names, str) else names:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                # Private names are mangled like attribute access in the class
+                if name.startswith("__") and not name.endswith("__"):
+                    name = "_%s%s" % (klass.__name__.lstrip("_"), name)
+                # An unset slot stays unset
+                with suppress(AttributeError):
+                    result[name] = getattr(self, name)
+        return result
+
     def __repr__(self) -> str:
         s = ", ".join("%s=%r" % (key, val) for key, val in self.to_dict().items())
         return "%s(%s)" % (type(self).__name__, s)
 
     def __str__(self) -> str:
-        version = "%d.%d.%d" % (self.major, self.minor, self.patch)
-        if self.prerelease:
-            version += "-%s" % self.prerelease
-        if self.build:
-            version += "+%s" % self.build
+        # The string is computed on first use and cached afterwards
+        try:
+            return self._str
+        except AttributeError:
+            pass
+        version = "%d.%d.%d" % (self._major, self._minor, self._patch)
+        if self._prerelease:
+            version += "-%s" % self._prerelease
+        if self._build:
+            version += "+%s" % self._build
+        self._str = version
         return version
 
     def __hash__(self) -> int:
-        return hash(self.to_tuple()[:4])
+        # The hash is computed on first use and cached afterwards
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        self._hash = result = hash(self.precedence_key)
+        return result
+
+    def intern(self: T) -> T:
+        """
+        Return the canonical instance of all versions equal to this one.
+
+        The first interned version becomes the canonical instance and is
+        stored in :data:`semver.intern_pool <semver.version.intern_pool>`.
+        Interning a version with the same class and the same parts (the
+        build part included) returns that instance. Its prerelease and build
+        strings are interned with :func:`sys.intern`.
+
+        The pool only holds weak references: as soon as a canonical
+        instance is not used anymore, it is removed from the pool. Use
+        interning if your program keeps many equal versions alive, so the
+        memory usage grows with the number of distinct versions instead of
+        the number of references. Attributes of subclass instances which
+        are not version parts are ignored.
+
+        .. versionadded:: 3.1.0
+
+        :return: the canonical instance
+
+        >>> v1 = Version.parse("1.2.3-rc.1").intern()
+        >>> v2 = Version.parse("1.2.3-rc.1").intern()
+        >>> v1 is v2
+        True
+        >>> v1 is Version.parse("1.2.3-rc.1+build.5").intern()
+        False
+        """
+        key = (
+            type(self),
+            self._major,
+            self._minor,
+            self._patch,
+            self._prerelease,
+            self._build,
+        )
+        version = intern_pool.get(key)
+        if version is None:
+            # sys.intern() only accepts exact strings, not subclasses of str
+            if type(self._prerelease) is str:
+                self._prerelease = sys.intern(self._prerelease)
+            if type(self._build) is str:
+                self._build = sys.intern(self._build)
+            version = intern_pool.setdefault(key, self)
+        return version  # type: ignore
 
     def finalize_version(self) -> "Version":
         """
@@ -573,12 +1005,15 @@ build='build.10')
         '1.2.3'
         """
         cls = type(self)
-        return cls(self.major, self.minor, self.patch)
+        return cls._from_parts(self._major, self._minor, self._patch)
 
     def match(self, match_expr: str) -> bool:
         """
         Compare self to match a match expression.
 
+        .. versionchanged:: 3.1.0
+           Compiled expressions are cached, see :func:`compile_match`.
+
         :param match_expr: optional operator and version; valid operators are
               ``<``   smaller than
               ``>``   greater than
@@ -595,36 +1030,7 @@ build='build.10')
         >>> semver.Version.parse("4.0.4").match("4.0.4")
         True
         """
-        prefix = match_expr[:2]
-        if prefix in (">=", "<=", "==", "!="):
-            match_version = match_expr[2:]
-        elif prefix and prefix[0] in (">", "<"):
-            prefix = prefix[0]
-            match_version = match_expr[1:]
-        elif match_expr and match_expr[0] in "0123456789":
-            prefix = "=="
-            match_version = match_expr
-        else:
-            raise ValueError(
-                "match_expr parameter should be in format <op><ver>, "
-                "where <op> is one of "
-                "['<', '>', '==', '<=', '>=', '!=']. "
-                "You provided: %r" % match_expr
-            )
-
-        possibilities_dict = {
-            ">": (1,),
-            "<": (-1,),
-            "==": (0,),
-            "!=": (-1, 1),
-            ">=": (0, 1),
-            "<=": (-1, 0),
-        }
-
-        possibilities = possibilities_dict[prefix]
-        cmp_res = self.compare(match_version)
-
-        return cmp_res in possibilities
+        return compile_match(match_expr, type(self))(self)
 
     @classmethod
     def parse(
@@ -639,6 +1045,10 @@ build='build.10')
         .. versionchanged:: 3.0.0
            Added optional parameter ``optional_minor_and_patch`` to allow
            optional minor and patch parts.
+        .. versionchanged:: 3.1.0
+           Checks the limits :attr:`MAX_LENGTH`, :attr:`MAX_IDENTIFIERS`, and
+           :attr:`MAX_DIGITS`, and uses a linear-time scanner if
+           :attr:`LINEAR_PARSING` is set.
 
         :param version: version string
         :param optional_minor_and_patch: if set to true, the version string to parse \
@@ -646,7 +1056,7 @@ build='build.10')
            By default (False), the version string to parse has to follow the semver
            specification.
         :return: a new :class:`Version` instance
-        :raises ValueError: if version is invalid
+        :raises ValueError: if version is invalid or exceeds one of the limits
         :raises TypeError: if version contains the wrong type
 
         >>> semver.Version.parse('3.4.5-pre.2+build.4')
@@ -658,20 +1068,302 @@ prerelease='pre.2', build='build.4')
         elif not isinstance(version, String.__args__):  # type: ignore
             raise TypeError("not expecting type '%s'" % type(version))
 
+        caches = cls.__dict__.get("_parse_caches")
+        if caches is not None:
+            return caches[bool(optional_minor_and_patch)](version)
+        return cls._parse(version, optional_minor_and_patch)
+
+    @classmethod
+    def _parse(cls: Type[T], version: str, optional_minor_and_patch: bool) -> T:
+        """
+        Parse a version string (without any type checks or caching).
+
+        :param version: version string
+        :param optional_minor_and_patch: see :meth:`parse`
+        :return: a new :class:`Version` instance
+        :raises ValueError: if version is invalid or exceeds one of the limits
+        """
+        # Same fast path as in _split, without the overhead of the call
+        plain = (
+            "-" not in version
+            and "+" not in version
+            and cls.MAX_LENGTH is None
+            and cls.MAX_IDENTIFIERS is None
+            and cls.MAX_DIGITS is None
+        )
+        if plain:
+            numbers = cls._scan_numbers(version, optional_minor_and_patch)
+            if numbers is not None:
+                # Missing minor and patch parts are zero:
+                numbers += ["0"] * (3 - len(numbers))
+                return cls._from_parts(
+                    int(numbers[0]), int(numbers[1]), int(numbers[2])
+                )
+
+        parts = cls._split(version, optional_minor_and_patch, numbers_scanned=plain)
+        if parts is None:
+            raise ValueError(f"{version} is not valid SemVer string")
+        if isinstance(parts, ScanError):
+            raise ValueError("Version string %s (at position %d)" % parts)
+        return cls._from_split(parts)
+
+    @classmethod
+    def _from_split(cls: Type[T], parts: Parts) -> T:
+        """
+        Create a version from the parts returned by :meth:`_split`.
+
+        :param parts: the string parts; missing minor and patch parts are None
+        :return: a new instance
+        :raises ValueError: if a number has too many digits for :func:`int`,
+           or if the constructor of a subclass rejects the parts
+        """
+        major: str
+        minor: Optional[str]
+        patch: Optional[str]
+        prerelease: Optional[str]
+        build: Optional[str]
+        major, minor, patch, prerelease, build = parts
+        return cls._from_parts(
+            int(major),
+            int(minor) if minor is not None else 0,
+            int(patch) if patch is not None else 0,
+            prerelease,
+            build,
+        )
+
+    @classmethod
+    def _split(
+        cls, version: str, optional_minor_and_patch: bool, numbers_scanned: bool = False
+    ) -> Union[Parts, ScanError, None]:
+        """
+        Split a version string into its parts without raising an exception.
+
+        :param version: version string
+        :param optional_minor_and_patch: see :meth:`parse`
+        :param numbers_scanned: the caller has already tried
+           :meth:`_scan_numbers` without success, so it is not tried again
+        :return: the parts (missing minor and patch parts are None), a
+           :class:`~semver._scanner.ScanError` if the string exceeds one
+           of the limits, or None if the string is invalid
+        """
+        if (
+            cls.MAX_LENGTH is not None
+            or cls.MAX_IDENTIFIERS is not None
+            or cls.MAX_DIGITS is not None
+        ):
+            error = check_limits(
+                version, cls.MAX_LENGTH, cls.MAX_IDENTIFIERS, cls.MAX_DIGITS
+            )
+            if error is not None:
+                return error
+
+        if not numbers_scanned and "-" not in version and "+" not in version:
+            numbers = cls._scan_numbers(version, optional_minor_and_patch)
+            if numbers is not None:
+                numbers += [None] * (5 - len(numbers))  # type: ignore
+                return numbers  # type: ignore
+
+        if cls.LINEAR_PARSING:
+            parts = scan(version, optional_minor_and_patch)
+            return None if isinstance(parts, ScanError) else parts
+
         if optional_minor_and_patch:
             match = cls._REGEX_OPTIONAL_MINOR_AND_PATCH.match(version)
         else:
             match = cls._REGEX.match(version)
         if match is None:
-            raise ValueError(f"{version} is not valid SemVer string")
+            return None
+        return match.group(*cls.NAMES)  # type: ignore
 
-        matched_version_parts: Dict[str, Any] = match.groupdict()
-        if not matched_version_parts["minor"]:
-            matched_version_parts["minor"] = 0
-        if not matched_version_parts["patch"]:
-            matched_version_parts["patch"] = 0
+    @staticmethod
+    def _scan_numbers(
+        version: str, optional_minor_and_patch: bool
+    ) -> Optional[List[str]]:
+        """
+        Scan a version string without prerelease and build part.
 
-        return cls(**matched_version_parts)
+        This is a fast path for the common case ``MAJOR.MINOR.PATCH``.
+        Every string accepted by the scanner is also accepted by
+        :attr:`_REGEX` with the same result. Missing minor and patch parts
+        are *not* filled with zeros.
+
+        :param version: version string which contains neither ``-`` nor ``+``
+        :param optional_minor_and_patch: see :meth:`parse`
+        :return: a list of the number strings, or None if the string cannot be
+           handled by the scanner (it can still be valid for the regex)
+        """
+        # Non-ASCII digits are left to the regex
+        if not version.isascii():
+            return None
+        parts = version.split(".")
+        count = len(parts)
+        if count != 3 and (count > 3 or not optional_minor_and_patch):
+            return None
+        for part in parts:
+            # Same as the regex "0|[1-9]\d*"
+            if not part.isdigit() or (part[0] == "0" and len(part) > 1):
+                return None
+        return parts
+
+    @classmethod
+    def enable_parse_cache(cls, maxsize: Optional[int] = 1024) -> None:
+        """
+        Enable a bounded LRU cache for :meth:`parse` on this class.
+
+        The cache is keyed on the version string. Each class has its own
+        cache, a subclass does not share the cache of its parent class.
+        Strings parsed with ``optional_minor_and_patch=True`` are cached
+        separately. As :class:`Version` objects are immutable, a cache hit
+        returns the same instance as the first call.
+
+        Calling this method again replaces the existing caches.
+
+        .. versionadded:: 3.1.0
+
+        :param maxsize: the maximum number of entries of each cache;
+           ``None`` makes the cache unbounded
+
+        >>> Version.enable_parse_cache(maxsize=128)
+        >>> Version.parse("1.2.3") is Version.parse("1.2.3")
+        True
+        >>> Version.disable_parse_cache()
+        """
+        cls._parse_caches = {
+            flag: lru_cache(maxsize=maxsize)(
+                partial(cls._parse, optional_minor_and_patch=flag)
+            )
+            for flag in (False, True)
+        }
+
+    @classmethod
+    def disable_parse_cache(cls) -> None:
+        """
+        Disable the parse cache of this class and drop all cached entries.
+
+        .. versionadded:: 3.1.0
+        """
+        cls._parse_caches = None
+
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """
+        Remove all entries from the parse caches of this class and reset
+        their statistics. Does nothing if the cache is disabled.
+
+        .. versionadded:: 3.1.0
+        """
+        caches = cls.__dict__.get("_parse_caches")
+        if caches is not None:
+            for cache in caches.values():
+                cache.cache_clear()  # type: ignore
+
+    @classmethod
+    def parse_cache_info(cls, optional_minor_and_patch: bool = False) -> Any:
+        """
+        Return the statistics of a parse cache of this class.
+
+        .. versionadded:: 3.1.0
+
+        :param optional_minor_and_patch: select the cache which is used for
+           strings parsed with the same argument
+        :return: a named tuple with the fields ``hits``, ``misses``,
+           ``maxsize``, and ``currsize`` (see :func:`functools.lru_cache`),
+           or None if the cache is disabled
+
+        >>> Version.enable_parse_cache()
+        >>> _ = Version.parse("1.2.3"), Version.parse("1.2.3")
+        >>> Version.parse_cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+        >>> Version.disable_parse_cache()
+        """
+        caches = cls.__dict__.get("_parse_caches")
+        if caches is None:
+            return None
+        return caches[bool(optional_minor_and_patch)].cache_info()  # type: ignore
+
+    @classmethod
+    def parse_many(
+        cls: Type[T],
+        versions: Iterable[String],
+        *,
+        on_error: str = "raise",
+        optional_minor_and_patch: bool = False,
+    ) -> "ParsedVersions[T]":
+        """
+        Parse many version strings lazily.
+
+        The returned iterator parses one item at a time, so the memory usage
+        stays flat even for huge inputs. How invalid items are treated
+        depends on ``on_error``:
+
+        * ``"raise"``: raise the :class:`ValueError` (or :class:`TypeError`)
+          of the first invalid item, like :meth:`parse`.
+        * ``"skip"``: silently skip invalid items.
+        * ``"collect"``: skip invalid items, but remember them together with
+          their index in the :attr:`ParsedVersions.errors` list.
+
+        .. versionadded:: 3.1.0
+
+        :param versions: an iterable of version strings (``str`` or ``bytes``)
+        :param on_error: one of ``"raise"``, ``"skip"``, or ``"collect"``
+        :param optional_minor_and_patch: see :meth:`parse`
+        :return: an iterator of :class:`Version` instances
+        :raises ValueError: if ``on_error`` is invalid
+
+        >>> result = Version.parse_many(["1.0.0", "1.0", "2.0.0"], on_error="collect")
+        >>> [str(v) for v in result]
+        ['1.0.0', '2.0.0']
+        >>> result.errors
+        [(1, '1.0')]
+        """
+        if on_error not in ParsedVersions.ON_ERROR:
+            raise ValueError(
+                f"on_error must be one of {ParsedVersions.ON_ERROR}, "
+                f"but got {on_error!r}"
+            )
+        return ParsedVersions(
+            cls._parse_many(versions, on_error, bool(optional_minor_and_patch)),
+            on_error,
+        )
+
+    @classmethod
+    def _parse_many(
+        cls: Type[T], versions: Iterable[String], on_error: str, optional: bool
+    ) -> Iterator[Union[T, Tuple[int, String]]]:
+        """
+        Generate parsed versions or ``(index, item)`` tuples for invalid items.
+
+        The tuples are consumed by :class:`ParsedVersions`.
+        """
+        caches = cls.__dict__.get("_parse_caches")
+        parse: Callable[[str], T]
+        # Respect subclasses which customize parse(), which use the parse
+        # cache themselves (if any) through Version.parse:
+        if not cls._default_parser:
+            if optional:
+                parse = partial(cls.parse, optional_minor_and_patch=True)
+            else:
+                parse = cls.parse
+        elif caches is not None:
+            parse = caches[optional]
+        else:
+            # No overridden parse method, we can skip its type checks:
+            parse = partial(cls._parse, optional_minor_and_patch=optional)
+        string_type = str
+        raise_errors = on_error == "raise"
+
+        for index, item in enumerate(versions):
+            try:
+                if type(item) is not string_type:
+                    if isinstance(item, bytes):
+                        item = item.decode("UTF-8")
+                    elif not isinstance(item, string_type):
+                        raise TypeError("not expecting type '%s'" % type(item))
+                yield parse(item)  # type: ignore
+            except (ValueError, TypeError):
+                if raise_errors:
+                    raise
+                yield (index, item)
 
     def replace(self, **parts: Union[int, Optional[str]]) -> "Version":
         """
@@ -709,15 +1401,170 @@ prerelease='pre.2', build='build.4')
         .. versionchanged:: 3.0.0
            Renamed from :meth:`~semver.version.Version.isvalid`
 
+        .. versionchanged:: 3.1.0
+           Does not raise and catch an exception for an invalid string.
+
         :param version: the version string to check
         :return: True if the version string is a valid semver version, False
                  otherwise.
         """
+        if not cls._default_parser:
+            try:
+                cls.parse(version)
+                return True
+            except ValueError:
+                return False
+        if not isinstance(version, str):
+            if not isinstance(version, bytes):
+                raise TypeError("not expecting type '%s'" % type(version))
+            try:
+                version = version.decode("UTF-8")
+            except UnicodeDecodeError:
+                return False
+        if (
+            cls.MAX_LENGTH is None
+            and cls.MAX_IDENTIFIERS is None
+            and cls.MAX_DIGITS is None
+            and not cls.LINEAR_PARSING
+            and cls._default_init
+            and len(version) <= _MIN_INT_MAX_STR_DIGITS
+        ):
+            # Nothing but the regex can reject the string
+            return cls._REGEX.match(version) is not None
+        return cls._check(version, False, explain=False) is None
+
+    @classmethod
+    def try_parse(
+        cls: Type[T], version: String, optional_minor_and_patch: bool = False
+    ) -> Optional[T]:
+        """
+        Parse a version string, or return None if it is invalid.
+
+        Unlike :meth:`parse`, no exception is raised for an invalid string,
+        which makes this method much cheaper if most strings are invalid.
+        It only returns None and does not tell why a string is invalid;
+        :meth:`validate_many` reports the reason and the position as a
+        :class:`semver._scanner.ScanError` (a named tuple from a private
+        module, so only rely on its ``reason`` and ``position`` fields).
+
+        .. versionadded:: 3.1.0
+
+        :param version: version string
+        :param optional_minor_and_patch: see :meth:`parse`
+        :return: a new :class:`Version` instance, or None
+        :raises TypeError: if version contains the wrong type
+
+        >>> Version.try_parse("1.2.3-rc.1")
+        Version(major=1, minor=2, patch=3, prerelease='rc.1', build=None)
+        >>> Version.try_parse("1.2") is None
+        True
+        """
+        if not cls._default_parser:
+            # Respect subclasses which customize parse():
+            try:
+                if optional_minor_and_patch:
+                    return cls.parse(version, optional_minor_and_patch=True)
+                return cls.parse(version)
+            except ValueError:
+                return None
+        if isinstance(version, bytes):
+            try:
+                version = version.decode("UTF-8")
+            except UnicodeDecodeError:
+                return None
+        elif not isinstance(version, str):
+            raise TypeError("not expecting type '%s'" % type(version))
+
+        parts = cls._split(version, optional_minor_and_patch)
+        if parts is None or isinstance(parts, ScanError):
+            return None
         try:
-            cls.parse(version)
-            return True
+            return cls._from_split(parts)
         except ValueError:
-            return False
+            return None
+
+    @classmethod
+    def validate_many(
+        cls, versions: Iterable[Any], *, optional_minor_and_patch: bool = False
+    ) -> Iterator[Optional[ScanError]]:
+        """
+        Check many version strings without raising exceptions.
+
+        For each item, the iterator yields None if the item is a valid
+        version, otherwise a :class:`~semver._scanner.ScanError` with the
+        reason and the position of the first problem. Items which are
+        neither ``str`` nor ``bytes`` are reported as invalid, too.
+
+        .. versionadded:: 3.1.0
+
+        :param versions: an iterable of version strings
+        :param optional_minor_and_patch: see :meth:`parse`
+        :return: an iterator with one result for each item
+
+        >>> for error in Version.validate_many(["1.0.0", "1.0", "1.0.0-rc..1"]):
+        ...     print(error)
+        None
+        ScanError(reason='missing patch part', position=3)
+        ScanError(reason='invalid prerelease identifier', position=9)
+        """
+        optional = bool(optional_minor_and_patch)
+        default_parser = cls._default_parser
+        for version in versions:
+            if isinstance(version, bytes):
+                try:
+                    version = version.decode("UTF-8")
+                except UnicodeDecodeError as error:
+                    yield ScanError("is not valid UTF-8", error.start)
+                    continue
+            elif not isinstance(version, str):
+                yield ScanError("is not a string", 0)
+                continue
+
+            if default_parser:
+                yield cls._check(version, optional, explain=True)
+                continue
+            try:
+                if optional:
+                    cls.parse(version, optional_minor_and_patch=True)
+                else:
+                    cls.parse(version)
+            except ValueError as error:
+                yield ScanError(str(error), 0)
+            else:
+                yield None
+
+    @classmethod
+    def _check(
+        cls, version: str, optional_minor_and_patch: bool, explain: bool
+    ) -> Optional[ScanError]:
+        """
+        Check a version string without raising an exception.
+
+        :param version: version string
+        :param optional_minor_and_patch: see :meth:`parse`
+        :param explain: find the reason why an invalid string does not match;
+           otherwise a generic :class:`~semver._scanner.ScanError` is returned
+        :return: None if the string is valid, otherwise a
+           :class:`~semver._scanner.ScanError`
+        """
+        parts = cls._split(version, optional_minor_and_patch)
+        if parts is None:
+            error = scan(version, optional_minor_and_patch) if explain else None
+            if isinstance(error, ScanError):
+                return error
+            # A subclass can match with a different regex than the scanner
+            return _INVALID
+        if isinstance(parts, ScanError):
+            return parts
+        # The constructor of a subclass can reject more, and int() limits
+        # the number of digits:
+        if not cls._default_init or len(version) > _MIN_INT_MAX_STR_DIGITS:
+            try:
+                # Calls the constructor of a subclass which overrides it
+                cls._from_split(parts)
+            except ValueError as error:
+                return ScanError(str(error), 0)
+        return None
 
     def is_compatible(self, other: "Version") -> bool:
         """
@@ -758,5 +1605,143 @@ prerelease='pre.2', build='build.4')
         )
 
 
+class ParsedVersions(Generic[T]):
+    """
+    Iterator over the results of :meth:`Version.parse_many`.
+
+    .. versionadded:: 3.1.0
+    """
+
+    __slots__ = ("_collect", "_results", "errors")
+
+    #: Valid values for the ``on_error`` argument
+    ON_ERROR: ClassVar[Tuple[str, ...]] = ("raise", "skip", "collect")
+
+    def __init__(
+        self, results: Iterator[Union[T, Tuple[int, String]]], on_error: str
+    ):
+        self._results = results
+        self._collect = on_error == "collect"
+        #: The rejected inputs as ``(index, item)`` tuples (only filled when
+        #: ``on_error="collect"``)
+        self.errors: List[Tuple[int, String]] = []
+
+    def __iter__(self) -> "ParsedVersions[T]":
+        """Return iter(self)."""
+        return self
+
+    def __next__(self) -> T:
+        """Return the next parsed version."""
+        for result in self._results:
+            if type(result) is not tuple:
+                return result  # type: ignore
+            if self._collect:
+                self.errors.append(result)  # type: ignore
+        raise StopIteration
+
+
+class MatchExpression:
+    """
+    A compiled match expression, see :func:`compile_match`.
+
+    Call the object with a :class:`Version` or a version string to check
+    if the version matches the expression.
+
+    .. versionadded:: 3.1.0
+
+    :param match_expr: optional operator and version, see :meth:`Version.match`
+    :param version_class: the class used to parse the version of the
+       expression and the version strings passed to the object
+    :raises ValueError: if the expression is invalid
+    """
+
+    __slots__ = ("_key", "_op", "expression", "operator", "version")
+
+    #: Maps the operators of a match expression to functions
+    OPERATORS: ClassVar[Dict[str, Callable[[Any, Any], bool]]] = {
+        ">": operator.gt,
+        "<": operator.lt,
+        "==": operator.eq,
+        "!=": operator.ne,
+        ">=": operator.ge,
+        "<=": operator.le,
+    }
+
+    def __init__(self, match_expr: str, version_class: Type[Version] = Version):
+        prefix = match_expr[:2]
+        if prefix in (">=", "<=", "==", "!="):
+            match_version = match_expr[2:]
+        elif prefix and prefix[0] in (">", "<"):
+            prefix = prefix[0]
+            match_version = match_expr[1:]
+        elif match_expr and match_expr[0] in "0123456789":
+            prefix = "=="
+            match_version = match_expr
+        else:
+            raise ValueError(
+                "match_expr parameter should be in format <op><ver>, "
+                "where <op> is one of "
+                "['<', '>', '==', '<=', '>=', '!=']. "
+                "You provided: %r" % match_expr
+            )
+
+        #: The original expression
+        self.expression = match_expr
+        #: The operator of the expression
+        self.operator = prefix
+        #: The version of the expression
+        self.version = version_class.parse(match_version)
+        self._op = self.OPERATORS[prefix]
+        self._key = self.version.precedence_key
+
+    def __call__(self, version: Union[Version, String]) -> bool:
+        """
+        Check if a version matches the expression.
+
+        :param version: a :class:`Version` or a version string
+        :return: True if the version matches, otherwise False
+        """
+        if not isinstance(version, Version):
+            version = type(self.version).parse(version)
+        return self._op(version.precedence_key, self._key)
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, self.expression)
+
+
+def compile_match(
+    match_expr: str, version_class: Type[Version] = Version
+) -> MatchExpression:
+    """
+    Compile a match expression into a reusable predicate.
+
+    The 256 most recently used expressions of each version class are
+    cached, so compiling the same expression again is cheap.
+    :meth:`Version.match` uses this function as well.
+
+    .. versionadded:: 3.1.0
+
+    :param match_expr: optional operator and version, see :meth:`Version.match`
+    :param version_class: the class used to parse versions
+    :return: the compiled expression
+    :raises ValueError: if the expression is invalid
+
+    >>> is_supported = semver.compile_match(">=2.1.0")
+    >>> is_supported(semver.Version.parse("2.4.0"))
+    True
+    >>> is_supported("1.9.9")
+    False
+    """
+    # The cache is stored on the class itself (like the parse caches), so
+    # it does not keep subclasses alive:
+    cache = version_class.__dict__.get("_match_cache")
+    if cache is None:
+        cache = lru_cache(maxsize=256)(
+            partial(MatchExpression, version_class=version_class)
+        )
+        version_class._match_cache = cache
+    return cache(match_expr)
+
+
 #: Keep the VersionInfo name for compatibility
 VersionInfo = Version
@@ -1,6 +1,7 @@
 import pytest
 
 from semver import (
+    Version,
     bump_build,
     bump_major,
     bump_minor,
@@ -163,4 +164,23 @@ def test_should_ignore_build_on_prerelease_bump():
 )
 def test_should_bump_build(version, expected):
     assert bump_build(version) == expected
-    assert compare(version, expected) == 0
\ No newline at end of file
+    assert compare(version, expected) == 0
+
+
+@pytest.mark.parametrize(
+    "build,expected",
+    [
+        ("build", "build"),
+        ("9", "10"),
+        ("build.0099", "build.0100"),
+        ("1.2.3", "1.2.4"),
+        ("a1b22c", "a1b23c"),
+        ("٣", "4"),
+        # Long builds must not make the search backtrack
+        ("-" * 100_000, "-" * 100_000),
+        ("a1" * 50_000, "a1" * 49_999 + "a2"),
+        ("1" * 10_000 + "a" * 10_000, "1" * 9_999 + "2" + "a" * 10_000),
+    ],
+)
+def test_should_increment_last_number_in_build(build, expected):
+    assert Version._increment_string(build) == expected
@@ -0,0 +1,46 @@
+import pickle
+
+import pytest
+from semverwithvprefix import SemVerWithVPrefix
+
+from semver import Version
+
+
+@pytest.mark.parametrize(
+    "string", ["1.2.3", "1.2.3-rc.1", "1.2.3+build.5", "1.2.3-rc.1+build.5"]
+)
+def test_str_is_cached(string):
+    version = Version.parse(string)
+    assert str(version) == string
+    assert str(version) is str(version)
+
+
+def test_hash_is_cached_and_ignores_build():
+    version = Version.parse("1.2.3-rc.1+build.5")
+    assert hash(version) == hash(version) == hash(Version.parse("1.2.3-rc.1"))
+    assert hash(version) == hash(version.precedence_key)
+
+
+def test_caches_are_not_shared_with_new_instances():
+    version = Version.parse("1.2.3-rc.1")
+    str(version), hash(version)
+    replaced = version.replace(prerelease="rc.2")
+    assert str(replaced) == "1.2.3-rc.2"
+    assert hash(replaced) != hash(version)
+    assert str(version.bump_patch()) == "1.2.4"
+    assert str(pickle.loads(pickle.dumps(version))) == "1.2.3-rc.1"
+
+
+def test_subclass_str_override_uses_cached_str():
+    version = SemVerWithVPrefix.parse("v1.2.3")
+    assert str(version) == "v1.2.3"
+    assert str(version) == "v1.2.3"
+    assert str(version.replace(prerelease="dev.0")) == "v1.2.3-dev.0"
+
+
+def test_caches_keep_version_immutable():
+    version = Version.parse("1.2.3")
+    str(version), hash(version)
+    with pytest.raises(AttributeError):
+        version.major = 2
+    assert str(version) == "1.2.3"
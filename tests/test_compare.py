@@ -302,3 +302,114 @@ def test_should_compare_prerelease_and_build_with_numbers():
     assert Version(1, 9, 1, 1, 1) < Version(1, 9, 1, 2, 1)
     assert Version("2") < Version(10)
     assert Version("2") < Version("10")
+
+
+def _reference_compare(left, right):
+    """The comparison algorithm before precedence keys were introduced."""
+    result = semver.version._cmp(left.to_tuple()[:3], right.to_tuple()[:3])
+    if result:
+        return result
+    rc1, rc2 = left.prerelease, right.prerelease
+    rccmp = Version._nat_cmp(rc1, rc2)
+    if not rccmp:
+        return 0
+    if not rc1:
+        return 1
+    elif not rc2:
+        return -1
+    return rccmp
+
+
+PRECEDENCE_SAMPLES = [
+    Version(1, 0, 0, prerelease)
+    for prerelease in (
+        None,
+        "",
+        "0",
+        "1",
+        "2",
+        "10",
+        "a",
+        "a.0",
+        "a.1",
+        "a.b",
+        "a.b.0",
+        "a-b",
+        "alpha",
+        "alpha.1",
+        "alpha.beta",
+        "beta.2",
+        "beta.11",
+        "rc.1",
+        "0a",
+        "1.a",
+        "A",
+        "Z.9",
+    )
+] + [Version(0, 9, 9), Version(1, 0, 1, "0"), Version(2), Version(1, 0, 0, None, "b")]
+
+
+@pytest.mark.parametrize("left", PRECEDENCE_SAMPLES, ids=str)
+def test_precedence_key_agrees_with_reference_compare(left):
+    for right in PRECEDENCE_SAMPLES:
+        expected = _reference_compare(left, right)
+        assert left.compare(right) == expected
+        key_cmp = semver.version._cmp(left.precedence_key, right.precedence_key)
+        assert key_cmp == expected
+
+
+def test_precedence_key_is_cached():
+    version = Version.parse("1.2.3-rc.1")
+    assert version.precedence_key is version.precedence_key
+
+
+def test_equal_precedence_has_equal_hash():
+    assert Version(1, 0, 0, "") == Version(1, 0, 0)
+    assert hash(Version(1, 0, 0, "")) == hash(Version(1, 0, 0))
+
+
+@pytest.mark.parametrize(
+    "op,expected",
+    [
+        ("__eq__", False),
+        ("__ne__", True),
+        ("__lt__", True),
+        ("__le__", True),
+        ("__gt__", False),
+        ("__ge__", False),
+    ],
+)
+def test_rich_comparison_with_same_and_other_types(op, expected):
+    left = Version.parse("1.0.0-rc.1")
+    for right in (
+        Version.parse("1.0.0-rc.2"),
+        "1.0.0-rc.2",
+        b"1.0.0-rc.2",
+        (1, 0, 0, "rc.2"),
+        [1, 0, 0, "rc.2"],
+        {"major": 1, "minor": 0, "patch": 0, "prerelease": "rc.2"},
+    ):
+        assert getattr(left, op)(right) is expected
+
+
+def test_rich_comparison_method_names():
+    assert Version.__lt__.__name__ == "__lt__"
+    assert Version.__eq__.__qualname__ == "Version.__eq__"
+
+
+def test_rich_comparison_respects_overridden_compare():
+    class BuildOrderedVersion(Version):
+        def compare(self, other):
+            result = super().compare(other)
+            if result:
+                return result
+            mine, theirs = self.build or "", other.build or ""
+            return (mine > theirs) - (mine < theirs)
+
+    a = BuildOrderedVersion(1, 0, 0, build="a")
+    b = BuildOrderedVersion(1, 0, 0, build="b")
+    assert a.compare(b) == -1
+    assert a < b
+    assert a != b
+    assert not a == b
+    assert sorted([b, a]) == [a, b]
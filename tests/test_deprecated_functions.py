@@ -1,3 +1,5 @@
+import sys
+import warnings
 from argparse import Namespace
 
 import pytest
@@ -73,3 +75,61 @@ def test_deprecated_deco_without_argument():
 
     with pytest.deprecated_call():
         assert mock_func()
+
+
+def test_deprecated_warning_points_to_caller():
+    with pytest.warns(DeprecationWarning) as record:
+        parse("1.2.3")
+        lineno = sys._getframe().f_lineno - 1
+    assert record[0].filename == __file__
+    assert record[0].lineno == lineno
+
+
+def test_deprecated_message_is_built_once():
+    @deprecated(replace="semver.new", version="1.0.0")
+    def old():
+        return 42
+
+    with pytest.warns(DeprecationWarning) as record:
+        assert old() == 42
+        assert old() == 42
+    message = (
+        "Function 'semver.test_deprecated_message_is_built_once.<locals>.old' "
+        "is deprecated. Deprecated since version 1.0.0.  This function will be "
+        "removed in semver 3. Use 'semver.new' instead."
+    )
+    assert [str(w.message) for w in record] == [message] * 2
+
+
+@pytest.mark.parametrize(
+    "action, kwargs, ignored",
+    [
+        ("ignore", {}, True),
+        ("ignore", {"category": UserWarning}, False),
+        ("ignore", {"message": "Function 'semver.parse'"}, True),
+        ("ignore", {"message": "Function 'semver.other'"}, False),
+        ("ignore", {"module": __name__}, True),
+        ("ignore", {"module": "other"}, False),
+        ("ignore", {"lineno": 1}, False),
+        ("always", {}, False),
+        ("error", {}, False),
+    ],
+)
+def test_deprecated_skips_ignored_warnings(monkeypatch, action, kwargs, ignored):
+    calls = []
+    monkeypatch.setattr("warnings.warn", lambda *args, **kw: calls.append(args))
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        warnings.filterwarnings(action, **kwargs)
+        assert parse("1.2.3")["major"] == 1
+    assert len(calls) == (0 if ignored else 1)
+
+
+def test_deprecated_skips_ignored_default_action(monkeypatch):
+    calls = []
+    monkeypatch.setattr("warnings.warn", lambda *args, **kw: calls.append(args))
+    monkeypatch.setattr("warnings.defaultaction", "ignore")
+    with warnings.catch_warnings():
+        warnings.resetwarnings()
+        parse("1.2.3")
+    assert not calls
@@ -0,0 +1,79 @@
+import pickle
+
+import pytest
+
+from semver import Version, VersionArray
+
+
+class MyVersion(Version):
+    pass
+
+
+class CountingVersion(Version):
+    """A subclass with its own __init__, which must still be called."""
+
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        type(self).calls += 1
+        super().__init__(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "parts", [(1,), (1, 2), (1, 2, 3), (1, 2, 3, "rc.1"), (1, 2, 3, "rc.1", "b.5")]
+)
+def test_from_tuple_unchecked(parts):
+    version = Version.from_tuple_unchecked(parts)
+    assert version == Version(*parts)
+    assert version.to_tuple() == Version(*parts).to_tuple()
+    assert str(version) == str(Version(*parts))
+
+
+def test_from_tuple_unchecked_keeps_subclass():
+    assert type(MyVersion.from_tuple_unchecked((1, 2, 3))) is MyVersion
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda cls: cls.parse("1.2.3"),
+        lambda cls: cls.parse("1.2.3-rc.1+build.5"),
+        lambda cls: cls.parse("1.2", optional_minor_and_patch=True),
+        lambda cls: cls.try_parse("1.2.3-rc.1"),
+        lambda cls: cls(1, 2, 3, "rc.1").bump_major(),
+        lambda cls: cls(1, 2, 3, "rc.1").bump_minor(),
+        lambda cls: cls(1, 2, 3, "rc.1").bump_patch(),
+        lambda cls: cls(1, 2, 3, "rc.1").bump_prerelease(),
+        lambda cls: cls(1, 2, 3, "rc.1").bump_build(),
+        lambda cls: cls(1, 2, 3, "rc.1").finalize_version(),
+        lambda cls: cls.from_bytes(Version(1, 2, 3, "rc.1").to_bytes()),
+        lambda cls: cls.from_sortable_bytes(Version(1, 2, 3).to_sortable_bytes()),
+        lambda cls: cls.loads_many(Version.dumps_many([Version(1, 2, 3)]))[0],
+        lambda cls: VersionArray(["1.2.3-rc.1"], version_class=cls)[0],
+        lambda cls: pickle.loads(pickle.dumps(cls(1, 2, 3, "rc.1"))),
+    ],
+)
+def test_internal_construction_keeps_subclass(create):
+    expected = create(Version)
+    version = create(MyVersion)
+    assert type(version) is MyVersion
+    assert version.to_tuple() == expected.to_tuple()
+    assert isinstance(version.major, int) and isinstance(version.patch, int)
+
+
+def test_overridden_init_is_called():
+    version = CountingVersion(1, 2, 3)
+    CountingVersion.calls = 0
+    version.bump_patch()
+    version.finalize_version()
+    CountingVersion.parse("1.2.3")
+    CountingVersion.from_tuple_unchecked((1, 2, 3))
+    assert CountingVersion.calls == 4
+
+
+def test_parse_with_unicode_digits_stores_ints():
+    version = Version.parse("1.2.3-rc.1")
+    assert type(version.major) is int
+    # The regex accepts non-ASCII digits after the first digit
+    version = Version.parse("1.2٣.0-rc")
+    assert version.to_tuple() == (1, 23, 0, "rc", None)
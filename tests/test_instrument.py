@@ -0,0 +1,106 @@
+import pytest
+
+import semver
+from semver import Version, _instrument
+
+
+@pytest.fixture
+def enabled():
+    semver.reset_stats()
+    semver.enable_stats()
+    yield
+    semver.disable_stats()
+    semver.reset_stats()
+
+
+def test_stats_are_disabled_by_default():
+    assert not semver.stats_enabled()
+    assert not hasattr(Version.parse, "__wrapped__")
+    Version.parse("1.2.3")
+    assert semver.stats()["calls"] == {}
+
+
+def test_stats_count_calls(enabled):
+    Version._match_cache = None
+    v = Version.parse("1.2.3")
+    Version.parse("1.2.3")
+    with pytest.raises(ValueError):
+        Version.parse("1.2")
+    assert v.compare("1.2.4") == -1
+    assert v.compare(Version(1, 2, 3)) == 0
+    assert v < "2.0.0"
+    assert v < Version(1, 2, 4)
+    assert sorted([Version(2), v]) == [v, Version(2)]
+    assert v.match(">=1.0.0")
+    v.bump_major()
+    v.bump_prerelease()
+    calls = semver.stats()["calls"]
+    assert calls == {
+        # sorted() of two items compares them once; comparing the sorted
+        # list calls __eq__ only for the item which is not identical
+        "__eq__": 1,
+        "__lt__": 3,
+        "bump_major": 1,
+        "bump_prerelease": 1,
+        "compare": 3,
+        "compare_str": 2,
+        "match": 1,
+        # compile_match() parses the version of the expression
+        "parse": 6,
+        "parse_failures": 1,
+    }
+    assert semver.stats()["parsed"][:2] == [("1.2.3", 2), ("1.2", 1)]
+    assert semver.stats()["times"] == {}
+
+
+def test_stats_most_common(enabled):
+    for version in ["1.0.0", "2.0.0", "2.0.0", "3.0.0"]:
+        Version.parse(version)
+    assert semver.stats(most_common=1)["parsed"] == [("2.0.0", 2)]
+    assert len(semver.stats(most_common=None)["parsed"]) == 3
+
+
+def test_stats_parsed_is_bounded(enabled, monkeypatch):
+    monkeypatch.setattr(_instrument, "MAX_PARSED", 2)
+    for version in ["1.0.0", "1.0.0", "2.0.0", "2.0.0", "2.0.0", "3.0.0"]:
+        Version.parse(version)
+    Version.parse("4.0.0")
+    Version.parse("5.0.0")
+    parsed = semver.stats(most_common=None)["parsed"]
+    assert len(parsed) <= 4
+    assert parsed[:2] == [("2.0.0", 3), ("1.0.0", 2)]
+
+
+def test_stats_timing():
+    semver.enable_stats(timing=True)
+    try:
+        Version.parse("1.2.3").bump_minor()
+    finally:
+        semver.disable_stats()
+    times = semver.stats()["times"]
+    semver.reset_stats()
+    assert set(times) == {"parse", "bump_minor"}
+    assert all(t >= 0 for t in times.values())
+
+
+def test_stats_subclass(enabled):
+    class MyVersion(Version):
+        pass
+
+    v = MyVersion.parse("1.2.3")
+    assert type(v) is MyVersion
+    assert type(v.bump_patch()) is MyVersion
+    assert semver.stats()["calls"]["parse"] == 1
+
+
+def test_disable_stats_restores_methods():
+    names = _instrument.INSTRUMENTED
+    originals = {name: Version.__dict__[name] for name in names}
+    semver.enable_stats()
+    semver.enable_stats(timing=True)
+    assert semver.stats_enabled()
+    assert Version.__dict__["compare"] is not originals["compare"]
+    semver.disable_stats()
+    assert not semver.stats_enabled()
+    assert {name: Version.__dict__[name] for name in names} == originals
+    semver.reset_stats()
@@ -0,0 +1,67 @@
+import gc
+import pickle
+import sys
+import weakref
+
+import pytest
+
+import semver
+from semver import Version
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    semver.intern_pool.clear()
+    yield
+    semver.intern_pool.clear()
+
+
+def test_version_supports_weak_references():
+    version = Version(1, 2, 3)
+    ref = weakref.ref(version)
+    assert ref() is version
+    del version
+    gc.collect()
+    assert ref() is None
+
+
+def test_intern_returns_canonical_instance():
+    first = Version.parse("1.2.3-rc.1+build.5").intern()
+    second = Version.parse("1.2.3-rc.1+build.5").intern()
+    assert first is second
+    assert len(semver.intern_pool) == 1
+
+
+@pytest.mark.parametrize("other", ["1.2.3-rc.1", "1.2.3-rc.1+build.6", "1.2.3"])
+def test_intern_distinguishes_build_and_prerelease(other):
+    version = Version.parse("1.2.3-rc.1+build.5").intern()
+    assert Version.parse(other).intern() is not version
+
+
+def test_intern_distinguishes_classes():
+    class MyVersion(Version):
+        pass
+
+    version = Version(1).intern()
+    mine = MyVersion(1).intern()
+    assert mine is not version
+    assert type(mine) is MyVersion
+
+
+def test_intern_interns_strings():
+    prerelease = "".join(["rc", ".", "1"])
+    build = "".join(["build", ".", "5"])
+    version = Version(1, 2, 3, prerelease, build).intern()
+    assert version.prerelease is sys.intern("rc.1")
+    assert version.build is sys.intern("build.5")
+
+
+def test_intern_pool_holds_weak_references():
+    Version(1, 2, 3).intern()
+    gc.collect()
+    assert len(semver.intern_pool) == 0
+
+
+def test_interned_version_can_be_pickled():
+    version = Version.parse("1.2.3-rc.1").intern()
+    assert pickle.loads(pickle.dumps(version)) == version
@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import semver
+
+#: Modules which ``import semver`` should not load
+HEAVY_MODULES = (
+    "argparse",
+    "inspect",
+    "warnings",
+    "semver.cli",
+    "semver._deprecated",
+    "semver._instrument",
+    "semver.range",
+    "semver.containers",
+)
+
+
+def imported_modules(code):
+    """Return the names of all modules which are imported by *code*."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(Path(semver.__file__).parent.parent)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_import_semver_does_not_load_heavy_modules():
+    # Some modules are already loaded by the standard library modules
+    # which semver needs on some Python versions
+    baseline = imported_modules("import re, typing, functools")
+    modules = imported_modules("import semver; semver.Version.parse('1.2.3')")
+    assert "semver.version" in modules
+    assert [
+        name for name in HEAVY_MODULES if name in modules and name not in baseline
+    ] == []
+
+
+@pytest.mark.parametrize("name", ["compare", "cmd_bump", "main"])
+def test_lazy_attributes_are_available(name):
+    assert name in semver.__all__
+    assert name in dir(semver)
+    assert getattr(semver, name) is getattr(semver._deprecated, name)
+
+
+@pytest.mark.parametrize(
+    "name, module",
+    [
+        ("Range", "semver.range"),
+        ("VersionRange", "semver.range"),
+        ("VersionIndex", "semver.containers"),
+        ("VersionArray", "semver.containers"),
+    ],
+)
+def test_lazy_classes(name, module):
+    assert name in semver.__all__
+    assert name in dir(semver)
+    assert getattr(semver, name) is getattr(sys.modules[module], name)
+
+
+@pytest.mark.parametrize("name", ["enable_stats", "stats"])
+def test_lazy_stats_functions(name):
+    assert name in semver.__all__
+    assert name in dir(semver)
+    assert getattr(semver, name) is getattr(semver._instrument, name)
+
+
+def test_lazy_cli_module():
+    assert "cli" in dir(semver)
+    assert semver.cli.main is sys.modules["semver.cli"].main
+
+
+def test_all_names_are_available():
+    for name in semver.__all__:
+        assert getattr(semver, name) is not None
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        _ = semver.nope
@@ -1,6 +1,9 @@
+import gc
+import weakref
+
 import pytest
 
-from semver import match
+from semver import Version, compile_match, match
 
 
 def test_should_match_simple():
@@ -64,3 +67,61 @@ def test_should_raise_value_error_for_unexpected_match_expression(left, right):
 def test_should_raise_value_error_for_invalid_match_expression(left, right):
     with pytest.raises(ValueError):
         match(left, right)
+
+
+@pytest.mark.parametrize(
+    "expr,versions,expected",
+    [
+        (">=2.0.0", ["1.9.9", "2.0.0", "2.0.1-rc.1"], [False, True, True]),
+        ("<2.0.0", ["1.9.9", "2.0.0-rc.1", "2.0.0"], [True, True, False]),
+        ("!=2.0.0", ["2.0.0", "2.0.0+build.1", "2.0.1"], [False, False, True]),
+        ("2.0.0", ["2.0.0", "2.0.0+build.1", "2.0.1"], [True, True, False]),
+    ],
+)
+def test_compile_match(expr, versions, expected):
+    predicate = compile_match(expr)
+    assert [predicate(Version.parse(v)) for v in versions] == expected
+    assert [predicate(v) for v in versions] == expected
+
+
+def test_compile_match_is_cached():
+    assert compile_match(">=1.0.0") is compile_match(">=1.0.0")
+
+
+def test_compile_match_uses_version_class():
+    class VPrefixVersion(Version):
+        @classmethod
+        def parse(cls, version, optional_minor_and_patch=False):
+            return super().parse(version.lstrip("v"), optional_minor_and_patch)
+
+    predicate = compile_match("<v2.0.0", VPrefixVersion)
+    assert isinstance(predicate.version, VPrefixVersion)
+    assert predicate("v1.0.0")
+    assert VPrefixVersion.parse("v1.0.0").match("<v2.0.0")
+
+
+def test_compile_match_caches_per_class():
+    class MyVersion(Version):
+        pass
+
+    predicate = compile_match(">=1.0.0", MyVersion)
+    assert compile_match(">=1.0.0", MyVersion) is predicate
+    assert compile_match(">=1.0.0") is not predicate
+    assert type(predicate.version) is MyVersion
+
+
+def test_compile_match_does_not_keep_classes_alive():
+    class MyVersion(Version):
+        pass
+
+    assert MyVersion.parse("1.2.3").match(">=1.0.0")
+    ref = weakref.ref(MyVersion)
+    del MyVersion
+    gc.collect()
+    assert ref() is None
+
+
+@pytest.mark.parametrize("expr", ["", "!", "=1.0.0", "~1.0.0", ">=1.0"])
+def test_compile_match_with_invalid_expression(expr):
+    with pytest.raises(ValueError):
+        compile_match(expr)
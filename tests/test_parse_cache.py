@@ -0,0 +1,74 @@
+import pytest
+
+from semver import Version
+
+
+class CachedVersion(Version):
+    pass
+
+
+@pytest.fixture
+def cached():
+    CachedVersion.enable_parse_cache(maxsize=2)
+    yield CachedVersion
+    CachedVersion.disable_parse_cache()
+
+
+def test_parse_cache_is_disabled_by_default():
+    assert Version.parse_cache_info() is None
+    assert Version.parse("1.2.3") is not Version.parse("1.2.3")
+
+
+def test_parse_cache_returns_same_instance(cached):
+    first = cached.parse("1.2.3-rc.1+build.5")
+    assert cached.parse("1.2.3-rc.1+build.5") is first
+    assert cached.parse(b"1.2.3-rc.1+build.5") is first
+    assert cached.parse_cache_info() == (2, 1, 2, 1)
+
+
+def test_parse_cache_is_bounded(cached):
+    for version in ("1.0.0", "2.0.0", "3.0.0"):
+        cached.parse(version)
+    info = cached.parse_cache_info()
+    assert info.currsize == 2
+    assert info.maxsize == 2
+
+
+def test_parse_cache_is_per_class(cached):
+    cached.parse("1.2.3")
+    assert Version.parse_cache_info() is None
+    assert type(cached.parse("1.2.3")) is cached
+
+
+def test_parse_cache_is_separate_for_optional_minor_and_patch(cached):
+    short = cached.parse("1.2", optional_minor_and_patch=True)
+    assert cached.parse("1.2", optional_minor_and_patch=True) is short
+    assert cached.parse_cache_info(optional_minor_and_patch=True).hits == 1
+    assert cached.parse_cache_info().currsize == 0
+    with pytest.raises(ValueError):
+        cached.parse("1.2")
+
+
+def test_parse_cache_does_not_cache_errors(cached):
+    with pytest.raises(ValueError):
+        cached.parse("1.2")
+    assert cached.parse_cache_info().currsize == 0
+
+
+def test_clear_parse_cache(cached):
+    cached.parse("1.2.3")
+    cached.parse("1.2.3")
+    cached.clear_parse_cache()
+    assert cached.parse_cache_info() == (0, 0, 2, 0)
+
+
+def test_clear_parse_cache_when_disabled():
+    Version.clear_parse_cache()
+    assert Version.parse_cache_info() is None
+
+
+def test_disable_parse_cache(cached):
+    cached.parse("1.2.3")
+    cached.disable_parse_cache()
+    assert cached.parse_cache_info() is None
+    assert cached.parse("1.2.3") is not cached.parse("1.2.3")
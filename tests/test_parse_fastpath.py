@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from semver import Version
+
+
+def regex_parse(version, optional_minor_and_patch=False):
+    """Parse a version only with the regex (the reference implementation)."""
+    if optional_minor_and_patch:
+        regex = Version._REGEX_OPTIONAL_MINOR_AND_PATCH
+    else:
+        regex = Version._REGEX
+    match = regex.match(version)
+    if match is None:
+        return None
+    parts = match.groupdict()
+    return Version(parts["major"], parts["minor"] or 0, parts["patch"] or 0, None, None)
+
+
+def random_versions(count, seed=42):
+    rnd = random.Random(seed)
+    alphabet = "0000111239....a\n٢ x"
+    for _ in range(count):
+        yield "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 9)))
+
+
+CORNER_CASES = [
+    "",
+    ".",
+    "1",
+    "1.",
+    "1.2",
+    "1.2.",
+    "1..3",
+    "1.2.3",
+    "0.0.0",
+    "00.0.0",
+    "1.02.3",
+    "1.2.30",
+    "1.2.3.4",
+    "1.2.3\n",
+    "1.2.3\n\n",
+    " 1.2.3",
+    "1.2.3 ",
+    "1٢.0.0",
+    "٢.0.0",
+    "1.².0",
+    "99999999999999999999.0.0",
+]
+
+
+@pytest.mark.parametrize("optional_minor_and_patch", [False, True])
+@pytest.mark.parametrize("version", CORNER_CASES)
+def test_scanner_matches_regex_for_corner_cases(version, optional_minor_and_patch):
+    expected = regex_parse(version, optional_minor_and_patch)
+    try:
+        result = Version.parse(version, optional_minor_and_patch)
+    except ValueError:
+        result = None
+    assert (result and result.to_tuple()) == (expected and expected.to_tuple())
+
+
+@pytest.mark.parametrize("optional_minor_and_patch", [False, True])
+def test_scanner_matches_regex_for_random_strings(optional_minor_and_patch):
+    for version in random_versions(5000):
+        expected = regex_parse(version, optional_minor_and_patch)
+        scanned = Version._scan_numbers(version, optional_minor_and_patch)
+        if scanned is not None:
+            assert expected is not None, version
+            numbers = tuple(int(part) for part in scanned)
+            assert numbers == expected.to_tuple()[: len(scanned)], version
+
+
+@pytest.mark.parametrize("version", ["1.2.3", "1.2.x", "1.2", "1.2.3-rc.1", "٣.2.1"])
+def test_numbers_are_scanned_at_most_once(version):
+    calls = []
+
+    class CountingVersion(Version):
+        @staticmethod
+        def _scan_numbers(version, optional_minor_and_patch):
+            calls.append(version)
+            return Version._scan_numbers(version, optional_minor_and_patch)
+
+    try:
+        CountingVersion.parse(version)
+    except ValueError:
+        pass
+    assert len(calls) <= 1
@@ -0,0 +1,87 @@
+import pytest
+from semverwithvprefix import SemVerWithVPrefix
+
+from semver import Version
+
+
+def test_parse_many_yields_versions():
+    result = Version.parse_many(["1.0.0", b"2.0.0-rc.1", "3.0.0+build.1"])
+    assert [str(v) for v in result] == ["1.0.0", "2.0.0-rc.1", "3.0.0+build.1"]
+
+
+def test_parse_many_is_lazy():
+    def versions():
+        yield "1.0.0"
+        raise AssertionError("consumed too early")
+
+    result = Version.parse_many(versions())
+    assert next(result) == Version(1)
+
+
+@pytest.mark.parametrize(
+    "invalid,exception", [("1.0", ValueError), (None, TypeError), (1, TypeError)]
+)
+def test_parse_many_raises_by_default(invalid, exception):
+    result = Version.parse_many(["1.0.0", invalid, "2.0.0"])
+    assert next(result) == Version(1)
+    with pytest.raises(exception):
+        next(result)
+
+
+def test_parse_many_skips_invalid_items():
+    result = Version.parse_many(["1.0.0", "1.0", None, "2.0.0"], on_error="skip")
+    assert list(result) == [Version(1), Version(2)]
+    assert result.errors == []
+
+
+def test_parse_many_collects_invalid_items():
+    result = Version.parse_many(["x", "1.0.0", "1.0", None], on_error="collect")
+    assert list(result) == [Version(1)]
+    assert result.errors == [(0, "x"), (2, "1.0"), (3, None)]
+
+
+def test_parse_many_with_optional_minor_and_patch():
+    result = Version.parse_many(["1", "1.2", "1.2.3"], optional_minor_and_patch=True)
+    assert list(result) == [Version(1), Version(1, 2), Version(1, 2, 3)]
+
+
+def test_parse_many_with_invalid_on_error():
+    with pytest.raises(ValueError, match="on_error must be one of"):
+        Version.parse_many([], on_error="ignore")
+
+
+def test_parse_many_uses_parse_cache():
+    class CachedVersion(Version):
+        pass
+
+    CachedVersion.enable_parse_cache()
+    try:
+        first, second = CachedVersion.parse_many(["1.2.3", "1.2.3"])
+        assert first is second
+    finally:
+        CachedVersion.disable_parse_cache()
+
+
+def test_parse_many_respects_overridden_parse():
+    class VPrefixVersion(Version):
+        @classmethod
+        def parse(cls, version, optional_minor_and_patch=False):
+            return super().parse(version[1:], optional_minor_and_patch)
+
+    result = VPrefixVersion.parse_many(["v1.2.3", "1.2.3"], on_error="collect")
+    assert [type(v) for v in result] == [VPrefixVersion]
+    assert result.errors == [(1, "1.2.3")]
+
+
+def test_parse_many_respects_overridden_parse_with_cache():
+    class VPrefixVersion(SemVerWithVPrefix):
+        pass
+
+    VPrefixVersion.enable_parse_cache()
+    try:
+        first, second = VPrefixVersion.parse_many(["v1.2.3", "v1.2.3"])
+        assert first == VPrefixVersion.parse("v1.2.3")
+        assert first is second
+        assert type(first) is VPrefixVersion
+    finally:
+        VPrefixVersion.disable_parse_cache()
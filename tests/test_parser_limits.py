@@ -0,0 +1,161 @@
+import random
+
+import pytest
+
+from semver import Version
+from semver._scanner import ScanError, check_limits, scan
+
+
+class LinearVersion(Version):
+    LINEAR_PARSING = True
+
+
+class LimitedVersion(Version):
+    MAX_LENGTH = 64
+    MAX_IDENTIFIERS = 4
+    MAX_DIGITS = 6
+
+
+def regex_scan(version, optional_minor_and_patch=False):
+    """Split a version only with the regex (the reference implementation)."""
+    if optional_minor_and_patch:
+        regex = Version._REGEX_OPTIONAL_MINOR_AND_PATCH
+    else:
+        regex = Version._REGEX
+    match = regex.match(version)
+    if match is None:
+        return None
+    return match.group("major", "minor", "patch", "prerelease", "build")
+
+
+def random_versions(count, seed=42):
+    rnd = random.Random(seed)
+    alphabet = "000112399.....--++aZ\n٢ x_"
+    for _ in range(count):
+        yield "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 14)))
+
+
+CORNER_CASES = [
+    "",
+    "1",
+    "1.2",
+    "1.2.3",
+    "1.2.3-",
+    "1.2.3+",
+    "1.2-rc",
+    "1-rc+b",
+    "1.2.3-0",
+    "1.2.3-00",
+    "1.2.3-01",
+    "1.2.3-0a",
+    "1.2.3-a..b",
+    "1.2.3-a.",
+    "1.2.3-.a",
+    "1.2.3--",
+    "1.2.3---",
+    "1.2.3-٢",
+    "1.2.3-٢a",
+    "1.2.3-a٢",
+    "1.2.3-rc.1+build.01",
+    "1.2.3+build..1",
+    "1.2.3+--",
+    "1.2.3+a+b",
+    "1.2.3+a-b-c",
+    "1.2.3-a+b-c",
+    "1.2.3-rc\n",
+    "1.2.3+b\n",
+    "1.2.3+b\n\n",
+    "1.2.3-r\nc",
+    "1.2.3-ä",
+    "01.2.3-rc",
+    "1.2.3.4-rc",
+]
+
+
+@pytest.mark.parametrize("optional_minor_and_patch", [False, True])
+@pytest.mark.parametrize("version", CORNER_CASES)
+def test_scan_matches_regex_for_corner_cases(version, optional_minor_and_patch):
+    expected = regex_scan(version, optional_minor_and_patch)
+    result = scan(version, optional_minor_and_patch)
+    if expected is None:
+        assert isinstance(result, ScanError)
+    else:
+        assert result == expected
+
+
+@pytest.mark.parametrize("optional_minor_and_patch", [False, True])
+def test_scan_matches_regex_for_random_strings(optional_minor_and_patch):
+    for version in random_versions(20000):
+        expected = regex_scan(version, optional_minor_and_patch)
+        result = scan(version, optional_minor_and_patch)
+        if expected is None:
+            assert isinstance(result, ScanError), version
+        else:
+            assert result == expected, version
+
+
+@pytest.mark.parametrize(
+    "version,reason,position",
+    [
+        ("", "invalid major part", 0),
+        ("1.x.3", "invalid minor part", 2),
+        ("1.2.3.4", "invalid patch part", 4),
+        ("1.2", "missing patch part", 3),
+        ("1.2.3-rc.01", "invalid prerelease identifier", 9),
+        ("1.2.3+b..c", "invalid build identifier", 8),
+    ],
+)
+def test_scan_reports_reason_and_position(version, reason, position):
+    assert scan(version) == ScanError(reason, position)
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["1.2.3", "1.0", "1.2.3-rc.1+build.5", "1.2.3-rc\n", "1.2.3-٢a"],
+)
+def test_linear_parsing_gives_same_result(version):
+    expected = Version.parse(version, optional_minor_and_patch=True)
+    result = LinearVersion.parse(version, optional_minor_and_patch=True)
+    assert result.to_tuple() == expected.to_tuple()
+    assert type(result) is LinearVersion
+
+
+@pytest.mark.parametrize("version", ["1.2.3-", "1.2.3-a..b", "1.2.3+"])
+def test_linear_parsing_raises_for_invalid_version(version):
+    with pytest.raises(ValueError, match="is not valid SemVer string"):
+        LinearVersion.parse(version)
+
+
+@pytest.mark.parametrize(
+    "version,message",
+    [
+        ("1.2.3-" + "a" * 64, "longer than 64 characters"),
+        ("1.2.3-a.b.c.d.e", "more than 4 prerelease identifiers"),
+        ("1.2.3+a.b.c.d.e", "more than 4 build identifiers"),
+        ("1234567.0.0", "more than 6 digits"),
+        ("1.2.3-rc.1234567", "more than 6 digits"),
+        ("1" * 100000, "longer than 64 characters"),
+    ],
+)
+def test_limits_raise_value_error(version, message):
+    with pytest.raises(ValueError, match=message):
+        LimitedVersion.parse(version)
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["1.2.3-a.b.c.d+e.f.g.h", "123456.0.0-rc.123456", "1.2.3-abcdefghijk"],
+)
+def test_limits_accept_versions_within_limits(version):
+    assert LimitedVersion.parse(version) == Version.parse(version)
+
+
+def test_limits_are_checked_before_matching():
+    # An invalid version which exceeds a limit reports the limit
+    with pytest.raises(ValueError, match="more than 6 digits"):
+        LimitedVersion.parse("1234567.x")
+
+
+def test_no_limits_by_default():
+    assert check_limits("1" * 1000, None, None, None) is None
+    assert Version.parse("1.2.3-" + ".".join("a" * 1000)).prerelease
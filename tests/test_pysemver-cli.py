@@ -1,5 +1,6 @@
 from argparse import Namespace
 from contextlib import contextmanager
+from io import StringIO
 from unittest.mock import patch
 
 import pytest
@@ -13,6 +14,8 @@ from semver import (
     main,
     __main__,
 )
+from semver.cli import external_sort
+from semver.version import Version
 
 
 @contextmanager
@@ -142,3 +145,173 @@ def test_main_file_should_call_cli_main(package_name):
         with patch("semver.__main__.__package__", package_name):
             __main__.main()
             mocked_main.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "cli,lines,out,err",
+    [
+        (["check", "-"], "1.2.3\n\n2.0.0-rc.1\n", "", []),
+        (["check", "-"], "1.2.3\n1.2\n3.0.0\n", "", ["ERROR line 2: Invalid"]),
+        (["bump", "minor", "-"], "1.2.3\n2.0.0\n", "1.3.0\n2.1.0\n", []),
+        (
+            ["bump", "major", "-"],
+            "1.2.3\nx\n2.0.0\n",
+            "2.0.0\n3.0.0\n",
+            ["ERROR line 2:"],
+        ),
+        (["compare", "-", "2.0.0"], "1.0.0\n2.0.0\n3.0.0\n", "-1\n0\n1\n", []),
+        (["compare", "2.0.0", "-"], "1.0.0\n3.0.0\n", "1\n-1\n", []),
+        (
+            ["compare", "-", "-"],
+            "1.0.0 2.0.0\n 2.0.0\t1.0.0 \n1.0.0\n",
+            "-1\n1\n",
+            ["ERROR line 3: Expected two versions"],
+        ),
+        (["nextver", "-", "minor"], "1.2.3\n1.3.0-rc.1\n", "1.3.0\n1.3.0\n", []),
+    ],
+)
+def test_should_process_lines_from_stdin(capsys, monkeypatch, cli, lines, out, err):
+    monkeypatch.setattr("sys.stdin", StringIO(lines))
+    rc = main(cli)
+    captured = capsys.readouterr()
+    assert captured.out == out
+    errors = captured.err.splitlines()
+    if err:
+        assert rc == 2
+        assert errors[0].startswith(err[0])
+        total = len([line for line in lines.splitlines() if line.strip()])
+        assert errors[-1] == "ERROR 1 of %d lines failed" % total
+    else:
+        assert rc == 0
+        assert not errors
+
+
+SORT_INPUT = [
+    "1.10.0",
+    "1.9.0",
+    "1.10.0-rc.1",
+    "1.9.0+build.2",
+    "1.10.0-rc.1+b",
+    "0.1.0",
+    "2.0.0-alpha.10",
+    "2.0.0-alpha.9",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("unique", [False, True])
+def test_should_sort_versions(capsys, monkeypatch, chunk_size, reverse, unique):
+    monkeypatch.setattr("sys.stdin", StringIO("\n".join(SORT_INPUT) + "\n\n"))
+    cli = ["sort", "--chunk-size", str(chunk_size)]
+    cli += ["--reverse"] * reverse + ["--unique"] * unique
+    assert main(cli) == 0
+    expected = sorted(
+        SORT_INPUT, key=lambda v: Version.parse(v).precedence_key, reverse=reverse
+    )
+    if unique:
+        expected.remove("1.9.0+build.2")
+        expected.remove("1.10.0-rc.1+b")
+    assert capsys.readouterr().out.splitlines() == expected
+
+
+def test_should_sort_files(capsys, tmp_path):
+    first = tmp_path / "first.txt"
+    first.write_text("2.0.0\n1.0.0\n")
+    second = tmp_path / "second.txt"
+    second.write_text("1.5.0\n")
+    assert main(["sort", str(first), str(second)]) == 0
+    assert capsys.readouterr().out.splitlines() == ["1.0.0", "1.5.0", "2.0.0"]
+
+
+def test_should_report_missing_file_for_sort(capsys, tmp_path):
+    missing = tmp_path / "missing.txt"
+    assert main(["sort", str(missing)]) == 2
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert captured.err.startswith("ERROR [Errno 2]")
+    assert str(missing) in captured.err
+
+
+def test_should_sort_and_skip_invalid_versions(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("2.0.0\n1.0\n1.0.0\n"))
+    assert main(["sort", "--skip-invalid"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["1.0.0", "2.0.0"]
+
+
+def test_should_not_sort_invalid_versions(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO("2.0.0\n1.0\n1.0.0\n"))
+    assert main(["sort"]) == 2
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert captured.err.startswith("ERROR <stdin>:2: 1.0 is not valid")
+
+
+def test_external_sort_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(external_sort([], chunk_size=0))
+
+
+STREAM_INPUT = "1.2.0\n0.9.0\n2.0.0-rc.1\n2.0.0\n2.0.0+build.1\n0.9.0+build.1\n"
+
+
+@pytest.mark.parametrize(
+    "cli,expected",
+    [
+        (["filter", ">=1.0.0"], ["1.2.0", "2.0.0-rc.1", "2.0.0", "2.0.0+build.1"]),
+        (["filter", "<2.0.0"], ["1.2.0", "0.9.0", "2.0.0-rc.1", "0.9.0+build.1"]),
+        (["filter", "==2.0.0"], ["2.0.0", "2.0.0+build.1"]),
+        (["filter", ">3.0.0"], []),
+        (["max"], ["2.0.0"]),
+        (["min"], ["0.9.0"]),
+    ],
+)
+def test_should_process_version_stream(capsys, monkeypatch, cli, expected):
+    monkeypatch.setattr("sys.stdin", StringIO(STREAM_INPUT))
+    assert main(cli) == 0
+    assert capsys.readouterr().out.splitlines() == expected
+
+
+@pytest.mark.parametrize("command", [["filter", ">=1.0.0"], ["max"], ["min"]])
+def test_should_process_version_stream_with_invalid(capsys, monkeypatch, command):
+    monkeypatch.setattr("sys.stdin", StringIO("1.0.0\nx\n"))
+    assert main(command + ["--skip-invalid"]) == 0
+    assert capsys.readouterr().out == "1.0.0\n"
+    monkeypatch.setattr("sys.stdin", StringIO("1.0.0\nx\n"))
+    assert main(command) == 2
+    assert capsys.readouterr().err.startswith("ERROR <stdin>:2:")
+
+
+@pytest.mark.parametrize("command", ["max", "min"])
+def test_should_raise_error_for_empty_stream(capsys, monkeypatch, command):
+    monkeypatch.setattr("sys.stdin", StringIO("\n"))
+    assert main([command]) == 2
+    assert capsys.readouterr().err == "ERROR No versions found\n"
+
+
+def test_should_filter_files(capsys, tmp_path):
+    path = tmp_path / "versions.txt"
+    path.write_text(STREAM_INPUT)
+    assert main(["filter", "!=2.0.0", str(path)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "1.2.0",
+        "0.9.0",
+        "2.0.0-rc.1",
+        "0.9.0+build.1",
+    ]
+
+
+@pytest.mark.parametrize("command", [["filter", ">=1.0.0"], ["max"], ["min"]])
+def test_should_report_missing_file(capsys, tmp_path, command):
+    missing = tmp_path / "missing.txt"
+    assert main(command + [str(missing)]) == 2
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert captured.err.startswith("ERROR [Errno 2]")
+    assert str(missing) in captured.err
+
+
+def test_should_reject_invalid_filter_expression(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", StringIO(STREAM_INPUT))
+    assert main(["filter", "~1.0.0"]) == 2
+    assert capsys.readouterr().err.startswith("ERROR match_expr")
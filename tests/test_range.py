@@ -0,0 +1,247 @@
+import pytest
+
+from semver import Range, Version, VersionRange
+from semver.range import MAX_KEY, MIN_KEY
+
+
+@pytest.mark.parametrize(
+    "expression,normalized",
+    [
+        # Comparators
+        ("1.2.3", "1.2.3"),
+        ("=1.2.3", "1.2.3"),
+        ("==1.2.3", "1.2.3"),
+        ("v1.2.3", "1.2.3"),
+        ("1.2.3+build.1", "1.2.3"),
+        ("1.2.3-rc.1", "1.2.3-rc.1"),
+        ("!=1.2.3", "<1.2.3 || >=1.2.4-0"),
+        (">1.2.3", ">=1.2.4-0"),
+        (">=1.2.3", ">=1.2.3"),
+        ("<1.2.3", "<1.2.3"),
+        ("<=1.2.3", "<1.2.4-0"),
+        (">1.2.3-rc", ">=1.2.3-rc.0"),
+        # X-ranges
+        ("", "*"),
+        ("*", "*"),
+        ("x", "*"),
+        ("1", ">=1.0.0 <2.0.0-0"),
+        ("1.x", ">=1.0.0 <2.0.0-0"),
+        ("1.X.x", ">=1.0.0 <2.0.0-0"),
+        ("1.2", ">=1.2.0 <1.3.0-0"),
+        ("1.2.*", ">=1.2.0 <1.3.0-0"),
+        (">1.2", ">=1.3.0-0"),
+        (">=1.2", ">=1.2.0"),
+        ("<1.2", "<1.2.0-0"),
+        ("<=1.2", "<1.3.0-0"),
+        ("<*", "<0.0.0-0"),
+        (">*", "<0.0.0-0"),
+        (">=*", "*"),
+        # Tilde ranges
+        ("~1.2.3", ">=1.2.3 <1.3.0-0"),
+        ("~1.2", ">=1.2.0 <1.3.0-0"),
+        ("~1", ">=1.0.0 <2.0.0-0"),
+        ("~0.2.3", ">=0.2.3 <0.3.0-0"),
+        ("~1.2.3-beta.2", ">=1.2.3-beta.2 <1.3.0-0"),
+        # Caret ranges
+        ("^1.2.3", ">=1.2.3 <2.0.0-0"),
+        ("^0.2.3", ">=0.2.3 <0.3.0-0"),
+        ("^0.0.3", "0.0.3"),
+        ("^1.2.3-beta.2", ">=1.2.3-beta.2 <2.0.0-0"),
+        ("^1.2.x", ">=1.2.0 <2.0.0-0"),
+        ("^0.0.x", ">=0.0.0 <0.1.0-0"),
+        ("^0.0", ">=0.0.0 <0.1.0-0"),
+        ("^1.x", ">=1.0.0 <2.0.0-0"),
+        ("^0.x", ">=0.0.0 <1.0.0-0"),
+        # Hyphen ranges
+        ("1.2.3 - 2.3.4", ">=1.2.3 <2.3.5-0"),
+        ("1.2 - 2.3.4", ">=1.2.0 <2.3.5-0"),
+        ("1.2.3 - 2.3", ">=1.2.3 <2.4.0-0"),
+        ("1.2.3 - 2", ">=1.2.3 <3.0.0-0"),
+        ("* - 2", "<3.0.0-0"),
+        # Combinations
+        (">=1.2.3 <2.0.0", ">=1.2.3 <2.0.0"),
+        (">= 1.2.3, < 2.0.0", ">=1.2.3 <2.0.0"),
+        (">=2.0.0 <1.0.0", "<0.0.0-0"),
+        ("<1.0.0 || >=2.0.0", "<1.0.0 || >=2.0.0"),
+        ("^1.2 || ^1.4", ">=1.2.0 <2.0.0-0"),
+        ("1.2.3 || 1.2.4-0", ">=1.2.3 <1.2.4-0.0"),
+        ("~1.2 || 1.3.0 - 1.4.0", ">=1.2.0 <1.3.0-0 || >=1.3.0 <1.4.1-0"),
+        ("~1.2 || >=1.3.0-0 <1.5", ">=1.2.0 <1.5.0-0"),
+    ],
+)
+def test_range_normalization(expression, normalized):
+    rng = Range(expression)
+    assert str(rng) == normalized
+    assert Range(normalized) == rng
+
+
+@pytest.mark.parametrize(
+    "expression,inside,outside",
+    [
+        (
+            "^1.2.3",
+            ["1.2.3", "1.2.3+build", "1.9.9", "1.9.9-rc.1", "1.10.0"],
+            ["1.2.2", "1.2.3-rc.1", "2.0.0-0", "2.0.0"],
+        ),
+        (
+            "<2.0.0",
+            ["0.0.0-0", "1.99.0", "2.0.0-rc.1"],
+            ["2.0.0", "2.0.0+build.1", "3.0.0"],
+        ),
+        (
+            "1.x || >=3.0.0-rc.1 <3.0.0",
+            ["1.0.0", "1.5.0-rc.1", "3.0.0-rc.1", "3.0.0-rc.2"],
+            ["0.9.0", "1.0.0-rc.1", "2.0.0", "3.0.0-beta", "3.0.0"],
+        ),
+        ("!=1.2.3", ["1.2.2", "1.2.3-rc.1", "1.2.4"], ["1.2.3", "1.2.3+build.2"]),
+    ],
+)
+def test_range_membership(expression, inside, outside):
+    rng = Range(expression)
+    for version in inside:
+        assert version in rng, version
+        assert Version.parse(version) in rng, version
+        assert rng.match(version)
+    for version in outside:
+        assert version not in rng, version
+        assert not rng.match(Version.parse(version))
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "foo",
+        "1.2.3.4",
+        "01.2.3",
+        "1.2-rc.1",
+        "1.2.3-",
+        "1.2.3-01",
+        ">=1.2.3 -",
+        ">=1.2.3 - 2.0.0",
+        "~>1.2.3",
+        "1.2.3 || |",
+    ],
+)
+def test_range_with_invalid_expression(expression):
+    with pytest.raises(ValueError):
+        Range(expression)
+
+
+def test_range_with_invalid_type():
+    with pytest.raises(TypeError):
+        Range(None)
+
+
+def test_range_intervals():
+    assert Range("*").intervals == ((MIN_KEY, MAX_KEY),)
+    assert Range(">2 <1").intervals == ()
+    assert Range("1.2.3").intervals == (
+        (Version(1, 2, 3).precedence_key, Version(1, 2, 4, "0").precedence_key),
+    )
+
+
+def test_range_equality_and_hash():
+    assert Range("^1.2") == Range(">=1.2.0, <2.0.0-0")
+    assert hash(Range("^1.2")) == hash(Range(">=1.2.0 <2.0.0-0"))
+    assert Range("^1.2") != Range("^1.3")
+    assert Range("^1.2") != "^1.2"
+
+
+def test_range_repr():
+    assert repr(Range("~1.2")) == "Range('>=1.2.0 <1.3.0-0')"
+
+
+def test_versionrange_is_range():
+    assert VersionRange is Range
+
+
+SAMPLE_VERSIONS = [
+    Version.parse(v)
+    for v in (
+        "0.0.0-0",
+        "0.9.0",
+        "1.0.0-rc.1",
+        "1.0.0",
+        "1.2.0-0",
+        "1.2.0",
+        "1.2.3-beta",
+        "1.2.3",
+        "1.2.4-0",
+        "1.3.0",
+        "1.4.0-rc.1",
+        "1.4.0",
+        "1.4.9",
+        "1.5.0-0",
+        "1.9.9",
+        "2.0.0-0",
+        "2.0.0",
+        "2.5.0",
+        "3.0.0-rc.1",
+        "3.0.0",
+        "99.0.0",
+    )
+]
+
+ALGEBRA_RANGES = [
+    "*",
+    "<0.0.0-0",
+    "^1.2",
+    "~1.4",
+    "1.4.x",
+    "!=1.2.3",
+    "<1.0.0 || >=2.0.0",
+    ">=1.2.3-beta <1.4.0",
+    "1.2.3 - 2",
+    ">1.9.9 <3.0.0-rc.1",
+]
+
+
+@pytest.mark.parametrize("left", ALGEBRA_RANGES)
+@pytest.mark.parametrize("right", ALGEBRA_RANGES)
+def test_range_algebra_agrees_with_membership(left, right):
+    left, right = Range(left), Range(right)
+    for version in SAMPLE_VERSIONS:
+        in_left, in_right = version in left, version in right
+        assert (version in left & right) == (in_left and in_right)
+        assert (version in left | right) == (in_left or in_right)
+        assert (version in left - right) == (in_left and not in_right)
+        assert (version in ~left) == (not in_left)
+    assert left.is_subset(right) == (left - right).is_empty()
+    assert left.is_subset(left | right)
+    assert (left & right).is_subset(left)
+
+
+def test_range_algebra_with_expressions():
+    rng = Range("^1.2")
+    assert rng.intersection("~1.4", ">=1.4.2") == Range(">=1.4.2 <1.5.0-0")
+    assert rng.union("^2", "^3") == Range(">=1.2.0 <2.0.0-0 || 2.x || 3.x")
+    assert rng.difference("1.4.x", "1.5.x") == Range(
+        ">=1.2.0 <1.4.0 || >=1.5.0-0 <1.5.0 || >=1.6.0-0 <2.0.0-0"
+    )
+    assert rng & "~1.4" == Range("~1.4")
+    assert rng | "~1.4" == rng
+    assert rng - "*" == Range("<0.0.0-0")
+
+
+def test_range_complement_is_involution():
+    for expression in ALGEBRA_RANGES:
+        rng = Range(expression)
+        assert ~~rng == rng
+        assert (rng | ~rng) == Range("*")
+        assert (rng & ~rng).is_empty()
+
+
+def test_range_is_empty():
+    assert Range(">=2.0.0 <1.0.0").is_empty()
+    assert Range(">1.2.3 <=1.2.3").is_empty()
+    assert Range(">1.2.3-rc <1.2.3-rc.0").is_empty()
+    assert not Range(">=1.2.3-rc <=1.2.3-rc").is_empty()
+    assert not Range(">1.2.3 <1.2.4-1").is_empty()
+
+
+def test_range_is_subset():
+    assert Range("~1.4.2").is_subset("^1.2")
+    assert not Range("^1.2").is_subset("~1.4.2")
+    assert Range("<0.0.0-0").is_subset("1.2.3")
+    assert Range("1.2.3").is_subset("1.2.3")
+    assert not Range("1.2.3 || 1.2.5").is_subset("1.2.3")
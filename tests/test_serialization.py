@@ -0,0 +1,127 @@
+import copy
+import pickle
+
+import pytest
+
+import semver._encoding
+from semver import Version
+
+VERSIONS = [
+    Version(1, 2, 3),
+    Version(1, 2, 3, "rc.1"),
+    Version(1, 2, 3, None, "build.5"),
+    Version(1, 2, 3, "", ""),
+    Version(2**64 - 1, 0, 0, "ä.1", "b"),
+]
+
+
+class MyVersion(Version):
+    pass
+
+
+class VersionWithDict(Version):
+    __slots__ = ("__dict__",)
+
+
+class VersionWithSlots(Version):
+    __slots__ = ("__private", "extra", "unset")
+
+
+@pytest.mark.parametrize("version", VERSIONS)
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_roundtrip(version, protocol):
+    # Cache the key before pickling
+    key = version.precedence_key
+    restored = pickle.loads(pickle.dumps(version, protocol))
+    assert type(restored) is Version
+    assert restored.to_tuple() == version.to_tuple()
+    assert restored.precedence_key == key
+    assert copy.copy(version).to_tuple() == version.to_tuple()
+    assert copy.deepcopy(version).to_tuple() == version.to_tuple()
+
+
+def test_pickle_is_compact():
+    version = Version(1, 2, 3)
+    # The cached key is not pickled
+    assert version.precedence_key
+    assert b"_key" not in pickle.dumps(version)
+    assert b"_major" not in pickle.dumps(version)
+
+
+def test_pickle_subclass():
+    restored = pickle.loads(pickle.dumps(MyVersion(1, 2, 3, "rc.1")))
+    assert type(restored) is MyVersion
+    assert restored.prerelease == "rc.1"
+
+
+def test_pickle_subclass_state():
+    version = VersionWithDict(1, 2, 3)
+    version.extra = "data"
+    restored = pickle.loads(pickle.dumps(version))
+    assert restored.extra == "data"
+    assert restored == version
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [lambda v: pickle.loads(pickle.dumps(v)), copy.copy, copy.deepcopy],
+)
+def test_pickle_subclass_slots(copier):
+    version = VersionWithSlots(1, 2, 3)
+    version.extra = "data"
+    version._VersionWithSlots__private = 42
+    restored = copier(version)
+    assert type(restored) is VersionWithSlots
+    assert restored.extra == "data"
+    assert restored._VersionWithSlots__private == 42
+    assert not hasattr(restored, "unset")
+    assert restored == version
+
+
+@pytest.mark.parametrize("version", VERSIONS)
+def test_to_bytes_roundtrip(version):
+    data = version.to_bytes()
+    assert Version.from_bytes(data).to_tuple() == version.to_tuple()
+    assert type(MyVersion.from_bytes(data)) is MyVersion
+
+
+def test_to_bytes_overflow():
+    with pytest.raises(OverflowError):
+        Version(2**64).to_bytes()
+
+
+@pytest.mark.parametrize(
+    "version", [Version(1, 2, 3, "rc.1"), Version(1, 2, 3, None, "build.1")]
+)
+def test_to_bytes_string_too_long(monkeypatch, version):
+    # Strings of 4 GiB or more do not fit into the length field
+    monkeypatch.setattr(semver._encoding, "_MAX_LENGTH", 3)
+    with pytest.raises(OverflowError, match="too long"):
+        version.to_bytes()
+    with pytest.raises(OverflowError, match="too long"):
+        Version.dumps_many([version])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", Version(1).to_bytes()[:-1], Version(1, 0, 0, "a").to_bytes()[:-1]],
+)
+def test_from_bytes_truncated(data):
+    with pytest.raises(ValueError):
+        Version.from_bytes(data)
+
+
+def test_from_bytes_trailing_data():
+    with pytest.raises(ValueError, match="unexpected data"):
+        Version.from_bytes(Version(1).to_bytes() + b"x")
+
+
+def test_dumps_many_roundtrip():
+    data = Version.dumps_many(VERSIONS)
+    assert data == b"".join(v.to_bytes() for v in VERSIONS)
+    loaded = MyVersion.loads_many(data)
+    assert [v.to_tuple() for v in loaded] == [v.to_tuple() for v in VERSIONS]
+    assert all(type(v) is MyVersion for v in loaded)
+    assert Version.loads_many(b"") == []
+    with pytest.raises(ValueError):
+        Version.loads_many(data[:-1])
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from semver import Version
+
+VERSIONS = [
+    "0.0.0-0",
+    "0.0.0",
+    "1.0.0-0",
+    "1.0.0-1",
+    "1.0.0-9",
+    "1.0.0-10",
+    "1.0.0-10.a",
+    "1.0.0--",
+    "1.0.0-A",
+    "1.0.0-a",
+    "1.0.0-a.0",
+    "1.0.0-a.b",
+    "1.0.0-aa",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.0.0+build",
+    "1.9.0",
+    "1.10.0",
+    "255.0.0",
+    "256.0.0",
+    "65536.1.2",
+    "1.0.0-%d" % 2**64,
+    "%d.0.0" % 2**64,
+    "%d.0.0" % 2**2100,
+]
+
+
+def test_sortable_bytes_order():
+    versions = [Version.parse(v) for v in VERSIONS]
+    random.Random(3).shuffle(versions)
+    rnd = random.Random(4)
+    for _ in range(300):
+        versions.append(
+            Version(
+                rnd.randint(0, 3),
+                rnd.randint(0, 3),
+                rnd.choice([0, 1, 255, 256, 2**40]),
+                rnd.choice([None, "1", "2", "10", "a", "a.1", "a.a", "b-2"]),
+            )
+        )
+    by_bytes = sorted(versions, key=Version.to_sortable_bytes)
+    by_key = sorted(versions, key=lambda v: (v.precedence_key, v.build or ""))
+    assert [v.to_tuple() for v in by_bytes] == [v.to_tuple() for v in by_key]
+
+
+@pytest.mark.parametrize(
+    "v",
+    [Version.parse(v) for v in VERSIONS + ["1.2.3-rc.1+build.1.2"]]
+    + [Version(1, 2, 3, None, "")],
+)
+def test_sortable_bytes_roundtrip(v):
+    data = v.to_sortable_bytes()
+    assert Version.from_sortable_bytes(data).to_tuple() == v.to_tuple()
+    assert Version.from_sortable_bytes(bytearray(data)) == v
+
+
+def test_sortable_bytes_subclass():
+    class MyVersion(Version):
+        pass
+
+    data = Version(1, 2, 3).to_sortable_bytes()
+    assert type(MyVersion.from_sortable_bytes(data)) is MyVersion
+
+
+@pytest.mark.parametrize("prerelease", ["01", "a\x00b", ""])
+def test_to_sortable_bytes_rejects_ambiguous_identifiers(prerelease):
+    with pytest.raises(ValueError):
+        Version(1, 2, 3, prerelease).to_sortable_bytes()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x01\x01",
+        b"\x01\x01\x00\x00\x02ab",
+        b"\x01\x01\x00\x00\x00",
+        b"\x01\x01\x00\x00\x07\x00",
+        b"\x01\x01\x00\x00\x03-build",
+        b"\x05\x01",
+    ],
+)
+def test_from_sortable_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        Version.from_sortable_bytes(data)
@@ -0,0 +1,127 @@
+import random
+
+import pytest
+from semverwithvprefix import SemVerWithVPrefix
+
+from semver import Version
+from semver._scanner import ScanError
+
+
+class LimitedVersion(Version):
+    MAX_LENGTH = 32
+
+
+def random_versions(count, seed=42):
+    rnd = random.Random(seed)
+    alphabet = "000112399.....--++aZ\n٢ x"
+    for _ in range(count):
+        yield "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 14)))
+
+
+def parse_or_none(cls, version, optional_minor_and_patch=False):
+    try:
+        return cls.parse(version, optional_minor_and_patch)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["1.2.3", b"1.2.3-rc.1", "1.2.3+build.5", "1.2.3-rc.1+build.5", "1.2.3\n"],
+)
+def test_try_parse_returns_version(version):
+    assert Version.try_parse(version) == Version.parse(version)
+
+
+@pytest.mark.parametrize(
+    "version", ["", "1.2", "1.2.3-", "01.2.3", "1.2.3+a..b", b"\xff"]
+)
+def test_try_parse_returns_none(version):
+    assert Version.try_parse(version) is None
+    assert Version.is_valid(version) is False
+
+
+@pytest.mark.parametrize("version", [None, 1, 1.2])
+def test_try_parse_raises_type_error(version):
+    with pytest.raises(TypeError):
+        Version.try_parse(version)
+    with pytest.raises(TypeError):
+        Version.is_valid(version)
+
+
+@pytest.mark.parametrize("optional_minor_and_patch", [False, True])
+def test_try_parse_matches_parse(optional_minor_and_patch):
+    for version in random_versions(5000):
+        expected = parse_or_none(Version, version, optional_minor_and_patch)
+        assert Version.try_parse(version, optional_minor_and_patch) == expected
+        if not optional_minor_and_patch:
+            assert Version.is_valid(version) is (expected is not None)
+
+
+def test_try_parse_matches_parse_for_long_numbers():
+    # int() may reject numbers with too many digits (Python >= 3.11)
+    version = "1" * 5000 + ".0.0"
+    expected = parse_or_none(Version, version)
+    assert Version.try_parse(version) == expected
+    assert Version.is_valid(version) is (expected is not None)
+
+
+def test_try_parse_checks_limits():
+    assert LimitedVersion.try_parse("1.2.3-" + "a" * 32) is None
+    assert LimitedVersion.is_valid("1.2.3-" + "a" * 32) is False
+    assert type(LimitedVersion.try_parse("1.2.3")) is LimitedVersion
+
+
+def test_try_parse_respects_overridden_parse():
+    assert SemVerWithVPrefix.try_parse("v1.2") == Version(1, 2)
+    assert SemVerWithVPrefix.try_parse("1.2.3") is None
+    assert SemVerWithVPrefix.is_valid("v1.2.3") is True
+    assert list(SemVerWithVPrefix.validate_many(["v1.2.3"])) == [None]
+
+
+def test_is_valid_respects_overridden_init():
+    class EvenVersion(Version):
+        def __init__(self, major, *args, **kwargs):
+            if int(major) % 2:
+                raise ValueError("major must be even")
+            super().__init__(major, *args, **kwargs)
+
+    assert EvenVersion.is_valid("2.0.0") is True
+    assert EvenVersion.is_valid("1.0.0") is False
+    assert EvenVersion.try_parse("1.0.0") is None
+    assert list(EvenVersion.validate_many(["1.0.0"])) == [
+        ScanError("major must be even", 0)
+    ]
+
+
+def test_validate_many_reports_reasons():
+    result = Version.validate_many(
+        ["1.2.3", "1.2", "1.2.3-rc.01", b"1.2.3", b"\x80", None, "1.x.3"]
+    )
+    assert list(result) == [
+        None,
+        ScanError("missing patch part", 3),
+        ScanError("invalid prerelease identifier", 9),
+        None,
+        ScanError("is not valid UTF-8", 0),
+        ScanError("is not a string", 0),
+        ScanError("invalid minor part", 2),
+    ]
+
+
+def test_validate_many_with_optional_minor_and_patch():
+    result = Version.validate_many(["1", "1.2", "1."], optional_minor_and_patch=True)
+    assert list(result) == [None, None, ScanError("invalid minor part", 2)]
+
+
+def test_validate_many_reports_limits():
+    (error,) = LimitedVersion.validate_many(["1.2.3-" + "a" * 32])
+    assert error == ScanError("is longer than 32 characters", 32)
+
+
+def test_validate_many_is_lazy():
+    def versions():
+        yield "1.0.0"
+        raise AssertionError("consumed too early")
+
+    assert next(Version.validate_many(versions())) is None
@@ -0,0 +1,147 @@
+import random
+import struct
+import sys
+
+import pytest
+
+from semver import Version, VersionArray
+
+VERSIONS = [
+    "1.0.0",
+    "1.2.0",
+    "1.2.3-rc.1",
+    "1.2.3-rc.10",
+    "1.2.3-rc.2",
+    "1.2.3",
+    "1.10.0",
+    "2.0.0-rc.1",
+    "2.0.0",
+    "2.0.0+build.1",
+    "2.1.0-beta+build.1",
+    "18446744073709551615.0.0",
+]
+
+
+@pytest.fixture
+def versions():
+    shuffled = list(VERSIONS)
+    random.Random(1).shuffle(shuffled)
+    return VersionArray(shuffled)
+
+
+def test_versionarray_items(versions):
+    assert len(versions) == len(VERSIONS)
+    assert sorted(str(v) for v in versions) == sorted(VERSIONS)
+    assert versions[-1] == Version.parse(str(versions[len(versions) - 1]))
+    with pytest.raises(IndexError):
+        versions[len(versions)]
+
+
+def test_versionarray_accepts_version_objects():
+    versions = VersionArray([Version(1, 2, 3, "rc.1", "b")])
+    versions.append("1.2.3")
+    assert versions[0].to_tuple() == (1, 2, 3, "rc.1", "b")
+    assert versions[1].to_tuple() == (1, 2, 3, None, None)
+
+
+def test_versionarray_shares_strings():
+    versions = VersionArray(["1.0.0-rc.1", "2.0.0-rc.1", "3.0.0+rc.1"])
+    assert versions._strings == [None, "rc.1"]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_versionarray_sort(versions, reverse):
+    expected = sorted(
+        (Version.parse(v) for v in VERSIONS),
+        key=lambda v: v.precedence_key,
+        reverse=reverse,
+    )
+    order = versions.argsort(reverse=reverse)
+    assert [versions[i].to_tuple() for i in order] == [v.to_tuple() for v in expected]
+    assert versions.precedence_keys() == [v.precedence_key for v in versions]
+    versions.sort(reverse=reverse)
+    assert [v.to_tuple() for v in versions] == [v.to_tuple() for v in expected]
+
+
+def test_versionarray_slice(versions):
+    versions.sort()
+    assert [str(v) for v in versions[1:3]] == ["1.2.0", "1.2.3-rc.1"]
+    assert isinstance(versions[::2], VersionArray)
+
+
+def test_versionarray_filter(versions):
+    versions.sort()
+    assert [str(v) for v in versions.filter(">=1.2.3-rc.2 <2.0.0")] == [
+        "1.2.3-rc.2",
+        "1.2.3-rc.10",
+        "1.2.3",
+        "1.10.0",
+        "2.0.0-rc.1",
+    ]
+
+
+def test_versionarray_bytes_roundtrip(versions):
+    data = versions.tobytes()
+    restored = VersionArray.frombytes(data)
+    assert [v.to_tuple() for v in restored] == [v.to_tuple() for v in versions]
+    assert VersionArray.frombytes(VersionArray().tobytes()).tobytes() == (
+        VersionArray().tobytes()
+    )
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"XXXX" + bytes(16), VersionArray(["1.0.0"]).tobytes()[:-1]]
+)
+def test_versionarray_frombytes_invalid(data):
+    with pytest.raises(ValueError):
+        VersionArray.frombytes(data)
+
+
+def corrupt_data(strings, prerelease):
+    """Return the data of one version with the given string table."""
+    header = struct.pack("<4sQQ", b"SVA1", 1, len(strings))
+    table = b"".join(struct.pack("<I", len(s)) + s for s in strings)
+    return header + table + struct.pack("<QQQII", 1, 0, 0, prerelease, 0)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # The string index is out of range
+        corrupt_data([b"rc"], 2),
+        # The length of the string is out of range
+        struct.pack("<4sQQI", b"SVA1", 0, 1, 1000) + b"rc",
+        # The same string twice
+        corrupt_data([b"rc", b"rc"], 1),
+    ],
+)
+def test_versionarray_frombytes_corrupt(data):
+    with pytest.raises(ValueError, match="truncated or corrupt data"):
+        VersionArray.frombytes(data)
+
+
+def test_versionarray_version_class():
+    class MyVersion(Version):
+        pass
+
+    versions = VersionArray(["1.2.3"], version_class=MyVersion)
+    assert type(versions[0]) is MyVersion
+    restored = VersionArray.frombytes(versions.tobytes(), version_class=MyVersion)
+    assert type(restored[0]) is MyVersion
+
+
+def test_versionarray_overflow():
+    with pytest.raises(OverflowError):
+        VersionArray([Version(sys.maxsize * 4)])
+
+
+@pytest.mark.parametrize(
+    "version", [Version(2**64), Version(1, 2**64, 0), Version(1, 2, 2**64, "rc")]
+)
+def test_versionarray_overflow_leaves_array_unchanged(version):
+    versions = VersionArray(["1.0.0"])
+    with pytest.raises(OverflowError):
+        versions.append(version)
+    assert len(versions) == 1
+    assert [str(v) for v in versions] == ["1.0.0"]
+    assert VersionArray.frombytes(versions.tobytes())[0] == Version(1)
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from semver import Range, Version, VersionIndex
+
+VERSIONS = [
+    "1.0.0",
+    "1.2.0",
+    "1.2.3-rc.1",
+    "1.2.3",
+    "1.10.0",
+    "2.0.0-rc.1",
+    "2.0.0",
+    "2.0.0+build.1",
+    "2.1.0-beta",
+]
+
+
+@pytest.fixture
+def index():
+    shuffled = list(VERSIONS)
+    random.Random(1).shuffle(shuffled)
+    return VersionIndex(shuffled)
+
+
+def test_versionindex_is_sorted(index):
+    assert len(index) == len(VERSIONS)
+    assert [str(v) for v in index] == sorted(VERSIONS, key=Version.parse)
+    assert list(reversed(index)) == list(index)[::-1]
+
+
+def test_versionindex_from_versions_and_bytes():
+    index = VersionIndex([Version(2), b"1.0.0"])
+    assert index[0] == Version(1)
+    assert index[-1] == Version(2)
+    assert index[:] == [Version(1), Version(2)]
+
+
+def test_versionindex_with_version_class():
+    class MyVersion(Version):
+        pass
+
+    index = VersionIndex(["1.0.0"], version_class=MyVersion)
+    index.add("2.0.0")
+    assert all(type(v) is MyVersion for v in index)
+
+
+@pytest.mark.parametrize(
+    "expression,expected_max,expected_min",
+    [
+        ("^1.2", "1.10.0", "1.2.0"),
+        ("~1.2", "1.2.3", "1.2.0"),
+        ("<2", "1.10.0", "1.0.0"),
+        ("<2.0.0", "2.0.0-rc.1", "1.0.0"),
+        (">=2.0.0", "2.1.0-beta", "2.0.0"),
+        ("1.2.3 || 1.0.0", "1.2.3", "1.0.0"),
+        ("^3", None, None),
+    ],
+)
+def test_versionindex_satisfying(index, expression, expected_max, expected_min):
+    expected = [v for v in index if v in Range(expression)]
+    assert index.satisfying(expression) == expected
+    assert index.satisfying(Range(expression)) == expected
+    result_max = index.max_satisfying(expression)
+    result_min = index.min_satisfying(expression)
+    assert (result_max and str(result_max)) == expected_max
+    assert (result_min and str(result_min)) == expected_min
+
+
+def test_versionindex_max_satisfying_returns_last_added_for_ties():
+    index = VersionIndex(["2.0.0+a", "2.0.0+b"])
+    assert index.max_satisfying("2.0.0").build == "b"
+    assert index.min_satisfying("2.0.0").build == "a"
+
+
+def test_versionindex_latest(index):
+    assert str(index.latest()) == "2.0.0+build.1"
+    assert str(index.latest(prerelease=True)) == "2.1.0-beta"
+    assert VersionIndex().latest() is None
+    assert VersionIndex(["1.0.0-rc.1"]).latest() is None
+
+
+def test_versionindex_add_and_remove(index):
+    added = index.add("1.5.0")
+    assert isinstance(added, Version)
+    assert index.max_satisfying("~1.5") is added
+    index.remove("2.0.0+build.1")
+    assert [v.build for v in index.satisfying("2.0.0")] == [None]
+    index.remove(Version(2))
+    assert "2.0.0" not in index
+    with pytest.raises(ValueError, match="is not in the index"):
+        index.remove("2.0.0")
+
+
+def test_versionindex_contains(index):
+    assert "1.2.3" in index
+    assert Version(1, 2, 3, build="other") in index
+    assert "1.2.4" not in index
+    assert None not in index
+
+
+def test_versionindex_repr():
+    assert repr(VersionIndex(["2.0.0", "1.0.0"])) == "VersionIndex(['1.0.0', '2.0.0'])"